@@ -0,0 +1,91 @@
+"""
+응답 JSON 디코딩 벤치마크 (str 변환 후 json.loads vs 바이트 직접 파싱 vs orjson vs keywordList 스트리밍)
+
+기본값은 픽스처로 만든 쇼핑 검색 100개 페이지와 키워드 도구 1,000행 응답이고,
+--payload로 실제 응답 본문을 저장한 파일을 넘기면 그 파일로 측정합니다.
+
+사용 예)
+    python -m benchmarks.bench_json_decode --repeat 200
+    python -m benchmarks.bench_json_decode --payload shop.json --payload keywordstool.json
+"""
+import argparse
+import json
+import os
+import time
+
+from benchmarks.bench_powerlink_scoring import make_keywordstool_result
+from utils import json_codec
+from utils.fixtures import shopping_response
+
+
+def default_payloads():
+    """{이름: 응답 바이트} - 쇼핑 검색 100개 페이지 / 키워드 도구 1,000행"""
+    shopping = shopping_response({'query': '무선 키보드', 'display': 100, 'start': 1, 'sort': 'sim'}, 7)
+    keywordstool = make_keywordstool_result('무선 키보드', 1000)
+    return {
+        'shopping_100': json.dumps(shopping, ensure_ascii=False).encode('utf-8'),
+        'keywordstool_1000': json.dumps(keywordstool, ensure_ascii=False).encode('utf-8'),
+    }
+
+
+def _decoders():
+    decoders = {
+        'json.loads(str)': lambda body: json.loads(body.decode('utf-8')),
+        'json.loads(bytes)': json.loads,
+    }
+    if json_codec.orjson is not None:
+        decoders['orjson.loads(bytes)'] = json_codec.orjson.loads
+    return decoders
+
+
+def _chunks(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+def _measure(func, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def _first_row_ms(chunks, repeat):
+    def first_row():
+        rows = json_codec.iter_keyword_list(chunks)
+        next(rows, None)
+        rows.close()
+    return _measure(first_row, repeat)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="응답 JSON 디코딩 시간 비교")
+    parser.add_argument('--payload', action='append', default=[], help="저장한 응답 본문 파일 (여러 번 지정 가능)")
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--chunk-size', type=int, default=65536)
+    args = parser.parse_args(argv)
+
+    if args.payload:
+        payloads = {}
+        for path in args.payload:
+            with open(path, 'rb') as f:
+                payloads[os.path.basename(path)] = f.read()
+    else:
+        payloads = default_payloads()
+
+    for name, body in payloads.items():
+        print(f"{name} ({len(body) / 1024:,.0f} KB)")
+        baseline = None
+        for label, decode in _decoders().items():
+            elapsed = _measure(lambda: decode(body), args.repeat)
+            baseline = baseline or elapsed
+            print(f"  {label:<24}: {elapsed:7.3f} ms ({baseline / elapsed:.1f}배)")
+
+        if b'"keywordList"' in body:
+            chunks = _chunks(body, args.chunk_size)
+            elapsed = _measure(lambda: sum(1 for _ in json_codec.iter_keyword_list(chunks)), args.repeat)
+            print(f"  {'iter_keyword_list':<24}: {elapsed:7.3f} ms ({baseline / elapsed:.1f}배), "
+                  f"첫 행까지 {_first_row_ms(chunks, args.repeat):.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
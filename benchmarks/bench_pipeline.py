@@ -0,0 +1,184 @@
+"""
+네이버 API 파이프라인 종단 벤치마크 (로컬 목 서버)
+
+순위 검사 / 연관 키워드 추출 / 파워링크 파싱 / 월간 트렌드를 동시 실행 수별로 돌려
+처리량과 p50/p95/p99 지연시간, 오류/재시도 수를 JSON으로 출력합니다.
+릴리스 간 결과 파일을 비교해 성능 회귀를 확인하세요.
+
+사용 예)
+    python -m benchmarks.bench_pipeline --latency-ms 50 --throttle-rate 0.02 --concurrency 1 4 16 -o bench.json
+"""
+import argparse
+import contextlib
+import json
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+
+from config import CACHE_CONFIG, RATE_LIMIT_CONFIG
+from utils import http_client
+from utils.cache import clear_cache
+from utils.datalab import get_datalab_trends_batch
+from utils.naver_api import get_related_keywords_advanced, get_powerlink_related_keywords
+from utils.rank_search import search_product_rank
+from benchmarks.mock_server import MockNaverServer
+
+NAVER_BASE_URLS = ('https://openapi.naver.com', 'https://api.naver.com')
+
+
+def _rank(index):
+    return search_product_rank(f"벤치키워드{index}", '테스트몰', max_pages=3)
+
+
+def _related(index):
+    return get_related_keywords_advanced(f"벤치키워드{index}")
+
+
+def _powerlink(index):
+    return get_powerlink_related_keywords(f"벤치키워드{index}")
+
+
+def _trends(index):
+    keywords = [f"벤치키워드{index}-{i}" for i in range(8)]
+    df = get_datalab_trends_batch(keywords, '2023-01-01', '2024-12-31')
+    if df.empty:
+        raise RuntimeError("DataLab 조회 실패")
+    return df
+
+
+SCENARIOS = {
+    'rank': _rank,
+    'related_keywords': _related,
+    'powerlink': _powerlink,
+    'monthly_trends': _trends
+}
+
+
+def _timed(func, index):
+    started = time.perf_counter()
+    try:
+        func(index)
+        failed = False
+    except Exception:
+        failed = True
+    return time.perf_counter() - started, failed
+
+
+def run_scenario(name, concurrency, operations, offset=0):
+    """시나리오 하나를 동시 실행 수 concurrency로 operations번 실행한 결과"""
+    func = SCENARIOS[name]
+    clear_cache()
+    http_client.reset_pool_stats()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"bench-{name}") as executor:
+        results = list(executor.map(lambda i: _timed(func, offset + i), range(operations)))
+    elapsed = time.perf_counter() - started
+
+    latencies = np.array([latency for latency, _ in results]) * 1000
+    pool_stats = http_client.get_pool_stats()
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        'scenario': name,
+        'concurrency': concurrency,
+        'operations': operations,
+        'errors': sum(failed for _, failed in results),
+        'elapsed_sec': round(elapsed, 3),
+        'throughput_ops': round(operations / elapsed, 2),
+        'latency_ms': {
+            'p50': round(float(p50), 1),
+            'p95': round(float(p95), 1),
+            'p99': round(float(p99), 1),
+            'max': round(float(latencies.max()), 1)
+        },
+        'http_requests': sum(stats['requests'] for stats in pool_stats.values()),
+        'http_retries': sum(stats['retries'] for stats in pool_stats.values())
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 API 파이프라인 벤치마크 (로컬 목 서버)")
+    parser.add_argument('--scenarios', nargs='+', choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 4, 16])
+    parser.add_argument('--operations', type=int, default=32, help="시나리오/동시 실행 수마다 실행할 작업 수")
+    parser.add_argument('--latency-ms', type=float, default=30)
+    parser.add_argument('--jitter-ms', type=float, default=10)
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="429로 응답할 요청 비율 (0~1)")
+    parser.add_argument('--retry-after', type=float, default=None)
+    parser.add_argument('--rate', type=float, default=1000.0,
+                        help="벤치마크 동안 API 계열별 초당 요청 수 한도 (실제 한도를 재려면 0)")
+    parser.add_argument('--cache', action='store_true',
+                        help="응답 캐시와 동일 요청 합치기(single-flight) 사용 (기본: 둘 다 끄고 측정)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('-o', '--output', help="결과 JSON 파일 (기본: 표준 출력)")
+    args = parser.parse_args(argv)
+
+    if args.rate:
+        for settings in RATE_LIMIT_CONFIG.values():
+            settings['rate'] = args.rate
+            settings['burst'] = max(int(args.rate), 1)
+    CACHE_CONFIG['enabled'] = args.cache
+    CACHE_CONFIG['single_flight'] = args.cache
+
+    server = MockNaverServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed
+    ).start()
+    for base_url in NAVER_BASE_URLS:
+        http_client.override_base_url(base_url, server.base_url)
+
+    results = []
+    try:
+        # 진행 상황과 API 함수의 로그는 표준 에러로 (표준 출력에는 JSON 결과만)
+        with contextlib.redirect_stdout(sys.stderr):
+            offset = 0
+            for name in args.scenarios:
+                for concurrency in args.concurrency:
+                    result = run_scenario(name, concurrency, args.operations, offset)
+                    offset += args.operations
+                    results.append(result)
+                    print(
+                        f"{name:<17} c={concurrency:<3} {result['throughput_ops']:>8.2f} ops/s  "
+                        f"p50 {result['latency_ms']['p50']:>7.1f}ms  p95 {result['latency_ms']['p95']:>7.1f}ms  "
+                        f"p99 {result['latency_ms']['p99']:>7.1f}ms  오류 {result['errors']}  재시도 {result['http_retries']}"
+                    )
+    finally:
+        for base_url in NAVER_BASE_URLS:
+            http_client.override_base_url(base_url)
+        server.stop()
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'settings': {
+            'latency_ms': args.latency_ms,
+            'jitter_ms': args.jitter_ms,
+            'throttle_rate': args.throttle_rate,
+            'retry_after': args.retry_after,
+            'rate': args.rate,
+            'cache': args.cache,
+            'single_flight': args.cache,
+            'operations': args.operations,
+            'seed': args.seed
+        },
+        'server': {'requests': server.requests, 'throttled': server.throttled},
+        'results': results
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"결과 저장: {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
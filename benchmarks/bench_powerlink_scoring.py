@@ -0,0 +1,150 @@
+"""
+파워링크 연관키워드 점수/정렬 벤치마크 (행별 점수 + 전체 정렬 vs RelevanceScorer + 상위 k 선택)
+
+사용 예)
+    python -m benchmarks.bench_powerlink_scoring --rows 10000 --repeat 5
+"""
+import argparse
+import random
+import time
+
+from utils.naver_api import parse_powerlink_keywords
+from utils.relevance import RelevanceScorer
+
+PREFIXES = ['게이밍', '무선', '블루투스', '저소음', '사무용', '로지텍', '기계식', '미니', '추천', '가성비']
+SUFFIXES = ['추천', '가격', '리뷰', '세트', '순위', '할인', '비교', '배터리', '연결', '드라이버']
+
+
+def make_keywordstool_result(base_keyword, rows, seed=7):
+    """재현 가능한 가짜 keywordstool 응답"""
+    rng = random.Random(seed)
+    keyword_list = []
+    for i in range(rows):
+        words = [rng.choice(PREFIXES), base_keyword, rng.choice(SUFFIXES)]
+        if rng.random() < 0.3:
+            words.append(f"{rng.choice(SUFFIXES)}{i}")
+        keyword_list.append({
+            'relKeyword': ' '.join(words) if rng.random() < 0.5 else ''.join(words),
+            'monthlyPcQcCnt': rng.randint(0, 80000),
+            'monthlyMobileQcCnt': rng.randint(0, 200000),
+            'monthlyAvePcCtr': round(rng.uniform(0, 5), 2),
+            'monthlyAveMobileCtr': round(rng.uniform(0, 5), 2),
+            'compIdx': rng.choice(['HIGH', 'MEDIUM', 'LOW', rng.randint(0, 100)]),
+            'plAvgDepth': rng.choice([0, rng.randint(50, 3000)])
+        })
+    return {'keywordList': keyword_list}
+
+
+def legacy_relevance(keyword, base_keyword, search_volume, competition):
+    """기존 calculate_relevance_score_advanced (호출마다 기준 키워드 전처리)"""
+    base_words = set(base_keyword.lower().split())
+    keyword_words = set(keyword.lower().split())
+    common_words = base_words.intersection(keyword_words)
+    word_match_score = len(common_words) / len(base_words) * 40 if base_words else 0
+    inclusion_score = 0
+    if base_keyword.lower() in keyword.lower():
+        inclusion_score = 30
+    elif any(word in keyword.lower() for word in base_words):
+        inclusion_score = 15
+    volume_score = min(search_volume / 50000 * 20, 20) if search_volume > 0 else 0
+    comp_score = {'HIGH': 10, 'MEDIUM': 7, 'LOW': 4}.get(competition, 4)
+    total_score = word_match_score + inclusion_score + volume_score + comp_score
+    if len(keyword) > len(base_keyword) * 2:
+        total_score *= 0.8
+    return min(round(total_score, 1), 100)
+
+
+def legacy_parse(api_result, base_keyword):
+    """기존 parse_powerlink_keywords (행별 점수 계산 + 전체 정렬)"""
+    keywords_data = []
+    for item in api_result['keywordList']:
+        rel_keyword = item.get('relKeyword', '').strip()
+        if not rel_keyword or rel_keyword.lower() == base_keyword.lower():
+            continue
+        pc_searches = int(item.get('monthlyPcQcCnt', 0))
+        mobile_searches = int(item.get('monthlyMobileQcCnt', 0))
+        total_searches = pc_searches + mobile_searches
+        if total_searches == 0:
+            continue
+        comp_idx = item.get('compIdx', 'LOW')
+        if isinstance(comp_idx, (int, float)):
+            competition = 'HIGH' if comp_idx >= 80 else 'MEDIUM' if comp_idx >= 50 else 'LOW'
+        else:
+            competition = str(comp_idx).upper()
+        avg_bid = int(item.get('plAvgDepth', 0))
+        if avg_bid == 0:
+            if competition == 'HIGH':
+                avg_bid = pc_searches // 50 + 500
+            elif competition == 'MEDIUM':
+                avg_bid = pc_searches // 100 + 200
+            else:
+                avg_bid = pc_searches // 200 + 100
+        pc_ctr = float(item.get('monthlyAvePcCtr', 0))
+        mobile_ctr = float(item.get('monthlyAveMobileCtr', 0))
+        avg_ctr = (pc_ctr + mobile_ctr) / 2 if (pc_ctr > 0 or mobile_ctr > 0) else 2.5
+        keywords_data.append({
+            'keyword': rel_keyword,
+            'monthly_searches': total_searches,
+            'pc_searches': pc_searches,
+            'mobile_searches': mobile_searches,
+            'competition': competition,
+            'avg_bid': max(avg_bid, 50),
+            'click_rate': round(avg_ctr, 2),
+            'relevance_score': legacy_relevance(rel_keyword, base_keyword, total_searches, competition)
+        })
+    keywords_data.sort(key=lambda x: (x['relevance_score'] * 0.7 + (x['monthly_searches'] / 10000) * 0.3), reverse=True)
+    return keywords_data[:50]
+
+
+def _rows_per_second(func, api_result, base_keyword, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(api_result, base_keyword)
+    elapsed = time.perf_counter() - started
+    return len(api_result['keywordList']) * repeat / elapsed, result
+
+
+def _score_rows_per_second(api_result, base_keyword, repeat):
+    """점수 계산만 비교 (행별 legacy_relevance vs RelevanceScorer.score_many)"""
+    rows = [item for item in api_result['keywordList'] if item['relKeyword']]
+    keywords = [item['relKeyword'] for item in rows]
+    volumes = [item['monthlyPcQcCnt'] + item['monthlyMobileQcCnt'] for item in rows]
+    competitions = [str(item['compIdx']).upper() for item in rows]
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        legacy = [legacy_relevance(k, base_keyword, v, c) for k, v, c in zip(keywords, volumes, competitions)]
+    before = len(rows) * repeat / (time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        scores = RelevanceScorer(base_keyword).score_many(keywords, volumes, competitions)
+    after = len(rows) * repeat / (time.perf_counter() - started)
+    return before, after, scores == legacy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="파워링크 키워드 파싱/점수 처리량 비교")
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--keyword', default='무선 키보드')
+    args = parser.parse_args(argv)
+
+    api_result = make_keywordstool_result(args.keyword, args.rows)
+    before, legacy_result = _rows_per_second(legacy_parse, api_result, args.keyword, args.repeat)
+    after, result = _rows_per_second(parse_powerlink_keywords, api_result, args.keyword, args.repeat)
+
+    print(f"keywordstool 행 {args.rows}개 x {args.repeat}회")
+    print(f"  기존 (행별 점수 + 전체 정렬)  : {before:,.0f} rows/sec")
+    print(f"  RelevanceScorer + 상위 k 선택 : {after:,.0f} rows/sec ({after / before:.1f}배)")
+    print(f"  결과 일치                      : {result == legacy_result}")
+
+    before, after, same = _score_rows_per_second(api_result, args.keyword, args.repeat)
+    print("점수 계산만")
+    print(f"  행별 legacy_relevance         : {before:,.0f} rows/sec")
+    print(f"  RelevanceScorer.score_many    : {after:,.0f} rows/sec ({after / before:.1f}배)")
+    print(f"  결과 일치                      : {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+연관 키워드 추출 벤치마크 (기존 루프 구현 vs extract_title_keywords)
+
+사용 예)
+    python -m benchmarks.bench_related_keywords --titles 1000 --repeat 20
+"""
+import argparse
+import random
+import time
+
+from utils.naver_api import extract_title_keywords
+
+WORDS = [
+    '무선', '키보드', '게이밍', '기계식', '블루투스', '저소음', '텐키리스', '로지텍', '사무용',
+    'RGB', '마우스', '세트', '정품', '무료배송', '당일발송', '화이트', '블랙', '한글', '각인',
+    '충전식', 'USB', 'C타입', '멀티페어링', '슬림', '미니', '풀배열', '적축', '갈축', '청축',
+    '상품', '추천', '인기', '베스트', '할인', '특가', '2024', '신형', '국내', '해외직구'
+]
+
+
+def make_titles(count, seed=42):
+    """재현 가능한 가짜 상품명 생성"""
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(count):
+        words = rng.sample(WORDS, rng.randint(5, 12))
+        if rng.random() < 0.3:
+            words[0] = f"[{words[0]}]"
+        if rng.random() < 0.3:
+            words[-1] = f"({words[-1]})"
+        if rng.random() < 0.5:
+            index = rng.randrange(len(words))
+            words[index] = f"<b>{words[index]}</b>"
+        titles.append(' '.join(words))
+    return titles
+
+
+def legacy_extract(titles, keyword):
+    """기존 get_related_keywords_advanced의 단어별 루프 구현"""
+    keyword_freq = {}
+    for title in titles:
+        title = title.replace('<b>', '').replace('</b>', '')
+        title = title.replace('[', '').replace(']', '')
+        title = title.replace('(', '').replace(')', '')
+        for word in title.split():
+            if (len(word) >= 2 and
+                keyword.lower() not in word.lower() and
+                word.lower() not in keyword.lower() and
+                not word.isdigit() and
+                word.lower() not in [
+                    '상품', '제품', '용품', '아이템', '개', '원', '배송', '무료',
+                    '빠른', '당일', '택배', '특가', '할인', '세트', '키트',
+                    '브랜드', '정품', '공식', '국내', '해외', '신상', '최신',
+                    '인기', '베스트', '추천', '리뷰', '후기', '평점', '별점',
+                    '그램', '사이즈', '컬러', '색상', '옵션', '선택'
+                ]):
+                clean_word = ''.join(c for c in word if c.isalnum())
+                if len(clean_word) >= 2:
+                    keyword_freq[clean_word] = keyword_freq.get(clean_word, 0) + 1
+
+    filtered_keywords = {k: v for k, v in keyword_freq.items() if v >= 2}
+    sorted_keywords = sorted(filtered_keywords.items(), key=lambda x: x[1], reverse=True)
+    return [kw for kw, freq in sorted_keywords[:30]]
+
+
+def _titles_per_second(func, titles, keyword, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(titles, keyword)
+    elapsed = time.perf_counter() - started
+    return len(titles) * repeat / elapsed, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="연관 키워드 추출 처리량 비교")
+    parser.add_argument('--titles', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--keyword', default='키보드')
+    args = parser.parse_args(argv)
+
+    titles = make_titles(args.titles)
+    before, legacy_result = _titles_per_second(legacy_extract, titles, args.keyword, args.repeat)
+    after, result = _titles_per_second(extract_title_keywords, titles, args.keyword, args.repeat)
+
+    print(f"제목 {len(titles)}개 x {args.repeat}회")
+    print(f"  기존 루프      : {before:,.0f} titles/sec")
+    print(f"  배치 토크나이저: {after:,.0f} titles/sec ({after / before:.1f}배)")
+    print(f"  결과 일치      : {result == legacy_result}")
+
+
+if __name__ == '__main__':
+    main()
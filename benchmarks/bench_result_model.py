@@ -0,0 +1,81 @@
+"""
+쇼핑 검색 결과 모델 벤치마크 (dict 목록 → DataFrame vs ShoppingItemBatch → DataFrame)
+
+픽스처 응답으로 키워드 수 x 상품 1,000개를 만들어 변환 시간과 DataFrame 메모리를 비교합니다.
+
+사용 예)
+    python -m benchmarks.bench_result_model --keywords 30 --items 1000 --repeat 3
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from utils.fixtures import shopping_response
+from utils.naver_api import _clean_shopping_result
+from utils.records import ShoppingItemBatch
+
+
+def make_pages(keywords, items, seed=7):
+    """키워드별 [(start, 정제된 items), ...] (100개씩 페이지)"""
+    pages = {}
+    for index in range(keywords):
+        keyword = f"벤치키워드{index}"
+        pages[keyword] = [
+            (start, _clean_shopping_result(shopping_response(
+                {'query': keyword, 'display': 100, 'start': start, 'sort': 'sim'}, seed
+            ))['items'])
+            for start in range(1, items + 1, 100)
+        ]
+    return pages
+
+
+def dict_frame(pages):
+    """기존 방식: 상품 dict에 keyword/rank를 붙여 목록으로 모은 뒤 DataFrame 생성"""
+    rows = []
+    for keyword, keyword_pages in pages.items():
+        for start, items in keyword_pages:
+            for index, item in enumerate(items):
+                row = dict(item)
+                row['keyword'] = keyword
+                row['rank'] = start + index
+                rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def batch_frame(pages):
+    """열 단위 배치를 키워드별로 만들어 합친 뒤 DataFrame 생성"""
+    return ShoppingItemBatch.concat([
+        ShoppingItemBatch.from_pages(keyword, keyword_pages)
+        for keyword, keyword_pages in pages.items()
+    ]).to_dataframe()
+
+
+def _measure(func, pages, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        df = func(pages)
+    return (time.perf_counter() - started) / repeat, df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="쇼핑 검색 결과 DataFrame 변환 시간/메모리 비교")
+    parser.add_argument('--keywords', type=int, default=30)
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    pages = make_pages(args.keywords, args.items)
+    before, dict_df = _measure(dict_frame, pages, args.repeat)
+    after, batch_df = _measure(batch_frame, pages, args.repeat)
+    dict_memory = dict_df.memory_usage(deep=True).sum() / 1024 / 1024
+    batch_memory = batch_df.memory_usage(deep=True).sum() / 1024 / 1024
+
+    print(f"키워드 {args.keywords}개 x 상품 {args.items}개 ({len(batch_df):,}행)")
+    print(f"  dict 목록 → DataFrame     : {before * 1000:,.0f} ms, {dict_memory:,.1f} MB")
+    print(f"  ShoppingItemBatch → DataFrame: {after * 1000:,.0f} ms, {batch_memory:,.1f} MB "
+          f"({before / after:.1f}배 빠름, 메모리 {batch_memory / dict_memory:.0%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+로컬 네이버 API 목 서버 (쇼핑 검색 / DataLab / 키워드 도구)
+
+응답 본문은 픽스처 모드(utils/fixtures.py)와 같은 시드 기반 데이터이고,
+지연시간과 429 응답 비율을 지정할 수 있습니다. 벤치마크는 http_client.override_base_url로
+openapi.naver.com / api.naver.com 요청을 이 서버로 보냅니다.
+
+사용 예)
+    python -m benchmarks.mock_server --port 8080 --latency-ms 50 --throttle-rate 0.05
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from utils.fixtures import fixture_response
+
+
+class MockNaverServer(ThreadingHTTPServer):
+    """지연/429를 주입하는 목 서버 (요청 수, 429 수 집계)"""
+
+    daemon_threads = True
+
+    def __init__(self, host='127.0.0.1', port=0, latency_ms=0, jitter_ms=0, throttle_rate=0.0,
+                 retry_after=None, seed=42):
+        super().__init__((host, port), _Handler)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.seed = seed
+        self.requests = 0
+        self.throttled = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_decision(self):
+        """(지연 초, 429 여부) - 시드 고정이라 요청 순서가 같으면 같은 결과"""
+        with self._lock:
+            self.requests += 1
+            jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+            throttle = self._rng.random() < self.throttle_rate
+            if throttle:
+                self.throttled += 1
+        return max(self.latency_ms + jitter, 0) / 1000, throttle
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-naver-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive 연결 재사용
+    # 헤더와 본문을 따로 쓰므로 Nagle + 지연 ACK로 재사용 연결마다 ~40ms가 더해지지 않도록 TCP_NODELAY
+    disable_nagle_algorithm = True
+
+    def _respond(self, status_code, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status_code)
+        self.send_header('Content-Type', 'application/json;charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self, method):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+
+        delay, throttle = self.server.next_decision()
+        if delay:
+            time.sleep(delay)
+        if throttle:
+            headers = {'Retry-After': str(self.server.retry_after)} if self.server.retry_after is not None else None
+            self._respond(429, {'errorMessage': 'Rate limit exceeded.', 'errorCode': '012'}, headers)
+            return
+
+        status_code, payload = fixture_response(method, self.path, body, self.server.seed)
+        self._respond(status_code, payload)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 API 로컬 목 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="429로 응답할 요청 비율 (0~1)")
+    parser.add_argument('--retry-after', type=float, default=None, help="429 응답의 Retry-After (초)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    server = MockNaverServer(
+        args.host, args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+    print(f"목 서버 시작: {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
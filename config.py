@@ -1 +1,141 @@
+# HTTP 연결 풀 설정 (utils/http_client.py)
+HTTP_CONFIG = {
+    'timeout': 10,            # 기본 요청 타임아웃 (초)
+    'max_retries': 3,         # 429/5xx/연결 오류 시 재시도 횟수
+    'backoff_factor': 0.5,    # 지수 백오프 기본 간격 (초)
+    'backoff_max': 8.0,       # 백오프 최대 간격 (초)
+    'pool_connections': 4,    # 호스트별 연결 풀 개수
+    'pool_maxsize': 32,       # 풀 당 keep-alive 연결 수
+    'base_url_overrides': {},  # {'https://openapi.naver.com': 'http://127.0.0.1:8080'} 형태의 요청 주소 치환
+    'json_decoder': 'auto',    # 응답 JSON 디코더 ('auto': orjson이 있으면 orjson, 'orjson', 'json')
+    'stream_chunk_size': 65536 # 스트리밍 응답을 읽는 조각 크기 (바이트)
+}
 
+# 순위 검색 설정 (utils/rank_search.py)
+SEARCH_CONFIG = {
+    'max_search_pages': 10,   # 키워드당 최대 조회 페이지
+    'items_per_page': 100,    # 페이지당 상품 수 (API 최대 100)
+    'max_keywords': 10,       # 한 번에 검사할 최대 키워드 수
+    'max_workers': 8          # 동시에 조회할 최대 페이지 수
+}
+
+# API 계열별 요청 속도 제한 (utils/rate_limiter.py)
+# rate: 초당 요청 수, burst: 순간 허용량, min_rate: 429 감속 하한
+RATE_LIMIT_CONFIG = {
+    'search': {'rate': 10.0, 'burst': 10, 'min_rate': 1.0},
+    'datalab': {'rate': 5.0, 'burst': 5, 'min_rate': 0.5},
+    'keywordstool': {'rate': 5.0, 'burst': 5, 'min_rate': 0.5}
+}
+
+# 429 응답 시 감속 비율 / 성공 응답마다 회복하는 초당 요청 수
+RATE_LIMIT_DECREASE_FACTOR = 0.5
+RATE_LIMIT_RECOVERY_STEP = 0.1
+
+# API 응답 캐시 설정 (utils/cache.py)
+CACHE_CONFIG = {
+    'enabled': True,
+    'single_flight': True,    # 동시에 들어온 같은 조회는 한 번만 요청하고 결과 공유 (utils/singleflight.py)
+    # 엔드포인트별 유효 시간 (초): 쇼핑 결과는 짧게, 월간 키워드 통계는 하루
+    'ttl': {
+        'shopping': 300,
+        'keywordstool': 86400,
+        'keyword_rows': 86400,
+        'datalab': 21600
+    },
+    # 엔드포인트별 최대 보관 항목 수 (초과 시 LRU 제거)
+    'max_entries': {
+        'shopping': 500,
+        'keywordstool': 2000,
+        'keyword_rows': 20000,
+        'datalab': 200
+    },
+    # SQLite 디스크 캐시 (Streamlit 재시작/여러 워커 프로세스 간 공유)
+    'disk': {
+        'enabled': False,
+        'path': '.cache/naver_api.sqlite3',
+        'endpoints': ('shopping', 'keywordstool', 'datalab'),
+        'compact_interval': 600   # 만료 항목 정리 주기 (초)
+    }
+}
+
+# 비동기 클라이언트 설정 (utils/naver_api_async.py)
+ASYNC_CONFIG = {
+    'max_concurrency': 16     # 동시에 진행할 최대 요청 수
+}
+
+# 배치 순위 추적 설정 (utils/batch_rank.py)
+BATCH_RANK_CONFIG = {
+    'workers': 4,             # 동시에 검사할 (키워드, 판매처) 쌍 수
+    'log_every': 50           # 진행 상황 출력 간격 (쌍)
+}
+
+# 순위 이력 저장소 (utils/rank_history.py)
+RANK_HISTORY_CONFIG = {
+    'path': '.cache/rank_history.sqlite3'
+}
+
+# 연관 키워드 추출 설정 (get_related_keywords_advanced)
+RELATED_KEYWORD_CONFIG = {
+    # (정렬, 페이지당 상품 수, 페이지 수): 모든 페이지를 동시에 조회
+    'sources': [
+        ('sim', 50, 1),
+        ('date', 30, 1),
+        ('asc', 30, 1)
+    ],
+    'min_count': 2,           # 최소 등장 횟수
+    'limit': 30               # 반환할 최대 키워드 수
+}
+
+# 다단계 연관키워드 확장 설정 (utils/keyword_expansion.py)
+KEYWORD_EXPANSION_CONFIG = {
+    'max_depth': 3,           # 확장 단계 수
+    'top_n': 10,              # 노드마다 다시 확장할 상위 연관키워드 수
+    'max_nodes': 1000,        # 그래프 최대 키워드 수
+    'max_requests': 120,      # 확장 1회당 최대 키워드 도구 요청 수
+    'workers': 5              # 동시에 진행할 확장 조회 수
+}
+
+# DataLab 배치 조회 설정 (utils/datalab.py)
+DATALAB_CONFIG = {
+    'workers': 4,             # 동시에 진행할 DataLab 분할 요청 수
+    'series_path': '.cache/datalab_series.sqlite3'   # 시계열 증분 캐시 (utils/datalab_series.py)
+}
+
+# 오프라인 픽스처 모드 (utils/fixtures.py): 네이버 대신 시드로 결정되는 가짜 응답 사용
+FIXTURE_CONFIG = {
+    'enabled': False,
+    'seed': 42,               # 같은 시드면 항상 같은 응답
+    'latency_ms': 0,          # 응답 지연 (밀리초)
+    'jitter_ms': 0            # 지연 변동폭 (±밀리초)
+}
+
+# 요청 계측 설정 (utils/metrics.py)
+METRICS_CONFIG = {
+    'buffer_size': 10000,     # 최근 요청 보관 개수 (링 버퍼)
+    'window': 60,             # 처리량/지연시간 분위수 계산 구간 (초)
+    'port': 9108              # start_metrics_server 기본 포트 (/metrics, /metrics.json)
+}
+
+# Streamlit 캐시 연동 설정 (utils/streamlit_cache.py)
+STREAMLIT_CACHE_CONFIG = {
+    'enabled': True,          # False면 st.cache_data 없이 매번 조회
+    # 페이지별 결과 DataFrame 유효 시간 (초)
+    'ttl': {
+        'shopping_ranking': 300,
+        'related_keywords': 3600,
+        'keyword_analysis': 86400,
+        'monthly_search': 21600
+    },
+    'max_entries': 200,       # 함수별 최대 보관 쿼리 수
+    'session_results': 20     # 세션별 보관할 페이지 결과 수
+}
+
+# 백그라운드 작업 큐 설정 (utils/jobs.py)
+JOB_QUEUE_CONFIG = {
+    'path': '.cache/jobs.sqlite3',
+    'workers': 4,             # 동시에 실행할 작업 수
+    'per_user_limit': 2,      # 사용자별 동시 실행 작업 수
+    'keep_days': 7,           # 끝난 작업 보관 기간 (purge)
+    'heartbeat_interval': 5,  # 실행 중 작업의 생존 신호 갱신 주기 (초)
+    'stale_after': 30         # 생존 신호가 이만큼(초) 끊긴 실행 중 작업은 다시 대기열로
+}
@@ -1 +1,11 @@
+"""
+배치 순위 추적 실행 스크립트 (utils/batch_rank.py)
 
+사용 예)
+    python main_rankCheckerV4.0611.py pairs.csv -o results/2024-06-11.jsonl
+"""
+from utils.batch_rank import main
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""
+관리자 메트릭 페이지 (API 계열별 처리량 / 꼬리 지연시간 / 캐시 / 속도 제한)
+"""
+import json
+import time
+
+import pandas as pd
+import streamlit as st
+
+from utils.cache import get_cache_stats
+from utils.http_client import get_pool_stats
+from utils.metrics import snapshot, recent_events, prometheus_text, reset_metrics
+from utils.rate_limiter import get_rate_limiter_stats
+
+
+def _latency_timeline(events):
+    """초 단위 API 계열별 요청 수와 p95 지연시간"""
+    df = pd.DataFrame(events)
+    df['second'] = pd.to_datetime(df['timestamp'].astype(int), unit='s')
+    grouped = df.groupby(['second', 'family'])['latency_ms']
+    timeline = pd.DataFrame({
+        'requests': grouped.size(),
+        'p95_ms': grouped.quantile(0.95)
+    }).reset_index()
+    return (
+        timeline.pivot(index='second', columns='family', values='requests').fillna(0),
+        timeline.pivot(index='second', columns='family', values='p95_ms')
+    )
+
+
+def show_admin_metrics():
+    """관리자 메트릭 페이지"""
+    st.title("📈 API 메트릭")
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        window = st.select_slider("집계 구간 (초)", options=[30, 60, 300, 900, 3600], value=60)
+    with col2:
+        auto_refresh = st.checkbox("5초마다 새로고침", value=False)
+    with col3:
+        if st.button("메트릭 초기화"):
+            reset_metrics()
+
+    data = snapshot(window)
+
+    st.subheader("API 계열별 최근 요청")
+    if not data['recent']:
+        st.info(f"최근 {window}초 동안 요청이 없습니다.")
+    else:
+        columns = st.columns(len(data['recent']))
+        for column, (family, stats) in zip(columns, sorted(data['recent'].items())):
+            with column:
+                st.metric(family, f"{stats['throughput']:.2f} req/s")
+                st.caption(
+                    f"p50 {stats['latency_ms']['p50']}ms · p95 {stats['latency_ms']['p95']}ms · "
+                    f"p99 {stats['latency_ms']['p99']}ms"
+                )
+
+        table = pd.DataFrame([
+            {
+                '계열': family,
+                '요청': stats['requests'],
+                '오류': stats['errors'],
+                '재시도': stats['retries'],
+                '처리량 (req/s)': stats['throughput'],
+                'p50 (ms)': stats['latency_ms']['p50'],
+                'p95 (ms)': stats['latency_ms']['p95'],
+                'p99 (ms)': stats['latency_ms']['p99'],
+                '평균 응답 크기 (B)': stats['avg_bytes'],
+                '속도 제한 대기 (초)': stats['limiter_wait']
+            }
+            for family, stats in sorted(data['recent'].items())
+        ])
+        st.dataframe(table, use_container_width=True, hide_index=True)
+
+        requests_per_second, p95_per_second = _latency_timeline(recent_events(window))
+        chart1, chart2 = st.columns(2)
+        with chart1:
+            st.caption("초당 요청 수")
+            st.line_chart(requests_per_second)
+        with chart2:
+            st.caption("초별 p95 지연시간 (ms)")
+            st.line_chart(p95_per_second)
+
+    st.subheader("캐시 적중률")
+    cache_stats = get_cache_stats()
+    cache_rows = []
+    for endpoint, counts in sorted(data['cache'].items()):
+        total = counts['hits'] + counts['misses']
+        cache_rows.append({
+            '엔드포인트': endpoint,
+            '적중': counts['hits'],
+            '실패': counts['misses'],
+            '적중률 (%)': round(counts['hits'] / total * 100, 1) if total else 0.0,
+            '보관 항목': cache_stats.get(endpoint, {}).get('size', 0)
+        })
+    if cache_rows:
+        st.dataframe(pd.DataFrame(cache_rows), use_container_width=True, hide_index=True)
+    else:
+        st.info("캐시 조회 기록이 없습니다.")
+
+    st.subheader("동일 요청 합치기")
+    if data['coalesced']:
+        st.dataframe(pd.DataFrame([
+            {
+                '엔드포인트': endpoint,
+                '캐시 미스 호출': stats['calls'],
+                '합쳐진 호출': stats['coalesced'],
+                '절약률 (%)': round(stats['coalesced'] / stats['calls'] * 100, 1) if stats['calls'] else 0.0,
+                '진행 중': stats['in_flight']
+            }
+            for endpoint, stats in sorted(data['coalesced'].items())
+        ]), use_container_width=True, hide_index=True)
+    else:
+        st.info("합쳐진 호출 기록이 없습니다.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.subheader("속도 제한")
+        st.json(get_rate_limiter_stats())
+    with col2:
+        st.subheader("연결 풀")
+        st.json(get_pool_stats())
+
+    with st.expander("Prometheus 텍스트 / JSON 스냅샷"):
+        st.code(prometheus_text(), language='text')
+        st.download_button(
+            "JSON 스냅샷 다운로드",
+            data=json.dumps(data, ensure_ascii=False, indent=2),
+            file_name="naver_api_metrics.json",
+            mime="application/json"
+        )
+
+    if auto_refresh:
+        time.sleep(5)
+        st.rerun()
@@ -0,0 +1,252 @@
+"""
+헤드리스 배치 순위 추적기
+
+(키워드, 판매처) 쌍 목록(CSV/JSONL)을 읽어 공유 속도 제한 아래에서 동시에 순위를 검사하고,
+결과를 JSONL(또는 Parquet)로 저장합니다. 완료된 쌍은 즉시 기록되므로
+중단된 실행은 같은 명령으로 다시 실행하면 이어서 진행합니다.
+
+사용 예)
+    python -m utils.batch_rank pairs.csv -o results.jsonl --workers 8
+"""
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from config import BATCH_RANK_CONFIG, SEARCH_CONFIG, RANK_HISTORY_CONFIG
+from utils.rank_history import RankHistoryStore
+from utils.rank_search import search_product_ranks
+
+KEYWORD_COLUMNS = ('keyword', '키워드')
+MALL_COLUMNS = ('mall_name', 'mallName', 'mall', 'seller', '판매처')
+
+
+def _pick(row, columns):
+    for column in columns:
+        value = row.get(column)
+        if value:
+            return str(value).strip()
+    return ''
+
+
+def load_pairs(path):
+    """CSV/JSONL 파일에서 (키워드, 판매처) 쌍 목록 읽기 (중복 제거, 순서 유지)"""
+    if path.endswith('.jsonl'):
+        with open(path, encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    else:
+        with open(path, encoding='utf-8-sig', newline='') as f:
+            rows = list(csv.DictReader(f))
+
+    pairs = []
+    for row in rows:
+        keyword = _pick(row, KEYWORD_COLUMNS)
+        mall_name = _pick(row, MALL_COLUMNS)
+        if keyword and mall_name:
+            pairs.append((keyword, mall_name))
+    return list(dict.fromkeys(pairs))
+
+
+def _pair_key(keyword, mall_name):
+    return (' '.join(keyword.split()).lower(), mall_name.strip().lower())
+
+
+def iter_checkpoint(path):
+    """체크포인트 JSONL의 레코드 (중간에 끊긴 줄 등 읽을 수 없는 줄은 건너뜀)"""
+    if not os.path.exists(path):
+        return
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and 'keyword' in record and 'mall_name' in record:
+                yield record
+
+
+def load_checkpoint(path):
+    """이미 완료된 쌍의 키 집합 (마지막 줄이 중간에 끊겼으면 무시)"""
+    return {_pair_key(record['keyword'], record['mall_name']) for record in iter_checkpoint(path)}
+
+
+def _truncate_torn_line(path):
+    """중단으로 끊긴 마지막 줄을 잘라 파일이 완전한 줄(\\n)로 끝나게 함 (잘라낸 바이트 수 반환)
+
+    이어 쓰는 레코드가 끊긴 조각 뒤에 붙어 함께 깨지지 않도록 추가 모드로 열기 전에 호출합니다.
+    """
+    if not os.path.exists(path):
+        return 0
+    with open(path, 'rb+') as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            block = f.read(end - start)
+            if end == size and block.endswith(b'\n'):
+                return 0
+            index = block.rfind(b'\n')
+            if index >= 0:
+                end = start + index + 1
+                break
+            end = start
+        f.truncate(end)
+    return size - end
+
+
+def check_pair(keyword, mall_name, max_pages=None, items_per_page=None, sort="sim"):
+    """쌍 하나의 순위 검사 결과 레코드 (조회 실패 페이지가 있으면 status='error')"""
+    detail = search_product_ranks(
+        [keyword], mall_name,
+        max_pages=max_pages,
+        items_per_page=items_per_page,
+        sort=sort,
+        details=True
+    )[keyword]
+    match = detail['match'] or {}
+
+    if match:
+        status = 'found'
+    elif detail['failed_pages']:
+        status = 'error'
+    else:
+        status = 'not_found'
+
+    return {
+        'keyword': keyword,
+        'mall_name': mall_name,
+        'status': status,
+        'rank': match.get('rank'),
+        'page': match.get('page'),
+        'product_id': match.get('productId'),
+        'title': match.get('title'),
+        'lprice': match.get('lprice'),
+        'link': match.get('link'),
+        'pages_checked': detail['pages_checked'],
+        'checked_at': datetime.now().isoformat(timespec='seconds')
+    }
+
+
+def run_batch(pairs, checkpoint_path, workers=None, max_pages=None, items_per_page=None, sort="sim",
+              on_record=None):
+    """쌍 목록을 동시에 검사하며 완료 즉시 체크포인트(JSONL)에 추가
+
+    오류 상태 레코드는 체크포인트에 남기지 않으므로 다음 실행에서 다시 시도합니다.
+    반환값: 이번 실행에서 기록한 레코드 수
+    """
+    workers = workers or BATCH_RANK_CONFIG['workers']
+    done = load_checkpoint(checkpoint_path)
+    todo = [pair for pair in pairs if _pair_key(*pair) not in done]
+    print(f"배치 순위 검사: 전체 {len(pairs)}쌍, 완료 {len(pairs) - len(todo)}쌍, 남은 {len(todo)}쌍")
+
+    directory = os.path.dirname(checkpoint_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    torn = _truncate_torn_line(checkpoint_path)
+    if torn:
+        print(f"체크포인트 마지막 줄이 끊겨 있어 잘라냈습니다 ({torn}바이트)")
+
+    written = 0
+    errors = 0
+    started = time.perf_counter()
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-rank")
+    out = open(checkpoint_path, 'a', encoding='utf-8')
+    try:
+        futures = {
+            executor.submit(check_pair, keyword, mall_name, max_pages, items_per_page, sort): (keyword, mall_name)
+            for keyword, mall_name in todo
+        }
+        for future in as_completed(futures):
+            keyword, mall_name = futures[future]
+            try:
+                record = future.result()
+            except Exception as e:
+                print(f"순위 검사 오류 ({keyword}, {mall_name}): {e}")
+                errors += 1
+                continue
+
+            if record['status'] == 'error':
+                errors += 1
+            else:
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                out.flush()
+                written += 1
+            if on_record:
+                on_record(record)
+
+            finished = written + errors
+            if finished % BATCH_RANK_CONFIG['log_every'] == 0:
+                elapsed = time.perf_counter() - started
+                print(f"  {finished}/{len(todo)}쌍 완료 ({finished / elapsed:.1f}쌍/초, 오류 {errors})")
+    finally:
+        # 중단(Ctrl+C) 시 남은 작업을 기다리지 않고 취소
+        executor.shutdown(wait=False, cancel_futures=True)
+        out.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"배치 완료: {written}쌍 기록, 오류 {errors}쌍, {elapsed:.1f}초")
+    return written
+
+
+def _write_parquet(checkpoint_path, output_path):
+    """체크포인트 JSONL을 Parquet으로 변환 (pandas + pyarrow 필요)"""
+    import pandas as pd
+
+    df = pd.DataFrame(list(iter_checkpoint(checkpoint_path)))
+    df.to_parquet(output_path, index=False)
+    print(f"Parquet 저장: {output_path} ({len(df)}행)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="네이버 쇼핑 (키워드, 판매처) 배치 순위 추적")
+    parser.add_argument('input', help="(keyword, mall_name) 열이 있는 CSV 또는 JSONL 파일")
+    parser.add_argument('-o', '--output', required=True, help="결과 파일 (.jsonl 또는 .parquet)")
+    parser.add_argument('--workers', type=int, default=BATCH_RANK_CONFIG['workers'])
+    parser.add_argument('--max-pages', type=int, default=SEARCH_CONFIG['max_search_pages'])
+    parser.add_argument('--items-per-page', type=int, default=SEARCH_CONFIG['items_per_page'])
+    parser.add_argument('--sort', default="sim")
+    parser.add_argument('--history', nargs='?', const=RANK_HISTORY_CONFIG['path'],
+                        help="찾은 순위를 순위 이력 저장소(SQLite)에도 기록")
+    args = parser.parse_args(argv)
+
+    on_record = None
+    if args.history:
+        store = RankHistoryStore(args.history)
+
+        def _append_history(record):
+            if record['status'] == 'found':
+                store.record([record])
+
+        on_record = _append_history
+
+    parquet = args.output.endswith('.parquet')
+    checkpoint_path = args.output + '.partial.jsonl' if parquet else args.output
+
+    pairs = load_pairs(args.input)
+    try:
+        run_batch(
+            pairs, checkpoint_path,
+            workers=args.workers,
+            max_pages=args.max_pages,
+            items_per_page=args.items_per_page,
+            sort=args.sort,
+            on_record=on_record
+        )
+    except KeyboardInterrupt:
+        print(f"중단됨: 같은 명령으로 다시 실행하면 {checkpoint_path}에서 이어서 진행합니다.")
+        return 130
+
+    if parquet:
+        _write_parquet(checkpoint_path, args.output)
+        if len(load_checkpoint(checkpoint_path)) >= len(pairs):
+            os.remove(checkpoint_path)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
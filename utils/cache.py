@@ -0,0 +1,283 @@
+"""
+API 응답 캐시 (TTL + LRU, 엔드포인트별 / 선택적 SQLite 디스크 계층)
+"""
+import copy
+import functools
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from config import CACHE_CONFIG
+from utils import metrics
+from utils.singleflight import single_flight, single_flight_async
+from utils.disk_cache import DiskCache
+
+_MISSING = object()
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+_disk_cache = None
+_disk_cache_lock = threading.Lock()
+
+
+class TTLCache:
+    """유효 시간과 최대 항목 수가 있는 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_entries, ttl):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=_MISSING):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+
+def get_cache(endpoint):
+    """엔드포인트별 공유 캐시 반환 (CACHE_CONFIG 기준)"""
+    cache = _caches.get(endpoint)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(endpoint)
+            if cache is None:
+                cache = TTLCache(
+                    CACHE_CONFIG['max_entries'][endpoint],
+                    CACHE_CONFIG['ttl'][endpoint]
+                )
+                _caches[endpoint] = cache
+    return cache
+
+
+def get_disk_cache():
+    """공유 디스크 캐시 반환 (CACHE_CONFIG['disk']['enabled']가 False면 None)"""
+    global _disk_cache
+    settings = CACHE_CONFIG['disk']
+    if not settings['enabled']:
+        return None
+    if _disk_cache is None:
+        with _disk_cache_lock:
+            if _disk_cache is None:
+                disk_cache = DiskCache(settings['path'], settings['compact_interval'])
+                disk_cache.start_compaction()
+                _disk_cache = disk_cache
+    return _disk_cache
+
+
+def _disk_get(endpoint, key):
+    """디스크 캐시 조회 ((값, 남은 유효 시간) 또는 None)"""
+    disk_cache = get_disk_cache()
+    if disk_cache is None or endpoint not in CACHE_CONFIG['disk']['endpoints']:
+        return None
+    try:
+        return disk_cache.get(json.dumps(key, ensure_ascii=False))
+    except sqlite3.Error as e:
+        print(f"디스크 캐시 조회 오류: {e}")
+        return None
+
+
+def _disk_set(endpoint, key, value):
+    disk_cache = get_disk_cache()
+    if disk_cache is None or endpoint not in CACHE_CONFIG['disk']['endpoints']:
+        return
+    try:
+        disk_cache.set(json.dumps(key, ensure_ascii=False), endpoint, value, CACHE_CONFIG['ttl'][endpoint])
+    except sqlite3.Error as e:
+        print(f"디스크 캐시 저장 오류: {e}")
+
+
+def _normalize(value):
+    """캐시 키 정규화 (공백/대소문자 차이 무시, 리스트는 튜플로)"""
+    if isinstance(value, str):
+        return ' '.join(value.split()).lower()
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _normalize(v)) for k, v in value.items()))
+    return value
+
+
+def make_cache_key(func_name, *parts):
+    """함수 이름과 정규화된 인자로 캐시 키 생성"""
+    return (func_name,) + tuple(_normalize(part) for part in parts)
+
+
+def cache_lookup(endpoint, key):
+    """메모리 → 디스크 순으로 캐시 조회 (없으면 None, 있으면 복사본)"""
+    cache = get_cache(endpoint)
+    value = cache.get(key)
+    if value is not _MISSING:
+        metrics.record_cache(endpoint, True)
+        return copy.deepcopy(value)
+
+    stored = _disk_get(endpoint, key)
+    if stored is not None:
+        value, remaining = stored
+        cache.set(key, value, ttl=remaining)
+        metrics.record_cache(endpoint, True)
+        return copy.deepcopy(value)
+    metrics.record_cache(endpoint, False)
+    return None
+
+
+def cache_store(endpoint, key, value):
+    """조회 결과를 메모리/디스크 캐시에 저장 (None은 저장하지 않음)"""
+    if value is None:
+        return
+    get_cache(endpoint).set(key, copy.deepcopy(value))
+    _disk_set(endpoint, key, value)
+
+
+def cached_api(endpoint):
+    """API 조회 함수 결과를 엔드포인트 캐시에 저장하는 데코레이터
+
+    메모리 캐시에 없으면 디스크 캐시(활성화된 경우)를 확인합니다.
+    None(실패) 결과는 저장하지 않으며, 캐시된 값은 복사본을 반환해
+    호출 측에서 결과를 수정해도 캐시가 오염되지 않습니다.
+    캐시에 없는 같은 호출이 동시에 들어오면 한 번만 실행하고 결과를 나눠 받습니다
+    (CACHE_CONFIG['single_flight']).
+    원본 함수는 wrapper.uncached 로 호출할 수 있습니다.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            enabled = CACHE_CONFIG['enabled']
+            if not enabled and not CACHE_CONFIG['single_flight']:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = make_cache_key(func.__name__, *bound.arguments.values())
+
+            if enabled:
+                value = cache_lookup(endpoint, key)
+                if value is not None:
+                    return value
+
+            def load():
+                value = func(*args, **kwargs)
+                if enabled:
+                    cache_store(endpoint, key, value)
+                return value
+
+            if CACHE_CONFIG['single_flight']:
+                return single_flight(endpoint, key, load)
+            return load()
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+
+def cached_api_async(endpoint, name=None):
+    """비동기 메서드용 cached_api (name을 주면 같은 이름의 동기 함수와 캐시 키 공유)
+
+    첫 번째 인자(self)는 캐시 키에서 제외합니다.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        key_name = name or func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            enabled = CACHE_CONFIG['enabled']
+            if not enabled and not CACHE_CONFIG['single_flight']:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = make_cache_key(key_name, *list(bound.arguments.values())[1:])
+
+            if enabled:
+                value = cache_lookup(endpoint, key)
+                if value is not None:
+                    return value
+
+            async def load():
+                value = await func(*args, **kwargs)
+                if enabled:
+                    cache_store(endpoint, key, value)
+                return value
+
+            if CACHE_CONFIG['single_flight']:
+                return await single_flight_async(endpoint, key, load)
+            return await load()
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+
+def get_cache_stats():
+    """엔드포인트별 적중/실패/제거 통계 (UI 표시용)"""
+    with _caches_lock:
+        caches = dict(_caches)
+    stats = {endpoint: cache.stats() for endpoint, cache in caches.items()}
+
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        for endpoint, disk_stats in disk_cache.stats().items():
+            stats.setdefault(endpoint, {})['disk'] = disk_stats
+    return stats
+
+
+def clear_cache(endpoint=None):
+    """캐시 비우기 (endpoint 미지정 시 전체)"""
+    with _caches_lock:
+        caches = dict(_caches)
+    for name, cache in caches.items():
+        if endpoint is None or name == endpoint:
+            cache.clear()
+
+    disk_cache = get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear(endpoint)
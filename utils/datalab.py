@@ -0,0 +1,134 @@
+"""
+DataLab 트렌드 배치 조회 (5개 초과 키워드 자동 분할 + 기준 키워드로 공통 척도 맞춤)
+
+DataLab은 요청마다 그 요청 안의 최댓값을 100으로 정규화하므로,
+모든 요청에 같은 기준(anchor) 키워드를 넣고 기준 키워드 값의 비율로 각 요청 결과를 같은 척도로 맞춥니다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from config import DATALAB_CONFIG
+from utils.naver_api import get_datalab_trends
+
+# DataLab 요청당 최대 키워드 그룹 수
+DATALAB_MAX_GROUPS = 5
+
+TREND_COLUMNS = ['period', 'keyword', 'ratio']
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """DataLab 분할 요청용 공유 스레드 풀 (실제 요청 속도는 'datalab' 토큰 버킷이 제한)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=DATALAB_CONFIG['workers'],
+                    thread_name_prefix="datalab"
+                )
+    return _executor
+
+
+def trends_to_frame(result):
+    """DataLab 응답을 (period, keyword, ratio) 형태의 DataFrame으로 변환 (빠진 기간은 0)"""
+    rows = []
+    for group in (result or {}).get('results', []):
+        keyword = (group.get('keywords') or [group.get('title')])[0]
+        for point in group.get('data', []):
+            rows.append((point['period'], keyword, float(point['ratio'])))
+    if not rows:
+        return pd.DataFrame(columns=TREND_COLUMNS)
+
+    df = pd.DataFrame(rows, columns=TREND_COLUMNS)
+    wide = df.pivot_table(index='period', columns='keyword', values='ratio', aggfunc='first').fillna(0.0)
+    return wide.reset_index().melt(id_vars='period', var_name='keyword', value_name='ratio')
+
+
+def merge_trend_frames(frames, keywords):
+    """같은 척도로 맞춘 DataFrame들을 합쳐 최댓값 100으로 정규화 (기간, 입력 키워드 순 정렬)"""
+    if not frames:
+        return pd.DataFrame(columns=TREND_COLUMNS)
+
+    merged = pd.concat(frames, ignore_index=True)
+    peak = merged['ratio'].max()
+    if peak > 0:
+        merged['ratio'] = merged['ratio'] / peak * 100
+    merged['ratio'] = merged['ratio'].round(5)
+
+    order = {keyword: i for i, keyword in enumerate(keywords)}
+    merged = merged.sort_values(['period', 'keyword'], key=lambda s: s.map(order) if s.name == 'keyword' else s)
+    return merged.reset_index(drop=True)[TREND_COLUMNS]
+
+
+def _chunk_keywords(keywords, anchor):
+    """기준 키워드 + 나머지 키워드 4개씩으로 나눈 요청 목록"""
+    others = [keyword for keyword in keywords if keyword != anchor]
+    size = DATALAB_MAX_GROUPS - 1
+    chunks = [[anchor] + others[i:i + size] for i in range(0, len(others), size)]
+    return chunks or [[anchor]]
+
+
+def _anchor_scale(reference, anchor_series):
+    """기준 키워드 값의 합 비율 (같은 기간만 비교, 기준 키워드가 모두 0이면 None)"""
+    joined = reference.to_frame('reference').join(anchor_series.to_frame('chunk'), how='inner')
+    total = joined['chunk'].sum()
+    if total <= 0:
+        return None
+    return joined['reference'].sum() / total
+
+
+def get_datalab_trends_batch(keywords, start_date, end_date, time_unit="month", device="", ages=[], gender="",
+                             anchor=None):
+    """키워드 수 제한 없이 DataLab 트렌드를 조회해 하나의 척도로 맞춘 DataFrame 반환
+
+    키워드를 기준 키워드 + 4개씩 나눠 동시에 요청하고, 요청마다 기준 키워드 값의 비율로
+    첫 요청의 척도에 맞춘 뒤 전체 최댓값이 100이 되도록 다시 정규화합니다.
+    anchor는 검색량이 많은 키워드일수록 작은 키워드의 값이 덜 뭉개집니다 (기본: 첫 키워드).
+
+    반환값: columns=['period', 'keyword', 'ratio'] (조회 실패 시 빈 DataFrame)
+    """
+    keywords = list(dict.fromkeys(keyword for keyword in keywords if keyword))
+    if not keywords:
+        return pd.DataFrame(columns=TREND_COLUMNS)
+    anchor = anchor or keywords[0]
+    if anchor not in keywords:
+        keywords.insert(0, anchor)
+
+    chunks = _chunk_keywords(keywords, anchor)
+    executor = _get_executor()
+    futures = [
+        executor.submit(get_datalab_trends, chunk, start_date, end_date, time_unit, device, ages, gender)
+        for chunk in chunks
+    ]
+
+    frames = []
+    reference = None
+    for chunk, future in zip(chunks, futures):
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"DataLab 배치 조회 오류 ({', '.join(chunk)}): {e}")
+            result = None
+        df = trends_to_frame(result)
+        if df.empty:
+            print(f"DataLab 응답 없음: {', '.join(chunk)}")
+            continue
+
+        anchor_series = df[df['keyword'] == anchor].set_index('period')['ratio']
+        if reference is None:
+            reference = anchor_series
+            scale = 1.0
+        else:
+            scale = _anchor_scale(reference, anchor_series)
+            df = df[df['keyword'] != anchor]
+            if scale is None:
+                print(f"DataLab 기준 키워드 값이 없어 척도를 맞출 수 없음: {', '.join(chunk[1:])}")
+                continue
+        frames.append(df.assign(ratio=df['ratio'] * scale))
+
+    return merge_trend_frames(frames, keywords)
@@ -0,0 +1,220 @@
+"""
+DataLab 시계열 증분 캐시 (SQLite)
+
+(키워드, time_unit, device, ages, gender)별 시계열을 기간 단위로 저장해 두고,
+새 조회에서는 저장된 마지막 구간 이후만 요청합니다. DataLab 값은 요청마다 다시 정규화되므로
+새로 받은 구간은 이미 저장된 겹치는 기간(overlap)의 값 비율로 저장된 척도에 맞추고,
+여러 키워드를 비교할 때는 최근 기간만 함께 요청해 키워드 간 척도를 맞춥니다.
+"""
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from config import DATALAB_CONFIG
+from utils.datalab import get_datalab_trends_batch, merge_trend_frames, TREND_COLUMNS
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS datalab_series (
+    series TEXT NOT NULL,
+    period TEXT NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (series, period)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS datalab_series_meta (
+    series TEXT PRIMARY KEY,
+    start_date TEXT NOT NULL
+);
+"""
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def series_key(keyword, time_unit="month", device="", ages=(), gender=""):
+    """시계열 저장 키 (키워드 공백 정리, 연령대 순서 무시)"""
+    return '|'.join([
+        ' '.join(keyword.split()).lower(),
+        time_unit,
+        device or '',
+        ','.join(sorted(ages or [])),
+        gender or ''
+    ])
+
+
+class DataLabSeriesStore:
+    """시계열별 기간 값 저장/조회 (값의 척도는 시계열마다 독립)"""
+
+    def __init__(self, path=None):
+        self.path = path or DATALAB_CONFIG['series_path']
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def load(self, key):
+        """(저장된 시계열(period 인덱스, 정렬됨), 처음 조회한 시작일) / 없으면 (빈 Series, None)"""
+        conn = self._connection()
+        rows = conn.execute(
+            "SELECT period, value FROM datalab_series WHERE series = ? ORDER BY period", (key,)
+        ).fetchall()
+        meta = conn.execute("SELECT start_date FROM datalab_series_meta WHERE series = ?", (key,)).fetchone()
+        series = pd.Series(
+            [value for _, value in rows],
+            index=[period for period, _ in rows],
+            dtype='float64'
+        )
+        return series, meta[0] if meta else None
+
+    def save(self, key, series, start_date=None):
+        """기간 값 덮어쓰기 (start_date를 주면 기존 시계열을 지우고 새로 저장)"""
+        conn = self._connection()
+        with conn:
+            if start_date is not None:
+                conn.execute("DELETE FROM datalab_series WHERE series = ?", (key,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO datalab_series_meta (series, start_date) VALUES (?, ?)",
+                    (key, start_date)
+                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO datalab_series (series, period, value) VALUES (?, ?, ?)",
+                [(key, period, float(value)) for period, value in series.items()]
+            )
+
+    def clear(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM datalab_series")
+            conn.execute("DELETE FROM datalab_series_meta")
+
+
+def get_series_store():
+    """기본 경로(DATALAB_CONFIG['series_path'])의 공유 저장소"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = DataLabSeriesStore()
+    return _store
+
+
+def _fetch_start(cached, cached_start, start_date, end_date):
+    """(새로 요청할 시작 기간, 전체 재조회 여부) / 요청이 필요 없으면 (None, False)
+
+    마지막 저장 기간은 아직 진행 중이었을 수 있으므로 그 직전 기간부터 다시 받아
+    직전 기간을 척도 맞춤용 겹치는 기간으로 씁니다.
+    """
+    if cached_start is None or start_date < cached_start or len(cached) < 2:
+        return start_date, True
+    if end_date < cached.index[-1]:
+        return None, False
+    return cached.index[-2], False
+
+
+def _keyword_series(df, keyword):
+    return df[df['keyword'] == keyword].set_index('period')['ratio']
+
+
+def _align_scales(stored, reference):
+    """키워드별 척도 배율 (같은 기간에서 reference 합 / 저장 값 합, 맞출 수 없으면 None)"""
+    scales = {}
+    for keyword, series in stored.items():
+        joined = series.to_frame('stored').join(_keyword_series(reference, keyword).to_frame('reference'), how='inner')
+        total = joined['stored'].sum()
+        if joined.empty or total <= 0:
+            return None
+        scales[keyword] = joined['reference'].sum() / total
+    return scales
+
+
+def get_datalab_series(keywords, start_date, end_date, time_unit="month", device="", ages=[], gender="",
+                       store=None):
+    """저장된 시계열을 재사용해 DataLab 트렌드를 조회 (형식은 get_datalab_trends_batch와 같음)
+
+    키워드마다 저장된 마지막 구간 이후만 요청하고(같은 구간은 5개씩 묶어 한 번에 요청),
+    여러 키워드는 최근 기간의 공통 척도로 맞춘 뒤 전체 최댓값이 100이 되도록 정규화합니다.
+    척도를 맞출 수 없으면(겹치는 기간 값이 0 등) 전체 구간을 다시 요청합니다.
+    """
+    keywords = list(dict.fromkeys(keyword for keyword in keywords if keyword))
+    if not keywords:
+        return pd.DataFrame(columns=TREND_COLUMNS)
+    store = store or get_series_store()
+    filters = (time_unit, device, ages, gender)
+
+    # 1. 키워드별 요청 시작 기간 결정 후 같은 시작 기간끼리 묶기
+    groups = {}
+    for keyword in keywords:
+        cached, cached_start = store.load(series_key(keyword, *filters))
+        fetch_start, full = _fetch_start(cached, cached_start, start_date, end_date)
+        if fetch_start is not None:
+            groups.setdefault(fetch_start, []).append((keyword, cached, full))
+
+    # 2. 빠진 구간만 요청해 저장된 척도에 맞춰 이어 붙이기
+    fetched = {}
+    refetch = []
+    for fetch_start, members in groups.items():
+        df = get_datalab_trends_batch([member[0] for member in members], fetch_start, end_date, *filters)
+        fetched[fetch_start] = df
+        for keyword, cached, full in members:
+            new = _keyword_series(df, keyword)
+            key = series_key(keyword, *filters)
+            if full:
+                if not new.empty:
+                    store.save(key, new, start_date=start_date)
+                continue
+            overlap = fetch_start
+            if new.get(overlap, 0) <= 0 or cached.get(overlap, 0) <= 0:
+                refetch.append(keyword)
+                continue
+            store.save(key, new * (cached[overlap] / new[overlap]))
+
+    if refetch:
+        df = get_datalab_trends_batch(refetch, start_date, end_date, *filters)
+        for keyword in refetch:
+            new = _keyword_series(df, keyword)
+            if not new.empty:
+                store.save(series_key(keyword, *filters), new, start_date=start_date)
+
+    # 3. 요청 구간만 잘라내고 키워드 간 척도 맞추기
+    stored = {}
+    for keyword in keywords:
+        series, _ = store.load(series_key(keyword, *filters))
+        stored[keyword] = series[(series.index >= start_date) & (series.index <= end_date)]
+
+    if len(keywords) == 1:
+        scales = {keywords[0]: 1.0}
+    else:
+        reference = None
+        if len(groups) == 1 and not refetch:
+            # 모든 키워드를 같은 구간으로 방금 함께 요청했으면 그 응답이 공통 척도
+            fetch_start, members = next(iter(groups.items()))
+            if len(members) == len(keywords):
+                reference = fetched[fetch_start]
+        if reference is None:
+            periods = sorted(set().union(*(series.index for series in stored.values())))
+            align_start = periods[-2] if len(periods) >= 2 else start_date
+            reference = get_datalab_trends_batch(keywords, align_start, end_date, *filters)
+        scales = _align_scales(stored, reference)
+        if scales is None:
+            print("DataLab 시계열 척도를 맞출 수 없어 전체 구간을 다시 조회합니다.")
+            return get_datalab_trends_batch(keywords, start_date, end_date, *filters)
+
+    frames = [
+        pd.DataFrame({'period': series.index, 'keyword': keyword, 'ratio': series.values * scales[keyword]})
+        for keyword, series in stored.items()
+        if not series.empty
+    ]
+    return merge_trend_frames(frames, keywords)
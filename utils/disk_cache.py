@@ -0,0 +1,113 @@
+"""
+SQLite 디스크 캐시 (WAL 모드, 압축 JSON, TTL 만료)
+
+여러 Streamlit 워커 프로세스가 같은 파일을 공유하고, 재시작 후에도 응답을 재사용합니다.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS api_cache (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_api_cache_expires ON api_cache (expires_at);
+"""
+
+
+class DiskCache:
+    """프로세스 간 공유 가능한 SQLite 키-값 캐시"""
+
+    def __init__(self, path, compact_interval=600):
+        self.path = path
+        self.compact_interval = compact_interval
+        self._local = threading.local()
+        self._compactor = None
+        self._stop = threading.Event()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _connection(self):
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _encode(value):
+        return zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+
+    @staticmethod
+    def _decode(payload):
+        return json.loads(zlib.decompress(payload))
+
+    def get(self, key):
+        """(값, 남은 유효 시간) 반환, 없거나 만료되었으면 None"""
+        row = self._connection().execute(
+            "SELECT expires_at, payload FROM api_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        remaining = row[0] - time.time()
+        if remaining <= 0:
+            return None
+        return self._decode(row[1]), remaining
+
+    def set(self, key, endpoint, value, ttl):
+        self._connection().execute(
+            "INSERT OR REPLACE INTO api_cache (key, endpoint, expires_at, payload) VALUES (?, ?, ?, ?)",
+            (key, endpoint, time.time() + ttl, self._encode(value))
+        )
+
+    def delete_expired(self):
+        """만료 항목 삭제 후 WAL 정리, 삭제 건수 반환"""
+        conn = self._connection()
+        deleted = conn.execute("DELETE FROM api_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return deleted
+
+    def clear(self, endpoint=None):
+        if endpoint is None:
+            self._connection().execute("DELETE FROM api_cache")
+        else:
+            self._connection().execute("DELETE FROM api_cache WHERE endpoint = ?", (endpoint,))
+
+    def stats(self):
+        rows = self._connection().execute(
+            "SELECT endpoint, COUNT(*), SUM(LENGTH(payload)) FROM api_cache GROUP BY endpoint"
+        ).fetchall()
+        return {endpoint: {'entries': count, 'bytes': size or 0} for endpoint, count, size in rows}
+
+    def start_compaction(self):
+        """만료 항목을 주기적으로 정리하는 백그라운드 스레드 시작"""
+        if self._compactor is not None:
+            return
+
+        def run():
+            while not self._stop.wait(self.compact_interval):
+                try:
+                    self.delete_expired()
+                except sqlite3.Error as e:
+                    print(f"디스크 캐시 정리 오류: {e}")
+
+        self._compactor = threading.Thread(target=run, name="disk-cache-compactor", daemon=True)
+        self._compactor.start()
+
+    def stop_compaction(self):
+        self._stop.set()
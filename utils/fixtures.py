@@ -0,0 +1,243 @@
+"""
+오프라인 픽스처 모드 (네이버 API 대역)
+
+쇼핑 검색 / DataLab / 키워드 도구 응답을 (시드, 요청 파라미터)로 결정되는 가짜 데이터로 만들어
+공용 세션에 끼운 전송 어댑터가 돌려줍니다. 같은 시드면 실행할 때마다 같은 응답이 나오므로
+캐시/부하 테스트를 네이버에 요청하지 않고 반복할 수 있고, 지연시간은 설정으로 조절합니다.
+
+    from utils.fixtures import enable_fixture_mode
+    enable_fixture_mode(seed=7, latency_ms=80)
+"""
+import json
+import random
+import time
+from datetime import date, timedelta
+from urllib.parse import urlsplit, parse_qs
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from config import FIXTURE_CONFIG
+
+# 픽스처 어댑터를 끼울 호스트 (네이버 오픈 API / 검색광고 API)
+FIXTURE_HOSTS = ('https://openapi.naver.com', 'https://api.naver.com')
+
+FIXTURE_MALLS = ['네이버', '쿠팡', '11번가', 'G마켓', '옥션', '위메프', '티몬', 'SSG닷컴', '롯데ON', '테스트몰']
+FIXTURE_BRANDS = ['로지텍', '삼성전자', 'LG전자', '앱코', '레노버', '샤오미', '한성컴퓨터', '브리츠']
+FIXTURE_MODIFIERS = ['추천', '가격', '리뷰', '순위', '할인', '비교', '무선', '게이밍', '사무용', '미니',
+                     '블루투스', '저소음', '가성비', '세트', '인기', '베스트', '중고', '정품', '최저가', '특가']
+
+
+def _rng(seed, *parts):
+    """시드와 요청 값으로 결정되는 난수 생성기 (문자열 시드는 실행마다 같은 값)"""
+    return random.Random(':'.join(str(part) for part in (seed,) + parts))
+
+
+def keyword_volume(keyword, seed=None):
+    """키워드별 고정 월간 검색량 (PC, 모바일)"""
+    seed = FIXTURE_CONFIG['seed'] if seed is None else seed
+    rng = _rng(seed, 'volume', keyword.replace(' ', '').upper())
+    total = int(rng.lognormvariate(8.5, 1.4))
+    mobile = int(total * rng.uniform(0.55, 0.8))
+    return total - mobile, mobile
+
+
+def shopping_response(params, seed=None):
+    """쇼핑 검색 응답 (query, display, start, sort)"""
+    seed = FIXTURE_CONFIG['seed'] if seed is None else seed
+    query = params.get('query', '')
+    display = int(params.get('display', 10))
+    start = int(params.get('start', 1))
+    sort = params.get('sort', 'sim')
+    total = _rng(seed, 'total', query).randint(50, 5000)
+
+    items = []
+    for rank in range(start, min(start + display, total + 1)):
+        rng = _rng(seed, 'item', query, sort, rank)
+        product_id = rng.randint(10 ** 10, 10 ** 11)
+        lprice = rng.randint(50, 3000) * 100
+        items.append({
+            'title': f"{rng.choice(FIXTURE_BRANDS)} <b>{query}</b> {rng.choice(FIXTURE_MODIFIERS)} [{rank}]",
+            'link': f"https://search.shopping.naver.com/catalog/{product_id}",
+            'image': f"https://shopping-phinf.pstatic.net/{product_id}.jpg",
+            'lprice': str(lprice),
+            'hprice': '',
+            'mallName': rng.choice(FIXTURE_MALLS),
+            'productId': str(product_id),
+            'productType': '1',
+            'brand': rng.choice(FIXTURE_BRANDS),
+            'maker': '',
+            'category1': '디지털/가전',
+            'category2': '주변기기',
+            'category3': '',
+            'category4': ''
+        })
+
+    return {
+        'lastBuildDate': 'Mon, 01 Jan 2024 00:00:00 +0900',
+        'total': total,
+        'start': start,
+        'display': len(items),
+        'items': items
+    }
+
+
+def _periods(start_date, end_date, time_unit):
+    """DataLab 기간 시작일 목록 (date / week / month)"""
+    current = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    periods = []
+    while current <= end:
+        periods.append(current.isoformat())
+        if time_unit == 'date':
+            current += timedelta(days=1)
+        elif time_unit == 'week':
+            current += timedelta(days=7)
+        else:
+            current = (current.replace(day=1) + timedelta(days=32)).replace(day=1)
+    return periods
+
+
+def datalab_response(body, seed=None):
+    """DataLab 검색어 트렌드 응답 (요청 안의 최댓값을 100으로 정규화)"""
+    seed = FIXTURE_CONFIG['seed'] if seed is None else seed
+    periods = _periods(body['startDate'], body['endDate'], body.get('timeUnit', 'month'))
+    filters = (body.get('device', ''), ','.join(sorted(body.get('ages', []))), body.get('gender', ''))
+
+    series = []
+    for group in body.get('keywordGroups', []):
+        keyword = group['keywords'][0]
+        pc, mobile = keyword_volume(keyword, seed)
+        values = [
+            (pc + mobile) * _rng(seed, 'trend', keyword, period, *filters).uniform(0.5, 1.5)
+            for period in periods
+        ]
+        series.append((group, values))
+
+    peak = max((max(values) for _, values in series if values), default=0) or 1
+    return {
+        'startDate': body['startDate'],
+        'endDate': body['endDate'],
+        'timeUnit': body.get('timeUnit', 'month'),
+        'results': [
+            {
+                'title': group['groupName'],
+                'keywords': group['keywords'],
+                'data': [
+                    {'period': period, 'ratio': round(value / peak * 100, 5)}
+                    for period, value in zip(periods, values)
+                ]
+            }
+            for group, values in series
+        ]
+    }
+
+
+def _keyword_row(keyword, seed):
+    """키워드 도구 keywordList 행 (같은 키워드는 어느 요청에서든 같은 값)"""
+    pc, mobile = keyword_volume(keyword, seed)
+    rng = _rng(seed, 'row', keyword.replace(' ', '').upper())
+    pc_ctr = round(rng.uniform(0.1, 5.0), 2)
+    mobile_ctr = round(rng.uniform(0.1, 5.0), 2)
+    return {
+        'relKeyword': keyword.replace(' ', ''),
+        'monthlyPcQcCnt': pc,
+        'monthlyMobileQcCnt': mobile,
+        'monthlyAvePcClkCnt': round(pc * pc_ctr / 100, 1),
+        'monthlyAveMobileClkCnt': round(mobile * mobile_ctr / 100, 1),
+        'monthlyAvePcCtr': pc_ctr,
+        'monthlyAveMobileCtr': mobile_ctr,
+        'plAvgDepth': rng.randint(0, 15),
+        'compIdx': rng.choice(['HIGH', 'MEDIUM', 'LOW']),
+        'monthlyAvePcShwCnt': int(pc * rng.uniform(0.2, 0.5)),
+        'monthlyAveMobileShwCnt': int(mobile * rng.uniform(0.2, 0.5))
+    }
+
+
+def keywordstool_response(params, seed=None):
+    """키워드 도구 응답 (hintKeywords 최대 5개, 키워드마다 연관 키워드 생성)"""
+    seed = FIXTURE_CONFIG['seed'] if seed is None else seed
+    hints = [hint for hint in params.get('hintKeywords', '').split(',') if hint]
+    include_hints = params.get('includeHintKeywords', '1') != '0'
+    limit = int(params.get('maxResults', 0) or 1000)
+
+    rows = {}
+    if include_hints:
+        for hint in hints:
+            rows[hint.upper()] = _keyword_row(hint, seed)
+    for hint in hints:
+        rng = _rng(seed, 'related', hint.upper())
+        for modifier in rng.sample(FIXTURE_MODIFIERS, rng.randint(8, len(FIXTURE_MODIFIERS))):
+            keyword = f"{hint}{modifier}" if rng.random() < 0.5 else f"{modifier}{hint}"
+            rows.setdefault(keyword.upper(), _keyword_row(keyword, seed))
+    return {'keywordList': list(rows.values())[:limit]}
+
+
+def fixture_response(method, url, body=None, seed=None):
+    """요청 → (상태 코드, JSON 응답) / 알 수 없는 경로는 404"""
+    parts = urlsplit(url)
+    params = {key: values[-1] for key, values in parse_qs(parts.query, keep_blank_values=True).items()}
+
+    if parts.path.endswith('/v1/search/shop.json'):
+        return 200, shopping_response(params, seed)
+    if parts.path.endswith('/v1/datalab/search') and method == 'POST':
+        return 200, datalab_response(json.loads(body or b'{}'), seed)
+    if parts.path.endswith('/keywordstool'):
+        return 200, keywordstool_response(params, seed)
+    return 404, {'errorMessage': f"fixture: 알 수 없는 경로 {parts.path}"}
+
+
+class FixtureAdapter(BaseAdapter):
+    """네트워크 대신 픽스처 응답을 돌려주는 requests 전송 어댑터"""
+
+    def __init__(self, seed=None, latency_ms=None, jitter_ms=None):
+        super().__init__()
+        self.seed = FIXTURE_CONFIG['seed'] if seed is None else seed
+        self.latency_ms = FIXTURE_CONFIG['latency_ms'] if latency_ms is None else latency_ms
+        self.jitter_ms = FIXTURE_CONFIG['jitter_ms'] if jitter_ms is None else jitter_ms
+        self._jitter = random.Random(self.seed)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        delay = self.latency_ms + (self._jitter.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        body = request.body.encode('utf-8') if isinstance(request.body, str) else request.body
+        status_code, payload = fixture_response(request.method, request.url, body, self.seed)
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = 'OK' if status_code == 200 else 'Not Found'
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json;charset=utf-8'})
+        response._content = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        response._content_consumed = True  # stream=True 요청도 iter_content()로 본문을 읽을 수 있도록
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def enable_fixture_mode(seed=None, latency_ms=None, jitter_ms=None, session=None):
+    """공용 세션의 네이버 API 요청을 픽스처 어댑터로 보내기"""
+    from utils.http_client import get_session
+
+    session = session or get_session()
+    adapter = FixtureAdapter(seed=seed, latency_ms=latency_ms, jitter_ms=jitter_ms)
+    for host in FIXTURE_HOSTS:
+        session.mount(host, adapter)
+    FIXTURE_CONFIG['enabled'] = True
+    return adapter
+
+
+def disable_fixture_mode(session=None):
+    """픽스처 어댑터를 떼고 실제 네트워크 요청으로 되돌리기"""
+    from utils.http_client import get_session
+
+    session = session or get_session()
+    for host in FIXTURE_HOSTS:
+        session.adapters.pop(host, None)
+    FIXTURE_CONFIG['enabled'] = False
@@ -0,0 +1,332 @@
+"""
+네이버 API 공용 HTTP 클라이언트 (keep-alive 연결 풀)
+"""
+import asyncio
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config import HTTP_CONFIG, FIXTURE_CONFIG
+from utils import json_codec, metrics
+from utils.rate_limiter import get_rate_limiter
+
+# 재시도 대상 상태 코드 (요청 한도 초과 / 서버 오류)
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+_session = None
+_session_lock = threading.Lock()
+
+_host_stats = {}
+_stats_lock = threading.Lock()
+
+
+class NaverAPIError(Exception):
+    """네이버 API 요청 실패"""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def get_session():
+    """프로세스 전역 keep-alive 세션 반환 (openapi.naver.com / api.naver.com 공유)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_CONFIG['pool_connections'],
+                    pool_maxsize=HTTP_CONFIG['pool_maxsize'],
+                    max_retries=0  # 재시도는 request()에서 직접 처리
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers.update({
+                    'Accept-Encoding': 'gzip, deflate',
+                    'Connection': 'keep-alive'
+                })
+                if FIXTURE_CONFIG['enabled']:
+                    from utils.fixtures import enable_fixture_mode
+                    enable_fixture_mode(session=session)
+                _session = session
+    return _session
+
+
+def override_base_url(original, replacement=None):
+    """original로 시작하는 요청 URL을 replacement로 바꿔 보내기 (로컬 목 서버 벤치마크용, None이면 해제)"""
+    overrides = HTTP_CONFIG.setdefault('base_url_overrides', {})
+    if replacement is None:
+        overrides.pop(original, None)
+    else:
+        overrides[original] = replacement.rstrip('/')
+
+
+def _resolve_url(url):
+    for original, replacement in HTTP_CONFIG.get('base_url_overrides', {}).items():
+        if url.startswith(original):
+            return replacement + url[len(original):]
+    return url
+
+
+def _retry_after_seconds(response):
+    try:
+        return float(response.headers.get('Retry-After', ''))
+    except ValueError:
+        return None
+
+
+def _backoff_delay(attempt, response=None):
+    """재시도 대기 시간 계산 (Retry-After 우선, 지수 백오프 + 지터)"""
+    if response is not None:
+        retry_after = _retry_after_seconds(response)
+        if retry_after is not None:
+            return min(retry_after, HTTP_CONFIG['backoff_max'])
+    delay = HTTP_CONFIG['backoff_factor'] * (2 ** attempt)
+    return min(delay, HTTP_CONFIG['backoff_max']) * random.uniform(0.8, 1.2)
+
+
+def _record(host, latency, failed=False, retried=False):
+    """호스트별 지연시간/오류/재시도 집계"""
+    with _stats_lock:
+        stats = _host_stats.setdefault(host, {
+            'requests': 0,
+            'errors': 0,
+            'retries': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0
+        })
+        stats['requests'] += 1
+        stats['total_latency'] += latency
+        stats['max_latency'] = max(stats['max_latency'], latency)
+        if failed:
+            stats['errors'] += 1
+        if retried:
+            stats['retries'] += 1
+
+
+def request(method, url, params=None, headers=None, data=None, json_body=None, timeout=None,
+            rate_family=None, stream=False):
+    """공용 세션으로 요청 (429/5xx/연결 오류 시 백오프 재시도)
+
+    rate_family를 지정하면 매 시도 전에 해당 API 계열의 토큰 버킷을 기다리고,
+    429 응답을 버킷에 알려 감속시킵니다.
+    최종 응답(상태 코드와 무관)을 반환하고, 재시도 후에도 연결이 실패하면 NaverAPIError 발생
+    stream=True면 본문을 읽지 않은 응답을 반환하므로 호출 측이 이 모듈의 iter_content()로 읽고 닫아야 합니다
+    (메트릭은 본문을 다 읽었을 때 실제 크기로 기록).
+    """
+    session = get_session()
+    url = _resolve_url(url)
+    timeout = timeout or HTTP_CONFIG['timeout']
+    max_retries = HTTP_CONFIG['max_retries']
+    parts = urlsplit(url)
+    host = parts.netloc
+    family = rate_family or host
+    limiter = get_rate_limiter(rate_family) if rate_family else None
+    limiter_wait = 0.0
+    first_started = None
+
+    for attempt in range(max_retries + 1):
+        if limiter:
+            limiter_wait += limiter.acquire()
+        started = time.perf_counter()
+        first_started = first_started or started
+        try:
+            response = session.request(
+                method, url,
+                params=params,
+                headers=headers,
+                data=data,
+                json=json_body,
+                timeout=timeout,
+                stream=stream
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            will_retry = attempt < max_retries
+            _record(host, time.perf_counter() - started, failed=True, retried=will_retry)
+            if not will_retry:
+                metrics.record_request(family, parts.path, time.perf_counter() - first_started, 0,
+                                       retries=attempt, limiter_wait=limiter_wait)
+                raise NaverAPIError(f"{host} 연결 실패: {e}") from e
+            time.sleep(_backoff_delay(attempt))
+            continue
+
+        limiter_waits = False
+        if limiter:
+            if response.status_code == 429:
+                retry_after = _retry_after_seconds(response)
+                limiter.on_throttled(retry_after)
+                limiter_waits = retry_after is not None
+            elif response.ok:
+                limiter.on_success()
+
+        will_retry = response.status_code in RETRY_STATUS_CODES and attempt < max_retries
+        _record(
+            host,
+            time.perf_counter() - started,
+            failed=response.status_code >= 400,
+            retried=will_retry
+        )
+        if will_retry:
+            response.close()
+            # Retry-After를 반영한 버킷이 다음 acquire()에서 대기하므로 중복 대기하지 않음
+            if not limiter_waits:
+                time.sleep(_backoff_delay(attempt, response))
+            continue
+        if stream:
+            # 본문 크기(청크 전송/압축 해제 후)는 iter_content()로 다 읽은 뒤 기록
+            response._pending_metrics = (family, parts.path, first_started, attempt, limiter_wait)
+            return response
+        metrics.record_request(family, parts.path, time.perf_counter() - first_started, response.status_code,
+                               size=len(response.content), retries=attempt, limiter_wait=limiter_wait)
+        return response
+
+
+def iter_content(response, chunk_size=None):
+    """request(stream=True) 응답 본문을 조각 단위로 yield
+
+    다 읽거나 중간에 닫으면(close) 그때까지 읽은 디코딩된 본문 크기와 전체 소요 시간으로 메트릭을 기록합니다.
+    """
+    chunk_size = chunk_size or HTTP_CONFIG['stream_chunk_size']
+    size = 0
+    try:
+        for chunk in response.iter_content(chunk_size):
+            size += len(chunk)
+            yield chunk
+    finally:
+        pending = getattr(response, '_pending_metrics', None)
+        if pending is not None:
+            response._pending_metrics = None
+            family, endpoint, started, retries, limiter_wait = pending
+            metrics.record_request(family, endpoint, time.perf_counter() - started, response.status_code,
+                                   size=size, retries=retries, limiter_wait=limiter_wait)
+
+
+async def request_async(client, method, url, params=None, headers=None, json_body=None, timeout=None,
+                        rate_family=None):
+    """request()의 비동기 버전
+
+    client가 httpx.AsyncClient면 이벤트 루프에서 직접 요청하고,
+    None이면 공용 세션 요청을 스레드로 넘겨 실행합니다.
+    """
+    if client is None:
+        return await asyncio.to_thread(
+            request, method, url,
+            params=params,
+            headers=headers,
+            json_body=json_body,
+            timeout=timeout,
+            rate_family=rate_family
+        )
+
+    url = _resolve_url(url)
+    timeout = timeout or HTTP_CONFIG['timeout']
+    max_retries = HTTP_CONFIG['max_retries']
+    parts = urlsplit(url)
+    host = parts.netloc
+    family = rate_family or host
+    limiter = get_rate_limiter(rate_family) if rate_family else None
+    limiter_wait = 0.0
+    first_started = None
+
+    for attempt in range(max_retries + 1):
+        if limiter:
+            limiter_wait += await limiter.acquire_async()
+        started = time.perf_counter()
+        first_started = first_started or started
+        try:
+            response = await client.request(
+                method, url,
+                params=params,
+                headers=headers,
+                json=json_body,
+                timeout=timeout
+            )
+        except Exception as e:
+            will_retry = attempt < max_retries
+            _record(host, time.perf_counter() - started, failed=True, retried=will_retry)
+            if not will_retry:
+                metrics.record_request(family, parts.path, time.perf_counter() - first_started, 0,
+                                       retries=attempt, limiter_wait=limiter_wait)
+                raise NaverAPIError(f"{host} 연결 실패: {e}") from e
+            await asyncio.sleep(_backoff_delay(attempt))
+            continue
+
+        limiter_waits = False
+        if limiter:
+            if response.status_code == 429:
+                retry_after = _retry_after_seconds(response)
+                limiter.on_throttled(retry_after)
+                limiter_waits = retry_after is not None
+            elif response.status_code < 400:
+                limiter.on_success()
+
+        will_retry = response.status_code in RETRY_STATUS_CODES and attempt < max_retries
+        _record(
+            host,
+            time.perf_counter() - started,
+            failed=response.status_code >= 400,
+            retried=will_retry
+        )
+        if will_retry:
+            if not limiter_waits:
+                await asyncio.sleep(_backoff_delay(attempt, response))
+            continue
+        metrics.record_request(family, parts.path, time.perf_counter() - first_started, response.status_code,
+                               size=len(response.content), retries=attempt, limiter_wait=limiter_wait)
+        return response
+
+
+def request_json(method, url, **kwargs):
+    """요청 후 JSON 응답 반환 (2xx가 아니면 NaverAPIError 발생)"""
+    response = request(method, url, **kwargs)
+    if not response.ok:
+        raise NaverAPIError(
+            f"{response.status_code} - {response.text[:200]}",
+            status_code=response.status_code
+        )
+    return json_codec.loads(response.content)
+
+
+def _connection_counts():
+    """연결 풀별 신규 연결 수 / 처리 요청 수 (urllib3 풀 카운터)"""
+    counts = {}
+    if _session is None:
+        return counts
+
+    pools = _session.get_adapter('https://').poolmanager.pools
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool is None:
+            continue
+        host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+        entry = counts.setdefault(host, {'new_connections': 0, 'pool_requests': 0})
+        entry['new_connections'] += pool.num_connections
+        entry['pool_requests'] += pool.num_requests
+    return counts
+
+
+def get_pool_stats():
+    """호스트별 지연시간 및 keep-alive 재사용 통계"""
+    with _stats_lock:
+        snapshot = {host: dict(stats) for host, stats in _host_stats.items()}
+
+    connections = _connection_counts()
+    for host, stats in snapshot.items():
+        conn = connections.get(host, {'new_connections': 0, 'pool_requests': 0})
+        stats['avg_latency_ms'] = round(stats['total_latency'] / stats['requests'] * 1000, 1) if stats['requests'] else 0.0
+        stats['max_latency_ms'] = round(stats.pop('max_latency') * 1000, 1)
+        stats.pop('total_latency')
+        stats['new_connections'] = conn['new_connections']
+        stats['reused_connections'] = max(conn['pool_requests'] - conn['new_connections'], 0)
+    return snapshot
+
+
+def reset_pool_stats():
+    """집계 통계 초기화"""
+    with _stats_lock:
+        _host_stats.clear()
@@ -0,0 +1,386 @@
+"""
+백그라운드 작업 큐 (SQLite 작업 테이블 + 워커 스레드 풀)
+
+오래 걸리는 순위 검사 / 월간 트렌드 조회 / 키워드 확장을 Streamlit 스크립트 스레드 밖에서 실행합니다.
+페이지는 submit으로 작업을 넣고 status로 진행률을 확인한 뒤 result로 결과를 가져옵니다.
+작업 상태와 결과는 SQLite에 저장되므로 사용자가 페이지를 떠났다가 돌아와도 이어서 볼 수 있고,
+같은 종류/파라미터의 작업이 대기 중이거나 실행 중이면 새로 만들지 않고 그 작업을 함께 봅니다.
+사용자별 동시 실행 수는 JOB_QUEUE_CONFIG['per_user_limit']로 제한합니다.
+"""
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from config import JOB_QUEUE_CONFIG
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    dedupe_key TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress_done INTEGER NOT NULL DEFAULT 0,
+    progress_total INTEGER NOT NULL DEFAULT 0,
+    result BLOB,
+    error TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    worker_id TEXT,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_dedupe ON jobs (dedupe_key, status);
+CREATE TABLE IF NOT EXISTS job_users (
+    job_id TEXT NOT NULL,
+    user TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    PRIMARY KEY (user, job_id)
+) WITHOUT ROWID;
+"""
+
+# 진행 중 상태 (같은 작업 공유 대상)
+ACTIVE_STATUSES = ('queued', 'running')
+
+# 이전 버전 DB에 없을 수 있는 열
+_ADDED_COLUMNS = (('worker_id', 'TEXT'), ('heartbeat_at', 'REAL'))
+
+_handlers = {}
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청으로 중단"""
+
+
+def register_job_handler(kind):
+    """작업 종류별 실행 함수 등록 데코레이터 (func(params, report) → JSON 직렬화 가능한 결과)
+
+    report(done, total)로 진행률을 알리며, 취소가 요청되었으면 report가 JobCancelled를 발생시킵니다.
+    """
+    def decorator(func):
+        _handlers[kind] = func
+        return func
+    return decorator
+
+
+def _dedupe_key(kind, params):
+    return hashlib.sha1(f"{kind}:{json.dumps(params, sort_keys=True, ensure_ascii=False)}".encode('utf-8')).hexdigest()
+
+
+class JobQueue:
+    """SQLite에 상태를 저장하는 작업 큐"""
+
+    def __init__(self, path=None, workers=None, per_user_limit=None):
+        self.path = path or JOB_QUEUE_CONFIG['path']
+        self.workers = workers or JOB_QUEUE_CONFIG['workers']
+        self.per_user_limit = per_user_limit or JOB_QUEUE_CONFIG['per_user_limit']
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # 같은 DB를 여는 다른 프로세스/큐와 구분하는 실행자 ID
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._local = threading.local()
+        self._cond = threading.Condition()
+        self._running = {}  # 사용자별 실행 중 작업 수
+        self._active = 0
+        self._stopped = False
+        self._last_heartbeat = 0.0
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        for name, column_type in _ADDED_COLUMNS:
+            if name not in columns:
+                conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {column_type}")
+        conn.commit()
+        # 생존 신호가 끊긴(실행하던 프로세스가 종료된) 작업만 다시 대기열로
+        self._requeue_stale(conn)
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="job-worker")
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="job-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def submit(self, kind, params, user="anonymous"):
+        """작업 추가 후 작업 ID 반환 (같은 작업이 대기/실행 중이면 그 ID)"""
+        if kind not in _handlers:
+            raise ValueError(f"알 수 없는 작업 종류: {kind}")
+        key = _dedupe_key(kind, params)
+        now = time.time()
+        conn = self._connection()
+        with self._cond:
+            with conn:
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE dedupe_key = ? AND status IN (?, ?) ORDER BY created_at LIMIT 1",
+                    (key,) + ACTIVE_STATUSES
+                ).fetchone()
+                if row:
+                    job_id = row[0]
+                else:
+                    job_id = uuid.uuid4().hex
+                    conn.execute(
+                        "INSERT INTO jobs (id, kind, params, dedupe_key, owner, status, created_at) "
+                        "VALUES (?, ?, ?, ?, ?, 'queued', ?)",
+                        (job_id, kind, json.dumps(params, ensure_ascii=False), key, user, now)
+                    )
+                conn.execute(
+                    "INSERT OR IGNORE INTO job_users (job_id, user, submitted_at) VALUES (?, ?, ?)",
+                    (job_id, user, now)
+                )
+            self._cond.notify_all()
+        return job_id
+
+    def status(self, job_id):
+        """작업 상태 dict (없으면 None)"""
+        row = self._connection().execute(
+            "SELECT id, kind, params, owner, status, progress_done, progress_total, error, "
+            "created_at, started_at, finished_at FROM jobs WHERE id = ?",
+            (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        job_id, kind, params, owner, status, done, total, error, created_at, started_at, finished_at = row
+        return {
+            'id': job_id,
+            'kind': kind,
+            'params': json.loads(params),
+            'owner': owner,
+            'status': status,
+            'progress': {'done': done, 'total': total},
+            'error': error,
+            'created_at': created_at,
+            'started_at': started_at,
+            'finished_at': finished_at
+        }
+
+    def result(self, job_id):
+        """완료된 작업 결과 (완료 전이거나 실패했으면 None)"""
+        row = self._connection().execute(
+            "SELECT result FROM jobs WHERE id = ? AND status = 'done'", (job_id,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+
+    def list_jobs(self, user, limit=20):
+        """사용자가 제출한(공유 포함) 최근 작업 상태 목록"""
+        rows = self._connection().execute(
+            "SELECT job_id FROM job_users WHERE user = ? ORDER BY submitted_at DESC LIMIT ?", (user, limit)
+        ).fetchall()
+        return [job for job in (self.status(job_id) for job_id, in rows) if job]
+
+    def cancel(self, job_id):
+        """대기 중이면 바로 취소, 실행 중이면 다음 진행률 보고 때 중단"""
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = 'queued'",
+                (time.time(), job_id)
+            )
+            conn.execute("UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'", (job_id,))
+
+    def purge(self, days=None):
+        """완료/실패/취소 후 days일이 지난 작업 삭제, 삭제 건수 반환"""
+        days = JOB_QUEUE_CONFIG['keep_days'] if days is None else days
+        cutoff = time.time() - days * 86400
+        conn = self._connection()
+        with conn:
+            deleted = conn.execute(
+                "DELETE FROM jobs WHERE status NOT IN (?, ?) AND finished_at < ?", ACTIVE_STATUSES + (cutoff,)
+            ).rowcount
+            conn.execute("DELETE FROM job_users WHERE job_id NOT IN (SELECT id FROM jobs)")
+        return deleted
+
+    def _requeue_stale(self, conn):
+        """생존 신호가 JOB_QUEUE_CONFIG['stale_after']초 넘게 끊긴 실행 중 작업을 대기열로 되돌림"""
+        cutoff = time.time() - JOB_QUEUE_CONFIG['stale_after']
+        with conn:
+            requeued = conn.execute(
+                "UPDATE jobs SET status = 'queued', started_at = NULL, worker_id = NULL, heartbeat_at = NULL "
+                "WHERE status = 'running' AND COALESCE(heartbeat_at, started_at, 0) < ?",
+                (cutoff,)
+            ).rowcount
+        if requeued:
+            with self._cond:
+                self._cond.notify_all()
+        return requeued
+
+    def _heartbeat(self, conn):
+        """이 큐가 실행 중인 작업의 생존 신호 갱신 + 다른 프로세스가 남긴 끊긴 작업 회수"""
+        now = time.time()
+        if now - self._last_heartbeat < JOB_QUEUE_CONFIG['heartbeat_interval']:
+            return
+        self._last_heartbeat = now
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE worker_id = ? AND status = 'running'",
+                (now, self.worker_id)
+            )
+        self._requeue_stale(conn)
+
+    def _next_job(self, conn):
+        """실행 한도 안에서 가장 오래된 대기 작업 (사용자별 동시 실행 수 제한)"""
+        if self._active >= self.workers:
+            return None
+        rows = conn.execute(
+            "SELECT id, kind, params, owner FROM jobs WHERE status = 'queued' ORDER BY created_at"
+        ).fetchall()
+        for row in rows:
+            if self._running.get(row[3], 0) < self.per_user_limit:
+                return row
+        return None
+
+    def _dispatch_loop(self):
+        conn = self._connection()
+        while True:
+            self._heartbeat(conn)
+            with self._cond:
+                if self._stopped:
+                    return
+                job = self._next_job(conn)
+                if job is None:
+                    self._cond.wait(timeout=1.0)
+                    continue
+                job_id, kind, params, owner = job
+                now = time.time()
+                with conn:
+                    # 조회 후 취소되었거나 다른 프로세스가 먼저 가져간 작업은 건너뜀
+                    claimed = conn.execute(
+                        "UPDATE jobs SET status = 'running', started_at = ?, worker_id = ?, heartbeat_at = ? "
+                        "WHERE id = ? AND status = 'queued'",
+                        (now, self.worker_id, now, job_id)
+                    ).rowcount
+                if not claimed:
+                    continue
+                self._running[owner] = self._running.get(owner, 0) + 1
+                self._active += 1
+            self._executor.submit(self._run, job_id, kind, json.loads(params), owner)
+
+    def _run(self, job_id, kind, params, owner):
+        conn = self._connection()
+
+        def report(done, total):
+            with conn:
+                conn.execute(
+                    "UPDATE jobs SET progress_done = ?, progress_total = ?, heartbeat_at = ? "
+                    "WHERE id = ? AND worker_id = ?",
+                    (done, total, time.time(), job_id, self.worker_id)
+                )
+            row = conn.execute(
+                "SELECT cancel_requested, worker_id FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+            # 취소 요청 또는 생존 신호가 끊겨 다른 실행자에게 넘어간 경우 중단
+            if row is None or row[0] or row[1] != self.worker_id:
+                raise JobCancelled(job_id)
+
+        try:
+            result = _handlers[kind](params, report)
+            payload = zlib.compress(json.dumps(result, ensure_ascii=False, default=str).encode('utf-8'))
+            status, error = 'done', None
+        except JobCancelled:
+            payload, status, error = None, 'cancelled', None
+        except Exception as e:
+            print(f"작업 실행 오류 ({kind}, {job_id}): {e}")
+            payload, status, error = None, 'failed', str(e)
+
+        try:
+            with conn:
+                # 다른 실행자에게 넘어간 작업의 상태는 덮어쓰지 않음
+                conn.execute(
+                    "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ? "
+                    "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                    (status, payload, error, time.time(), job_id, self.worker_id)
+                )
+        finally:
+            with self._cond:
+                self._running[owner] -= 1
+                self._active -= 1
+                self._cond.notify_all()
+
+    def shutdown(self, wait=True):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._executor.shutdown(wait=wait)
+
+
+def get_job_queue():
+    """프로세스 공유 작업 큐 (Streamlit 세션/재실행 간 공유)"""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue()
+    return _queue
+
+
+@register_job_handler('rank_check')
+def _rank_check_job(params, report):
+    """params: keywords, mall_name, max_pages, items_per_page, sort"""
+    from utils.rank_search import search_product_ranks
+
+    return search_product_ranks(
+        params['keywords'], params['mall_name'],
+        max_pages=params.get('max_pages'),
+        items_per_page=params.get('items_per_page'),
+        sort=params.get('sort', 'sim'),
+        progress_callback=lambda done, total, results: report(done, total)
+    )
+
+
+@register_job_handler('monthly_trends')
+def _monthly_trends_job(params, report):
+    """params: keywords, start_date, end_date, time_unit, device, ages, gender"""
+    from utils.datalab_series import get_datalab_series
+
+    keywords = params['keywords']
+    report(0, len(keywords))
+    df = get_datalab_series(
+        keywords, params['start_date'], params['end_date'],
+        params.get('time_unit', 'month'), params.get('device', ''), params.get('ages', []), params.get('gender', '')
+    )
+    report(len(keywords), len(keywords))
+    return df.to_dict('records')
+
+
+@register_job_handler('keyword_expansion')
+def _keyword_expansion_job(params, report):
+    """params: seed, max_depth, top_n, max_nodes, max_requests"""
+    from utils.keyword_expansion import iter_keyword_expansion
+
+    max_requests = params.get('max_requests')
+    graph = None
+    for _, _, graph in iter_keyword_expansion(
+        params['seed'],
+        max_depth=params.get('max_depth'),
+        top_n=params.get('top_n'),
+        max_nodes=params.get('max_nodes'),
+        max_requests=max_requests
+    ):
+        report(graph.requests, max(max_requests or graph.requests, graph.requests))
+    if graph is None:
+        return {'nodes': [], 'edges': []}
+    return {'nodes': graph.to_records(), 'edges': graph.edges}
@@ -0,0 +1,142 @@
+"""
+JSON 디코더 (응답 바이트를 바로 파싱 / 키워드 도구 keywordList 스트리밍 파싱)
+
+orjson이 설치되어 있으면 orjson으로, 없으면 표준 json으로 응답 바이트를 문자열로 바꾸지 않고 파싱합니다.
+사용할 디코더는 config.py의 HTTP_CONFIG['json_decoder']('auto' / 'orjson' / 'json')로 고를 수 있습니다.
+"""
+import codecs
+import json
+import threading
+
+from config import HTTP_CONFIG
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 스트리밍 파서가 keywordList 배열 시작을 찾을 때 쓰는 키
+KEYWORD_LIST_KEY = '"keywordList"'
+
+_decoders = {'json': json.loads}
+if orjson is not None:
+    _decoders['orjson'] = orjson.loads
+
+_decoder = None
+_decoder_lock = threading.Lock()
+
+_raw_decoder = json.JSONDecoder()
+
+
+def _resolve_decoder(name):
+    if name == 'auto':
+        return 'orjson' if orjson is not None else 'json'
+    if name not in _decoders:
+        raise ValueError(f"사용할 수 없는 JSON 디코더: {name} (가능: auto, {', '.join(_decoders)})")
+    return name
+
+
+def set_json_decoder(name):
+    """JSON 디코더 변경 ('auto' / 'orjson' / 'json'), 실제 사용하는 디코더 이름 반환"""
+    global _decoder
+    resolved = _resolve_decoder(name)
+    with _decoder_lock:
+        _decoder = (resolved, _decoders[resolved])
+    return resolved
+
+
+def _get_decoder():
+    """(이름, 파싱 함수) - 처음 사용할 때 HTTP_CONFIG['json_decoder']로 결정"""
+    global _decoder
+    if _decoder is None:
+        with _decoder_lock:
+            if _decoder is None:
+                resolved = _resolve_decoder(HTTP_CONFIG.get('json_decoder', 'auto'))
+                _decoder = (resolved, _decoders[resolved])
+    return _decoder
+
+
+def get_json_decoder():
+    """현재 사용하는 JSON 디코더 이름"""
+    return _get_decoder()[0]
+
+
+def loads(data):
+    """JSON 바이트(또는 문자열) 파싱"""
+    return _get_decoder()[1](data)
+
+
+def _skip_whitespace(buffer, pos):
+    while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+        pos += 1
+    return pos
+
+
+def iter_keyword_list(chunks):
+    """키워드 도구 응답 바이트 조각에서 keywordList 행을 하나씩 yield (전체 목록을 만들지 않음)
+
+    chunks: bytes 조각 iterable (예: response.iter_content(65536))
+    응답 최상위의 "keywordList" 배열만 읽고, 배열이 끝나면 나머지 본문은 읽지 않습니다.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    chunks = iter(chunks)
+    buffer = ''
+    pos = 0
+    exhausted = False
+
+    def read_more():
+        nonlocal buffer, pos, exhausted
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer = buffer[pos:] + decoder.decode(b'', final=True)
+        else:
+            buffer = buffer[pos:] + decoder.decode(chunk)
+        pos = 0
+
+    # "keywordList": [ 찾기
+    while True:
+        index = buffer.find(KEYWORD_LIST_KEY, pos)
+        if index >= 0:
+            pos = index + len(KEYWORD_LIST_KEY)
+            break
+        if exhausted:
+            return
+        # 키가 조각 경계에 걸친 경우를 위해 끝부분은 남겨 둠
+        pos = max(0, len(buffer) - len(KEYWORD_LIST_KEY))
+        read_more()
+
+    for expected in ':[':
+        while True:
+            pos = _skip_whitespace(buffer, pos)
+            if pos < len(buffer):
+                break
+            if exhausted:
+                raise ValueError("keywordList 배열이 끝나기 전에 본문이 끝났습니다")
+            read_more()
+        if buffer[pos] != expected:
+            raise ValueError(f"keywordList 형식 오류: '{expected}' 위치에 '{buffer[pos]}'")
+        pos += 1
+
+    while True:
+        pos = _skip_whitespace(buffer, pos)
+        if pos >= len(buffer):
+            if exhausted:
+                raise ValueError("keywordList 배열이 끝나기 전에 본문이 끝났습니다")
+            read_more()
+            continue
+        if buffer[pos] == ']':
+            return
+        if buffer[pos] == ',':
+            pos += 1
+            continue
+        try:
+            row, end = _raw_decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # 행이 조각 경계에 걸림 - 다음 조각을 붙여 다시 파싱
+            if exhausted:
+                raise
+            read_more()
+            continue
+        pos = end
+        yield row
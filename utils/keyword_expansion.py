@@ -0,0 +1,167 @@
+"""
+키워드 도구 기반 다단계 연관키워드 확장 (우선순위 BFS + 동시 조회)
+
+시드 키워드의 연관키워드 중 상위 N개를 다시 확장하는 과정을 깊이/요청 한도까지 반복합니다.
+각 단계 조회는 get_keyword_stats_for_powerlink(응답 캐시 + 'keywordstool' 토큰 버킷)를 그대로 쓰므로
+같은 키워드를 다시 확장하면 API를 호출하지 않습니다.
+"""
+import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from config import KEYWORD_EXPANSION_CONFIG
+from utils.naver_api import get_keyword_stats_for_powerlink, parse_powerlink_keywords, _keywordstool_key
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """확장 단계 조회용 공유 스레드 풀 (실제 요청 속도는 'keywordstool' 토큰 버킷이 제한)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=KEYWORD_EXPANSION_CONFIG['workers'],
+                    thread_name_prefix="keyword-expansion"
+                )
+    return _executor
+
+
+class KeywordGraph:
+    """중복 제거된 키워드 그래프 (노드: 키워드별 검색량/경쟁정도, 간선: 확장한 키워드 → 연관키워드)"""
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.nodes = {}
+        self.edges = []
+        self._edge_keys = set()
+        self.requests = 0
+        self.failed = 0
+        self.add_node({'keyword': seed}, depth=0, parent=None)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, keyword):
+        return _keywordstool_key(keyword) in self.nodes
+
+    def add_node(self, row, depth, parent):
+        """처음 본 키워드면 노드를 추가하고 반환 (이미 있으면 None)"""
+        key = _keywordstool_key(row['keyword'])
+        if key in self.nodes:
+            return None
+        node = dict(row)
+        node['depth'] = depth
+        node['parent'] = parent
+        node['expanded'] = False
+        self.nodes[key] = node
+        return node
+
+    def add_edge(self, parent, child):
+        edge = (_keywordstool_key(parent), _keywordstool_key(child))
+        if edge[0] != edge[1] and edge not in self._edge_keys:
+            self._edge_keys.add(edge)
+            self.edges.append((parent, child))
+
+    def node(self, keyword):
+        return self.nodes.get(_keywordstool_key(keyword))
+
+    def to_records(self):
+        """노드 목록 (깊이, 검색량 내림차순)"""
+        return sorted(
+            self.nodes.values(),
+            key=lambda node: (node['depth'], -node.get('monthly_searches', 0))
+        )
+
+
+def iter_keyword_expansion(seed, max_depth=None, top_n=None, max_nodes=None, max_requests=None,
+                           customer_id="3811341"):
+    """시드 키워드를 다단계로 확장하며 조회가 끝날 때마다 (확장한 키워드, 새 노드 목록, 그래프)를 yield
+
+    얕은 깊이부터, 같은 깊이에서는 검색량이 많은 키워드부터 확장합니다(우선순위 BFS).
+    max_depth: 확장 단계 수 (1이면 기존 get_powerlink_related_keywords와 같은 한 단계)
+    top_n: 노드마다 다시 확장할 상위 연관키워드 수
+    max_nodes / max_requests: 그래프 크기 / API 요청 수 한도
+    호출 측이 중간에 멈추면(break / close) 아직 시작하지 않은 조회는 취소됩니다.
+    """
+    max_depth = max_depth or KEYWORD_EXPANSION_CONFIG['max_depth']
+    top_n = top_n or KEYWORD_EXPANSION_CONFIG['top_n']
+    max_nodes = max_nodes or KEYWORD_EXPANSION_CONFIG['max_nodes']
+    max_requests = max_requests or KEYWORD_EXPANSION_CONFIG['max_requests']
+    workers = KEYWORD_EXPANSION_CONFIG['workers']
+
+    graph = KeywordGraph(seed)
+    executor = _get_executor()
+    # (깊이, -검색량, 추가 순서, 키워드)
+    frontier = [(0, 0, 0, seed)]
+    sequence = 1
+    in_flight = {}
+
+    try:
+        while frontier or in_flight:
+            while frontier and len(in_flight) < workers and graph.requests < max_requests:
+                depth, _, _, keyword = heapq.heappop(frontier)
+                future = executor.submit(get_keyword_stats_for_powerlink, keyword, customer_id)
+                in_flight[future] = (keyword, depth)
+                graph.requests += 1
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                keyword, depth = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"키워드 확장 오류 ({keyword}): {e}")
+                    result = None
+
+                rows = parse_powerlink_keywords(result, keyword) if result and 'keywordList' in result else None
+                if rows is None:
+                    graph.failed += 1
+                    rows = []
+                graph.node(keyword)['expanded'] = True
+
+                added = []
+                for row in rows:
+                    if len(graph) >= max_nodes and row['keyword'] not in graph:
+                        break
+                    node = graph.add_node(row, depth + 1, keyword)
+                    graph.add_edge(keyword, row['keyword'])
+                    if node is not None:
+                        added.append(node)
+
+                # 새로 찾은 키워드 중 상위 N개만 다음 단계로 (parse_powerlink_keywords 정렬 순서)
+                if depth + 1 < max_depth:
+                    for node in added[:top_n]:
+                        heapq.heappush(frontier, (depth + 1, -node['monthly_searches'], sequence, node['keyword']))
+                        sequence += 1
+
+                yield keyword, added, graph
+    finally:
+        for future in in_flight:
+            future.cancel()
+
+
+def expand_keywords(seed, max_depth=None, top_n=None, max_nodes=None, max_requests=None,
+                    customer_id="3811341", progress_callback=None):
+    """시드 키워드 다단계 확장 결과 그래프 반환
+
+    progress_callback(graph)는 조회가 끝날 때마다 호출한 스레드에서 실행되므로
+    Streamlit 표/그래프를 바로 갱신할 수 있습니다.
+    """
+    graph = None
+    for _, _, graph in iter_keyword_expansion(
+        seed,
+        max_depth=max_depth,
+        top_n=top_n,
+        max_nodes=max_nodes,
+        max_requests=max_requests,
+        customer_id=customer_id
+    ):
+        if progress_callback:
+            progress_callback(graph)
+    return graph if graph is not None else KeywordGraph(seed)
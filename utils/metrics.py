@@ -0,0 +1,214 @@
+"""
+API 요청 계측 (고정 크기 링 버퍼 + 누적 카운터)
+
+모든 외부 요청의 API 계열, 경로, 지연시간, 상태 코드, 응답 크기, 재시도 수, 속도 제한 대기 시간과
+캐시 적중/실패를 기록합니다. 최근 요청은 METRICS_CONFIG['buffer_size']개까지만 보관하고
+(오래된 것부터 버림), 누적 카운터는 계열/상태별 합계만 유지하므로 메모리가 늘어나지 않습니다.
+JSON 스냅샷(snapshot)과 Prometheus 텍스트 형식(prometheus_text)으로 내보냅니다.
+"""
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from config import METRICS_CONFIG
+from utils.singleflight import get_singleflight_stats
+
+_events = deque(maxlen=METRICS_CONFIG['buffer_size'])
+_events_lock = threading.Lock()
+
+# 누적 카운터 (프로세스 시작 이후)
+_request_totals = {}
+_cache_totals = {}
+
+_server = None
+
+
+def record_request(family, endpoint, latency, status_code, size=0, retries=0, limiter_wait=0.0):
+    """최종 응답 하나 기록 (status_code 0은 연결 실패)"""
+    now = time.time()
+    with _events_lock:
+        _events.append((now, family, endpoint, latency, status_code, size, retries, limiter_wait))
+        totals = _request_totals.setdefault((family, status_code), {
+            'requests': 0, 'latency': 0.0, 'bytes': 0, 'retries': 0, 'limiter_wait': 0.0
+        })
+        totals['requests'] += 1
+        totals['latency'] += latency
+        totals['bytes'] += size
+        totals['retries'] += retries
+        totals['limiter_wait'] += limiter_wait
+
+
+def record_cache(endpoint, hit):
+    """캐시 조회 결과 기록"""
+    with _events_lock:
+        counts = _cache_totals.setdefault(endpoint, {'hits': 0, 'misses': 0})
+        counts['hits' if hit else 'misses'] += 1
+
+
+def reset_metrics():
+    with _events_lock:
+        _events.clear()
+        _request_totals.clear()
+        _cache_totals.clear()
+
+
+def _percentiles(values):
+    if not values:
+        return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+    p50, p95, p99 = np.percentile(np.array(values) * 1000, [50, 95, 99])
+    return {'p50': round(float(p50), 1), 'p95': round(float(p95), 1), 'p99': round(float(p99), 1)}
+
+
+def snapshot(window=None):
+    """API 계열별 최근 window초 처리량/꼬리 지연시간과 누적 카운터 (JSON 직렬화 가능)"""
+    window = window or METRICS_CONFIG['window']
+    now = time.time()
+    with _events_lock:
+        recent = [event for event in _events if event[0] >= now - window]
+        request_totals = {key: dict(value) for key, value in _request_totals.items()}
+        cache_totals = {key: dict(value) for key, value in _cache_totals.items()}
+
+    families = {}
+    for ts, family, endpoint, latency, status_code, size, retries, limiter_wait in recent:
+        entry = families.setdefault(family, {
+            'requests': 0, 'errors': 0, 'bytes': 0, 'retries': 0, 'limiter_wait': 0.0,
+            'latencies': [], 'endpoints': {}
+        })
+        entry['requests'] += 1
+        entry['errors'] += status_code == 0 or status_code >= 400
+        entry['bytes'] += size
+        entry['retries'] += retries
+        entry['limiter_wait'] += limiter_wait
+        entry['latencies'].append(latency)
+        entry['endpoints'][endpoint] = entry['endpoints'].get(endpoint, 0) + 1
+
+    recent_stats = {}
+    for family, entry in families.items():
+        latencies = entry.pop('latencies')
+        recent_stats[family] = dict(
+            entry,
+            throughput=round(entry['requests'] / window, 3),
+            latency_ms=_percentiles(latencies),
+            avg_bytes=int(entry['bytes'] / entry['requests']),
+            limiter_wait=round(entry['limiter_wait'], 3)
+        )
+
+    totals = {}
+    for (family, status_code), values in request_totals.items():
+        totals.setdefault(family, {})[str(status_code)] = values
+
+    return {
+        'timestamp': now,
+        'window_sec': window,
+        'buffered_events': len(recent),
+        'recent': recent_stats,
+        'totals': totals,
+        'cache': cache_totals,
+        'coalesced': get_singleflight_stats()
+    }
+
+
+def recent_events(window=None):
+    """최근 window초 요청 목록 (관리 페이지 차트용)"""
+    window = window or METRICS_CONFIG['window']
+    since = time.time() - window
+    with _events_lock:
+        events = [event for event in _events if event[0] >= since]
+    return [
+        {
+            'timestamp': ts, 'family': family, 'endpoint': endpoint, 'latency_ms': round(latency * 1000, 1),
+            'status_code': status_code, 'bytes': size, 'retries': retries, 'limiter_wait': limiter_wait
+        }
+        for ts, family, endpoint, latency, status_code, size, retries, limiter_wait in events
+    ]
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+def prometheus_text():
+    """Prometheus 텍스트 형식 메트릭 (누적 카운터 + 최근 구간 지연시간 분위수)"""
+    data = snapshot()
+    lines = [
+        '# HELP naver_api_requests_total Outbound Naver API requests by family and status.',
+        '# TYPE naver_api_requests_total counter'
+    ]
+    sums = []
+    for family, by_status in sorted(data['totals'].items()):
+        for status_code, values in sorted(by_status.items()):
+            labels = f'family="{_label(family)}",status="{status_code}"'
+            lines.append(f'naver_api_requests_total{{{labels}}} {values["requests"]}')
+            sums.append((labels, values))
+
+    for name, key, help_text in (
+        ('naver_api_request_seconds_total', 'latency', 'Total request latency in seconds.'),
+        ('naver_api_response_bytes_total', 'bytes', 'Total response body bytes.'),
+        ('naver_api_retries_total', 'retries', 'Retried attempts before the final response.'),
+        ('naver_api_rate_limit_wait_seconds_total', 'limiter_wait', 'Time spent waiting for rate limit tokens.')
+    ):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} counter')
+        for labels, values in sums:
+            lines.append(f'{name}{{{labels}}} {values[key]}')
+
+    lines.append(f'# HELP naver_api_request_latency_ms Request latency quantiles over the last {data["window_sec"]}s.')
+    lines.append('# TYPE naver_api_request_latency_ms gauge')
+    for family, stats in sorted(data['recent'].items()):
+        for quantile, key in (('0.5', 'p50'), ('0.95', 'p95'), ('0.99', 'p99')):
+            lines.append(
+                f'naver_api_request_latency_ms{{family="{_label(family)}",quantile="{quantile}"}} '
+                f'{stats["latency_ms"][key]}'
+            )
+
+    lines.append('# HELP naver_api_cache_requests_total Response cache lookups by endpoint and result.')
+    lines.append('# TYPE naver_api_cache_requests_total counter')
+    for endpoint, counts in sorted(data['cache'].items()):
+        for key, result in (('hits', 'hit'), ('misses', 'miss')):
+            lines.append(
+                f'naver_api_cache_requests_total{{endpoint="{_label(endpoint)}",result="{result}"}} {counts[key]}'
+            )
+
+    lines.append('# HELP naver_api_singleflight_calls_total Cache-miss calls by endpoint, and how many joined an in-flight call.')
+    lines.append('# TYPE naver_api_singleflight_calls_total counter')
+    for endpoint, stats in sorted(data['coalesced'].items()):
+        lines.append(f'naver_api_singleflight_calls_total{{endpoint="{_label(endpoint)}",result="executed"}} '
+                     f'{stats["calls"] - stats["coalesced"]}')
+        lines.append(f'naver_api_singleflight_calls_total{{endpoint="{_label(endpoint)}",result="coalesced"}} '
+                     f'{stats["coalesced"]}')
+    return '\n'.join(lines) + '\n'
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith('/metrics.json'):
+            body = json.dumps(snapshot(), ensure_ascii=False).encode('utf-8')
+            content_type = 'application/json; charset=utf-8'
+        elif self.path.startswith('/metrics'):
+            body = prometheus_text().encode('utf-8')
+            content_type = 'text/plain; version=0.0.4; charset=utf-8'
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port=None, host='127.0.0.1'):
+    """/metrics(Prometheus) 와 /metrics.json 을 제공하는 백그라운드 HTTP 서버 시작 (이미 실행 중이면 재사용)"""
+    global _server
+    if _server is None:
+        _server = ThreadingHTTPServer((host, port or METRICS_CONFIG['port']), _MetricsHandler)
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+    return _server
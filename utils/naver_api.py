@@ -1,83 +1,181 @@
 """
 네이버 API 관련 유틸리티
 """
-import json
-import urllib.request
-import urllib.parse
-import time
-import requests
-import hashlib
-import hmac
-import base64
-from config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET, NAVER_AD_CUSTOMER_ID, NAVER_AD_ACCESS_LICENSE, NAVER_AD_SECRET_KEY
-
-
-def make_naver_request(url, query_params=None, headers=None):
+import random
+import re
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from utils import http_client, json_codec, metrics
+from utils.cache import cached_api, get_cache, make_cache_key
+from utils.records import PowerlinkKeywordBatch, ShoppingItemBatch
+from utils.relevance import RelevanceScorer, top_k_indices
+from utils.searchad import get_searchad_client
+from config import NAVER_CLIENT_ID, NAVER_CLIENT_SECRET
+from config import SEARCH_CONFIG, RELATED_KEYWORD_CONFIG, FIXTURE_CONFIG
+
+# 키워드 도구 API의 hintKeywords 최대 개수
+KEYWORDSTOOL_BATCH_SIZE = 5
+
+
+# 쇼핑 검색 API의 start 최대값
+SHOPPING_MAX_START = 1000
+
+KEYWORDSTOOL_URI = "/keywordstool"
+SHOPPING_URL = "https://openapi.naver.com/v1/search/shop.json"
+DATALAB_URL = "https://openapi.naver.com/v1/datalab/search"
+
+_page_executor = None
+_page_executor_lock = threading.Lock()
+
+# 연관 키워드에서 제외할 일반 단어
+RELATED_KEYWORD_STOPWORDS = frozenset([
+    '상품', '제품', '용품', '아이템', '개', '원', '배송', '무료', 
+    '빠른', '당일', '택배', '특가', '할인', '세트', '키트',
+    '브랜드', '정품', '공식', '국내', '해외', '신상', '최신',
+    '인기', '베스트', '추천', '리뷰', '후기', '평점', '별점',
+    '그램', '사이즈', '컬러', '색상', '옵션', '선택'
+])
+
+_TITLE_CLEAN_RE = re.compile(r'</?b>|[\[\]()]')
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+
+
+def _openapi_headers(headers=None):
+    """오픈 API 인증 헤더"""
+    request_headers = {
+        "X-Naver-Client-Id": NAVER_CLIENT_ID,
+        "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
+    }
+    if headers:
+        request_headers.update(headers)
+    return request_headers
+
+
+def make_naver_request(url, query_params=None, headers=None, rate_family="search"):
     """네이버 API 요청 공통 함수"""
     try:
-        if query_params:
-            url += "?" + urllib.parse.urlencode(query_params)
-        
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", NAVER_CLIENT_ID)
-        request.add_header("X-Naver-Client-Secret", NAVER_CLIENT_SECRET)
-        
-        if headers:
-            for key, value in headers.items():
-                request.add_header(key, value)
-        
-        response = urllib.request.urlopen(request)
-        return json.loads(response.read().decode('utf-8'))
+        return http_client.request_json(
+            "GET", url,
+            params=query_params,
+            headers=_openapi_headers(headers),
+            rate_family=rate_family
+        )
     except Exception as e:
         print(f"API 요청 오류: {e}")
         return None
 
 
-def search_naver_shopping(keyword, display=10, start=1, sort="sim"):
-    """네이버 쇼핑 검색 (개선된 버전)"""
-    url = "https://openapi.naver.com/v1/search/shop.json"
-    params = {
+def _shopping_params(keyword, display, start, sort):
+    return {
         "query": keyword,
         "display": min(display, 100),  # 최대 100개로 제한
         "start": start,
         "sort": sort
     }
-    
-    # 요청 간격 조절 (API 제한 방지)
-    time.sleep(0.1)
-    
+
+
+def _clean_shopping_result(result):
+    """쇼핑 검색 결과 정제 (<b> 태그 제거, 가격 정수 변환)"""
+    if result and 'items' in result:
+        for item in result['items']:
+            # HTML 태그 제거
+            if 'title' in item:
+                item['title'] = item['title'].replace('<b>', '').replace('</b>', '')
+            
+            # 가격 정보 정제
+            if 'lprice' in item:
+                try:
+                    item['lprice'] = int(item['lprice'])
+                except:
+                    item['lprice'] = 0
+            
+            if 'hprice' in item:
+                try:
+                    item['hprice'] = int(item['hprice'])
+                except:
+                    item['hprice'] = 0
+    return result
+
+
+@cached_api('shopping')
+def search_naver_shopping(keyword, display=10, start=1, sort="sim"):
+    """네이버 쇼핑 검색 (개선된 버전)"""
     try:
-        result = make_naver_request(url, params)
-        if result and 'items' in result:
-            # 결과 정제
-            for item in result['items']:
-                # HTML 태그 제거
-                if 'title' in item:
-                    item['title'] = item['title'].replace('<b>', '').replace('</b>', '')
-                
-                # 가격 정보 정제
-                if 'lprice' in item:
-                    try:
-                        item['lprice'] = int(item['lprice'])
-                    except:
-                        item['lprice'] = 0
-                
-                if 'hprice' in item:
-                    try:
-                        item['hprice'] = int(item['hprice'])
-                    except:
-                        item['hprice'] = 0
-        
-        return result
+        result = make_naver_request(SHOPPING_URL, _shopping_params(keyword, display, start, sort))
+        return _clean_shopping_result(result)
     except Exception as e:
         print(f"네이버 쇼핑 검색 오류: {e}")
         return None
 
 
-def get_datalab_trends(keywords, start_date, end_date, time_unit="month", device="", ages=[], gender=""):
-    """네이버 DataLab 트렌드 조회 (개선된 버전)"""
-    url = "https://openapi.naver.com/v1/datalab/search"
+def get_page_executor():
+    """페이지 조회용 공유 스레드 풀 (동시 요청 수: SEARCH_CONFIG['max_workers'])"""
+    global _page_executor
+    if _page_executor is None:
+        with _page_executor_lock:
+            if _page_executor is None:
+                _page_executor = ThreadPoolExecutor(
+                    max_workers=SEARCH_CONFIG['max_workers'],
+                    thread_name_prefix="shopping-page"
+                )
+    return _page_executor
+
+
+def iter_shopping_pages(keyword, max_pages=None, display=100, sort="sim", prefetch=None):
+    """쇼핑 검색 결과를 페이지 단위로 yield ((start, 정제된 items) / 실패한 페이지는 items=None)
+
+    첫 페이지는 단독으로 요청해 1페이지에서 끝나는 경우 요청 한 번으로 끝나고,
+    다음 페이지가 필요해지면 앞쪽 페이지를 처리하는 동안 뒤 페이지를 미리 요청합니다
+    (미리 요청하는 페이지 수는 1, 2, 4...로 prefetch까지 늘어남).
+    호출 측이 중간에 멈추면(break / close) 아직 시작하지 않은 요청은 취소됩니다.
+    """
+    max_pages = max_pages or SEARCH_CONFIG['max_search_pages']
+    prefetch = SEARCH_CONFIG['max_workers'] - 1 if prefetch is None else prefetch
+    display = min(display, 100)
+    starts = [
+        1 + page * display
+        for page in range(max_pages)
+        if 1 + page * display <= SHOPPING_MAX_START
+    ]
+    
+    executor = get_page_executor()
+    pending = deque()
+    next_index = 0
+    window = 0
     
+    try:
+        while next_index < len(starts) or pending:
+            while next_index < len(starts) and len(pending) <= window:
+                start = starts[next_index]
+                pending.append((start, executor.submit(search_naver_shopping, keyword, display, start, sort)))
+                next_index += 1
+            
+            start, future = pending.popleft()
+            result = future.result()
+            items = result.get('items', []) if result else None
+            window = min(max(window * 2, 1), prefetch)
+            
+            yield start, items
+            
+            # 마지막 페이지 (결과가 display보다 적음)
+            if items is not None and len(items) < display:
+                break
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def fetch_shopping_batch(keyword, max_pages=None, display=100, sort="sim"):
+    """키워드의 쇼핑 검색 결과 전체를 열 단위 배치(ShoppingItemBatch)로 반환 (rank는 전체 순위)"""
+    return ShoppingItemBatch.from_pages(
+        keyword, iter_shopping_pages(keyword, max_pages=max_pages, display=display, sort=sort)
+    )
+
+
+def _datalab_body(keywords, start_date, end_date, time_unit, device, ages, gender):
+    """DataLab 요청 본문 생성"""
     # 키워드 그룹 생성 (최대 5개로 제한)
     keyword_groups = []
     for i, keyword in enumerate(keywords[:5]):
@@ -99,134 +197,131 @@ def get_datalab_trends(keywords, start_date, end_date, time_unit="month", device
         data["ages"] = ages
     if gender:
         data["gender"] = gender
+    return data
+
+
+@cached_api('datalab')
+def get_datalab_trends(keywords, start_date, end_date, time_unit="month", device="", ages=[], gender=""):
+    """네이버 DataLab 트렌드 조회 (개선된 버전)
+
+    요청당 키워드는 5개까지만 보내므로, 더 많은 키워드는 utils.datalab.get_datalab_trends_batch를 사용하세요.
+    """
+    data = _datalab_body(keywords, start_date, end_date, time_unit, device, ages, gender)
     
     try:
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", NAVER_CLIENT_ID)
-        request.add_header("X-Naver-Client-Secret", NAVER_CLIENT_SECRET)
-        request.add_header("Content-Type", "application/json")
-        
-        response = urllib.request.urlopen(request, json.dumps(data).encode('utf-8'))
-        result = json.loads(response.read().decode('utf-8'))
-        
-        # 요청 간격 조절
-        time.sleep(0.1)
-        
-        return result
+        return http_client.request_json(
+            "POST", DATALAB_URL,
+            json_body=data,
+            headers=_openapi_headers({"Content-Type": "application/json"}),
+            rate_family="datalab"
+        )
     except Exception as e:
         print(f"DataLab API 요청 오류: {e}")
         return None
 
 
-def get_related_keywords_advanced(keyword):
-    """고급 연관 키워드 추출 (여러 소스 활용)"""
-    related_keywords = set()
+def extract_title_keywords(titles, keyword, min_count=2, limit=30):
+    """상품명 목록에서 연관 키워드 추출 (빈도순)
+
+    제목을 한 번에 정제/분리해 단어 빈도를 먼저 세고, 필터링과 특수문자 제거는
+    서로 다른 단어마다 한 번씩만 수행합니다.
+    """
+    keyword_lower = keyword.lower()
+    
+    # HTML 태그와 괄호를 제거한 뒤 전체 제목을 한 번에 분리
+    text = _TITLE_CLEAN_RE.sub('', '\n'.join(titles))
+    word_counts = Counter(text.split())
+    
+    keyword_freq = Counter()
+    for word, count in word_counts.items():
+        word_lower = word.lower()
+        # 더 엄격한 필터링
+        if (len(word) >= 2 and
+            keyword_lower not in word_lower and
+            word_lower not in keyword_lower and
+            not word.isdigit() and
+            word_lower not in RELATED_KEYWORD_STOPWORDS):
+            
+            clean_word = _NON_ALNUM_RE.sub('', word)
+            if len(clean_word) >= 2:
+                keyword_freq[clean_word] += count
+    
+    # 빈도수 기준으로 정렬 (최소 min_count번 이상 등장)
+    return [kw for kw, freq in keyword_freq.most_common(limit) if freq >= min_count]
+
+
+def fetch_shopping_items(keyword, sources):
+    """여러 (정렬, 페이지당 상품 수, 페이지 수) 조합의 모든 페이지를 동시에 조회해
+    productId 기준으로 중복 제거한 상품 목록 반환 (sources 순서 유지)"""
+    executor = get_page_executor()
+    futures = []
+    for sort, display, pages in sources:
+        display = min(display, 100)
+        for page in range(pages):
+            start = 1 + page * display
+            if start > SHOPPING_MAX_START:
+                break
+            futures.append(executor.submit(search_naver_shopping, keyword, display, start, sort))
+    
+    items = []
+    seen = set()
+    for future in futures:
+        result = future.result()
+        if not result or 'items' not in result:
+            continue
+        for item in result['items']:
+            product_key = item.get('productId') or (item.get('title'), item.get('mallName'))
+            if product_key in seen:
+                continue
+            seen.add(product_key)
+            items.append(item)
+    return items
+
+
+def get_related_keywords_advanced(keyword, sources=None):
+    """고급 연관 키워드 추출 (여러 정렬 기준의 검색 결과를 동시에 활용)
+
+    sources: (정렬, 페이지당 상품 수, 페이지 수) 목록, 기본값은 RELATED_KEYWORD_CONFIG['sources']
+    (유사도순 50개 / 최신순 30개 / 가격순 30개)
+    """
+    sources = sources or RELATED_KEYWORD_CONFIG['sources']
     
     try:
-        # 1. 기본 유사도 검색
-        data1 = search_naver_shopping(keyword, display=50, start=1, sort="sim")
-        
-        # 2. 최신순 검색 
-        data2 = search_naver_shopping(keyword, display=30, start=1, sort="date")
-        
-        # 3. 가격순 검색
-        data3 = search_naver_shopping(keyword, display=30, start=1, sort="asc")
-        
-        all_data = []
-        if data1 and 'items' in data1:
-            all_data.extend(data1['items'])
-        if data2 and 'items' in data2:
-            all_data.extend(data2['items'])
-        if data3 and 'items' in data3:
-            all_data.extend(data3['items'])
+        all_data = fetch_shopping_items(keyword, sources)
         
-        # 키워드 빈도 계산
-        keyword_freq = {}
-        
-        for item in all_data:
-            title = item.get('title', '')
-            # HTML 태그 제거
-            title = title.replace('<b>', '').replace('</b>', '')
-            
-            # 제목 정제
-            title = title.replace('[', '').replace(']', '')
-            title = title.replace('(', '').replace(')', '')
-            
-            words = title.split()
-            
-            for word in words:
-                # 더 엄격한 필터링
-                if (len(word) >= 2 and 
-                    keyword.lower() not in word.lower() and
-                    word.lower() not in keyword.lower() and
-                    not word.isdigit() and
-                    word.lower() not in [
-                        '상품', '제품', '용품', '아이템', '개', '원', '배송', '무료', 
-                        '빠른', '당일', '택배', '특가', '할인', '세트', '키트',
-                        '브랜드', '정품', '공식', '국내', '해외', '신상', '최신',
-                        '인기', '베스트', '추천', '리뷰', '후기', '평점', '별점',
-                        '그램', '사이즈', '컬러', '색상', '옵션', '선택'
-                    ]):
-                    
-                    clean_word = ''.join(c for c in word if c.isalnum())
-                    if len(clean_word) >= 2:
-                        keyword_freq[clean_word] = keyword_freq.get(clean_word, 0) + 1
-        
-        # 빈도수 기준으로 정렬 (최소 2번 이상 등장)
-        filtered_keywords = {k: v for k, v in keyword_freq.items() if v >= 2}
-        sorted_keywords = sorted(filtered_keywords.items(), key=lambda x: x[1], reverse=True)
-        
-        return [kw for kw, freq in sorted_keywords[:30]]
+        return extract_title_keywords(
+            [item.get('title', '') for item in all_data],
+            keyword,
+            min_count=RELATED_KEYWORD_CONFIG['min_count'],
+            limit=RELATED_KEYWORD_CONFIG['limit']
+        )
         
     except Exception as e:
         print(f"고급 연관 키워드 추출 오류: {e}")
         return []
 
 
+def _build_keywordstool_request(params, customer_id):
+    """검색광고 키워드 도구 API 요청 URL과 서명 헤더 생성"""
+    return get_searchad_client(customer_id).build_request(KEYWORDSTOOL_URI, params)
+
+
+def _keyword_stats_params(keyword):
+    """키워드 통계 조회 파라미터"""
+    return {'hintKeywords': keyword, 'showDetail': '1'}
+
+
+@cached_api('keywordstool')
 def get_keyword_stats(keyword, customer_id="3811341"):
     """네이버 키워드 도구 API를 사용하여 키워드 통계 조회"""
-    from config import NAVER_AD_ACCESS_LICENSE, NAVER_AD_SECRET_KEY
-    
-    BASE_URL = "https://api.naver.com"
-    API_KEY = NAVER_AD_ACCESS_LICENSE
-    SECRET_KEY = NAVER_AD_SECRET_KEY
-    
     try:
-        # API 요청 준비
-        timestamp = str(int(time.time() * 1000))
-        method = "GET"
-        uri = f"/keywordstool"
-        
-        # 요청 파라미터
-        params = {
-            'hintKeywords': keyword,
-            'showDetail': '1'
-        }
-        
-        # 쿼리 스트링 생성
-        query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-        
-        # 서명 생성
-        message = f"{timestamp}.{method}.{uri}.{query_string}"
-        signature = base64.b64encode(
-            hmac.new(SECRET_KEY.encode(), message.encode(), hashlib.sha256).digest()
-        ).decode()
-        
-        # 헤더 설정
-        headers = {
-            'X-Timestamp': timestamp,
-            'X-API-KEY': API_KEY,
-            'X-Customer': customer_id,
-            'X-Signature': signature,
-            'Content-Type': 'application/json'
-        }
+        url, headers = _build_keywordstool_request(_keyword_stats_params(keyword), customer_id)
         
         # API 호출
-        url = f"{BASE_URL}{uri}?{query_string}"
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_client.request("GET", url, headers=headers, timeout=10, rate_family="keywordstool")
         
         if response.status_code == 200:
-            return response.json()
+            return json_codec.loads(response.content)
         else:
             print(f"키워드 통계 API 오류: {response.status_code} - {response.text}")
             return None
@@ -236,45 +331,53 @@ def get_keyword_stats(keyword, customer_id="3811341"):
         return None
 
 
-def get_keyword_competition_data(keyword, customer_id="3811341"):
-    """키워드 경쟁률 및 검색량 데이터 조회"""
+def _to_competition_data(data, keyword):
+    """키워드 도구 응답 행을 경쟁률/검색량 dict로 변환"""
+    return {
+        'keyword': data.get('relKeyword', keyword),
+        'monthly_pc_searches': data.get('monthlyPcQcCnt', 0),
+        'monthly_mobile_searches': data.get('monthlyMobileQcCnt', 0),
+        'monthly_pc_clicks': data.get('monthlyAvePcClkCnt', 0),
+        'monthly_mobile_clicks': data.get('monthlyAveMobileClkCnt', 0),
+        'monthly_pc_ctr': data.get('monthlyAvePcCtr', 0),
+        'monthly_mobile_ctr': data.get('monthlyAveMobileCtr', 0),
+        'competition_index': data.get('compIdx', 'LOW'),
+        'monthly_pc_ad_exposure': data.get('monthlyAvePcShwCnt', 0),
+        'monthly_mobile_ad_exposure': data.get('monthlyAveMobileShwCnt', 0)
+    }
+
+
+def get_keyword_competition_data_batch(keywords, customer_id="3811341"):
+    """여러 키워드의 경쟁률 및 검색량 데이터 조회 ({키워드: 데이터 또는 None})"""
     try:
-        # 키워드 도구 API 호출
-        result = get_keyword_stats(keyword, customer_id)
-        
-        if result and 'keywordList' in result:
-            keyword_data = result['keywordList']
-            
-            if keyword_data:
-                # 첫 번째 키워드 데이터 반환 (검색한 키워드와 가장 유사한 것)
-                data = keyword_data[0]
-                
-                return {
-                    'keyword': data.get('relKeyword', keyword),
-                    'monthly_pc_searches': data.get('monthlyPcQcCnt', 0),
-                    'monthly_mobile_searches': data.get('monthlyMobileQcCnt', 0),
-                    'monthly_pc_clicks': data.get('monthlyAvePcClkCnt', 0),
-                    'monthly_mobile_clicks': data.get('monthlyAveMobileClkCnt', 0),
-                    'monthly_pc_ctr': data.get('monthlyAvePcCtr', 0),
-                    'monthly_mobile_ctr': data.get('monthlyAveMobileCtr', 0),
-                    'competition_index': data.get('compIdx', 'LOW'),
-                    'monthly_pc_ad_exposure': data.get('monthlyAvePcShwCnt', 0),
-                    'monthly_mobile_ad_exposure': data.get('monthlyAveMobileShwCnt', 0)
-                }
-        
-        # API 응답이 없을 경우 데모 데이터 반환 (개발/테스트용)
-        print(f"API 응답이 없어 데모 데이터를 반환합니다: {keyword}")
-        return get_demo_keyword_data(keyword)
-        
+        rows = get_keyword_stats_batch(keywords, customer_id)
     except Exception as e:
         print(f"키워드 경쟁 데이터 조회 오류: {e}")
-        # 오류 발생 시에도 데모 데이터 반환
-        return get_demo_keyword_data(keyword)
+        rows = {}
+    
+    results = {}
+    for keyword in dict.fromkeys(keywords):
+        row = rows.get(keyword)
+        if row:
+            results[keyword] = _to_competition_data(row, keyword)
+        else:
+            print(f"키워드 경쟁 데이터 없음: {keyword}")
+            results[keyword] = None
+    
+    return results
+
 
+def get_keyword_competition_data(keyword, customer_id="3811341"):
+    """키워드 경쟁률 및 검색량 데이터 조회 (실패 시 NaverAPIError)"""
+    row = get_keyword_stats_batch([keyword], customer_id, raise_errors=True)[keyword]
+    if row is None:
+        raise http_client.NaverAPIError(f"키워드 도구 응답에 키워드 없음: {keyword}")
+    return _to_competition_data(row, keyword)
 
-def get_demo_keyword_data(keyword):
-    """데모용 키워드 데이터 생성 (실제 API가 작동하지 않을 때 사용)"""
-    import random
+
+def get_demo_keyword_data(keyword, seed=None):
+    """데모용 키워드 데이터 생성 (같은 시드/키워드면 항상 같은 값)"""
+    rng = random.Random(f"{FIXTURE_CONFIG['seed'] if seed is None else seed}:{keyword}")
     
     # 키워드별 기본 검색량 패턴 설정
     base_searches = {
@@ -291,16 +394,16 @@ def get_demo_keyword_data(keyword):
     }
     
     # 기본 검색량 결정 (키워드가 사전에 있으면 해당 값, 없으면 랜덤)
-    base_search = base_searches.get(keyword, random.randint(10000, 100000))
+    base_search = base_searches.get(keyword, rng.randint(10000, 100000))
     
     # PC vs 모바일 비율 (모바일이 보통 60-80%)
-    mobile_ratio = random.uniform(0.6, 0.8)
+    mobile_ratio = rng.uniform(0.6, 0.8)
     pc_searches = int(base_search * (1 - mobile_ratio))
     mobile_searches = int(base_search * mobile_ratio)
     
     # 클릭수 (검색수의 5-15%)
-    pc_clicks = int(pc_searches * random.uniform(0.05, 0.15))
-    mobile_clicks = int(mobile_searches * random.uniform(0.05, 0.15))
+    pc_clicks = int(pc_searches * rng.uniform(0.05, 0.15))
+    mobile_clicks = int(mobile_searches * rng.uniform(0.05, 0.15))
     
     # 클릭률 계산
     pc_ctr = (pc_clicks / pc_searches * 100) if pc_searches > 0 else 0
@@ -308,11 +411,11 @@ def get_demo_keyword_data(keyword):
     
     # 경쟁정도 랜덤 설정
     competition_levels = ['LOW', 'MEDIUM', 'HIGH']
-    competition = random.choice(competition_levels)
+    competition = rng.choice(competition_levels)
     
     # 광고 노출수 (검색수의 20-50%)
-    pc_ad_exposure = int(pc_searches * random.uniform(0.2, 0.5))
-    mobile_ad_exposure = int(mobile_searches * random.uniform(0.2, 0.5))
+    pc_ad_exposure = int(pc_searches * rng.uniform(0.2, 0.5))
+    mobile_ad_exposure = int(mobile_searches * rng.uniform(0.2, 0.5))
     
     return {
         'keyword': keyword,
@@ -329,218 +432,251 @@ def get_demo_keyword_data(keyword):
 
 
 def get_powerlink_related_keywords(keyword, customer_id="3811341"):
-    """네이버 광고센터 파워링크 캠페인 연관키워드 조회"""
-    from config import NAVER_AD_ACCESS_LICENSE, NAVER_AD_SECRET_KEY
-    
-    # 실제 API 시도 후 실패 시 데모 데이터 사용
+    """네이버 광고센터 파워링크 캠페인 연관키워드 조회 (실패 시 NaverAPIError)
+
+    오프라인 테스트는 데모 데이터 대신 픽스처 모드(utils/fixtures.py)를 사용하세요.
+    DataFrame이 필요하면 get_powerlink_keyword_batch(...).to_dataframe()을 사용하세요.
+    """
+    return get_powerlink_keyword_batch(keyword, customer_id).to_records()
+
+
+def get_powerlink_keyword_batch(keyword, customer_id="3811341"):
+    """파워링크 연관키워드를 열 단위 배치(PowerlinkKeywordBatch)로 조회 (실패 시 NaverAPIError)"""
+    result = get_keyword_stats_for_powerlink(keyword, customer_id)
+    if 'keywordList' not in result:
+        raise http_client.NaverAPIError(f"파워링크 API 응답에 keywordList 없음: {keyword}")
+    return parse_powerlink_batch(result, keyword)
+
+
+def stream_powerlink_keyword_batch(keyword, customer_id="3811341"):
+    """파워링크 연관키워드를 응답을 받는 대로 파싱해 배치로 반환 (캐시를 거치지 않음, 실패 시 None)
+
+    키워드 도구 응답 전체를 dict로 만들지 않으므로 캐시가 필요 없는 대량 조회에 사용합니다.
+    """
     try:
-        # 키워드 도구 API 호출 시도
-        result = get_keyword_stats_for_powerlink(keyword, customer_id)
-        
-        if result and 'keywordList' in result:
-            return parse_powerlink_keywords(result, keyword)
-        else:
-            print(f"파워링크 API 응답 없음, 데모 데이터 사용: {keyword}")
-            return get_demo_powerlink_keywords(keyword)
-            
+        return parse_powerlink_rows(iter_keywordstool_rows(_powerlink_params(keyword), customer_id), keyword)
     except Exception as e:
         print(f"파워링크 연관키워드 조회 오류: {e}")
-        return get_demo_powerlink_keywords(keyword)
+        return None
+
 
+def _request_keywordstool(params, customer_id, timeout=20):
+    """검색광고 키워드 도구 API 서명 요청 (성공 시 JSON, 실패 시 NaverAPIError)"""
+    url, headers = _build_keywordstool_request(params, customer_id)
+    return http_client.request_json("GET", url, headers=headers, timeout=timeout, rate_family="keywordstool")
 
+
+def iter_keywordstool_rows(params, customer_id, timeout=20):
+    """키워드 도구 API 응답의 keywordList 행을 받는 대로 하나씩 yield (캐시를 거치지 않음, 실패 시 NaverAPIError)"""
+    url, headers = _build_keywordstool_request(params, customer_id)
+    response = http_client.request(
+        "GET", url, headers=headers, timeout=timeout, rate_family="keywordstool", stream=True
+    )
+    chunks = http_client.iter_content(response)
+    try:
+        if response.status_code != 200:
+            body = b''.join(chunks)
+            raise http_client.NaverAPIError(
+                f"{response.status_code} - {body[:200].decode('utf-8', errors='replace')}",
+                status_code=response.status_code
+            )
+        yield from json_codec.iter_keyword_list(chunks)
+    finally:
+        # keywordList 배열 뒤는 읽지 않으므로 여기서 닫아 읽은 크기로 메트릭 기록
+        chunks.close()
+        response.close()
+
+
+def _powerlink_params(keyword):
+    """네이버 광고센터 키워드 도구와 동일한 파라미터 설정"""
+    return {
+        'hintKeywords': keyword,
+        'showDetail': '1',
+        'includeHintKeywords': '0',  # 입력 키워드 제외
+        'keywordCategories': '',    # 카테고리 제한 없음
+        'device': '',               # PC, 모바일 모두
+        'sortColumn': 'monthlyPcQcCnt',  # PC 검색량 기준 정렬
+        'sortOrder': 'desc',        # 내림차순 정렬
+        'maxResults': '100'         # 최대 100개 결과
+    }
+
+
+@cached_api('keywordstool')
 def get_keyword_stats_for_powerlink(keyword, customer_id="3811341"):
-    """네이버 광고센터 검색광고 키워드 도구 API 호출 (정확한 연관키워드 추출)"""
-    from config import NAVER_AD_ACCESS_LICENSE, NAVER_AD_SECRET_KEY
-    
-    BASE_URL = "https://api.naver.com"
-    API_KEY = NAVER_AD_ACCESS_LICENSE
-    SECRET_KEY = NAVER_AD_SECRET_KEY
+    """네이버 광고센터 검색광고 키워드 도구 API 호출 (정확한 연관키워드 추출, 실패 시 NaverAPIError)"""
+    print(f"키워드 도구 API 호출: {keyword}")
+    result = _request_keywordstool(_powerlink_params(keyword), customer_id)
+    print(f"API 응답 성공: {len(result.get('keywordList', []))}개 키워드")
+    return result
+
+
+def _keywordstool_key(keyword):
+    """키워드 도구 응답(relKeyword)과 입력 키워드를 맞추기 위한 정규화 (공백 제거, 대문자)"""
+    return keyword.replace(' ', '').upper()
+
+
+def get_keyword_stats_batch(keywords, customer_id="3811341", raise_errors=False):
+    """여러 키워드 통계를 5개씩 묶어 조회 ({입력 키워드: keywordList 행 또는 None})
+
+    hintKeywords는 요청당 최대 5개까지 보낼 수 있으므로 배치마다 한 번만 서명/요청하고,
+    함께 돌아온 연관 키워드 행은 행 캐시에 저장해 이후 조회에 재사용합니다.
+    raise_errors가 True면 요청 실패를 None으로 바꾸지 않고 NaverAPIError를 그대로 발생시킵니다.
+    """
+    row_cache = get_cache('keyword_rows')
+    results = {}
+    pending = []
+    
+    # 중복 제거 (입력 순서 유지) 후 행 캐시 확인
+    for keyword in dict.fromkeys(keywords):
+        row = row_cache.get(make_cache_key('keyword_row', _keywordstool_key(keyword)), None)
+        metrics.record_cache('keyword_rows', row is not None)
+        if row is not None:
+            results[keyword] = dict(row)
+        else:
+            pending.append(keyword)
     
-    try:
-        # API 요청 준비
-        timestamp = str(int(time.time() * 1000))
-        method = "GET"
-        uri = "/keywordstool"
-        
-        # 네이버 광고센터 키워드 도구와 동일한 파라미터 설정
+    rows_by_key = {}
+    while pending:
+        batch = pending[:KEYWORDSTOOL_BATCH_SIZE]
+        pending = pending[KEYWORDSTOOL_BATCH_SIZE:]
         params = {
-            'hintKeywords': keyword,
-            'showDetail': '1',
-            'includeHintKeywords': '0',  # 입력 키워드 제외
-            'keywordCategories': '',    # 카테고리 제한 없음
-            'device': '',               # PC, 모바일 모두
-            'sortColumn': 'monthlyPcQcCnt',  # PC 검색량 기준 정렬
-            'sortOrder': 'desc',        # 내림차순 정렬
-            'maxResults': '100'         # 최대 100개 결과
-        }
-        
-        # 쿼리 스트링 생성 (URL 인코딩)
-        query_params = []
-        for k, v in sorted(params.items()):
-            if v != '':
-                query_params.append(f"{k}={urllib.parse.quote(str(v))}")
-        query_string = '&'.join(query_params)
-        
-        # 서명 생성을 위한 메시지 (RFC 표준에 따라)
-        message = f"{timestamp}.{method}.{uri}"
-        if query_string:
-            message += f"?{query_string}"
-        
-        # HMAC-SHA256 서명 생성
-        signature = base64.b64encode(
-            hmac.new(
-                base64.b64decode(SECRET_KEY), 
-                message.encode('utf-8'), 
-                hashlib.sha256
-            ).digest()
-        ).decode()
-        
-        # 헤더 설정 (네이버 광고센터 API 규격)
-        headers = {
-            'X-Timestamp': timestamp,
-            'X-API-KEY': API_KEY,
-            'X-Customer': customer_id,
-            'X-Signature': signature,
-            'Content-Type': 'application/json; charset=UTF-8',
-            'Accept': 'application/json'
+            'hintKeywords': ','.join(keyword.replace(' ', '') for keyword in batch),
+            'showDetail': '1'
         }
         
-        # API 호출
-        url = f"{BASE_URL}{uri}"
-        if query_string:
-            url += f"?{query_string}"
-            
-        print(f"키워드 도구 API 호출: {keyword}")
-        response = requests.get(url, headers=headers, timeout=20)
-        
-        if response.status_code == 200:
-            result = response.json()
-            print(f"API 응답 성공: {len(result.get('keywordList', []))}개 키워드")
-            return result
-        else:
-            print(f"키워드 통계 API 오류: {response.status_code} - {response.text}")
-            return None
-            
-    except Exception as e:
-        print(f"키워드 통계 조회 오류: {e}")
-        return None
+        try:
+            result = _request_keywordstool(params, customer_id)
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"키워드 통계 배치 조회 오류 ({', '.join(batch)}): {e}")
+            result = None
+        
+        for row in (result or {}).get('keywordList', []):
+            key = _keywordstool_key(row.get('relKeyword', ''))
+            if key and key not in rows_by_key:
+                rows_by_key[key] = row
+                row_cache.set(make_cache_key('keyword_row', key), row)
+        
+        for keyword in batch:
+            row = rows_by_key.get(_keywordstool_key(keyword))
+            results[keyword] = dict(row) if row is not None else None
+        
+        # 앞선 배치에서 연관 키워드로 함께 받은 키워드는 다시 요청하지 않음
+        remaining = []
+        for keyword in pending:
+            row = rows_by_key.get(_keywordstool_key(keyword))
+            if row is not None:
+                results[keyword] = dict(row)
+            else:
+                remaining.append(keyword)
+        pending = remaining
+    
+    return results
 
 
-def parse_powerlink_keywords(api_result, base_keyword):
-    """네이버 광고센터 키워드 도구 API 응답을 파싱하여 연관키워드 추출"""
-    keywords_data = []
+def parse_powerlink_batch(api_result, base_keyword):
+    """키워드 도구 API 응답을 열 단위 배치(PowerlinkKeywordBatch)로 파싱 (관련성 순 상위 50개, 실패 시 None)"""
+    rows = api_result['keywordList'] if api_result and 'keywordList' in api_result else []
+    return parse_powerlink_rows(rows, base_keyword)
+
+
+def parse_powerlink_rows(rows, base_keyword):
+    """keywordList 행 iterable(iter_keywordstool_rows 결과 등)을 PowerlinkKeywordBatch로 파싱 (실패 시 None)"""
+    columns = {name: [] for name, _ in PowerlinkKeywordBatch.SCHEMA}
     
     try:
-        if api_result and 'keywordList' in api_result:
-            for item in api_result['keywordList']:
-                # API 응답 필드 확인 및 정제
-                rel_keyword = item.get('relKeyword', '').strip()
-                
-                # 기본 키워드와 동일하거나 비어있는 키워드 제외
-                if not rel_keyword or rel_keyword.lower() == base_keyword.lower():
-                    continue
-                
-                # 월간 검색량 계산 (PC + 모바일)
-                pc_searches = int(item.get('monthlyPcQcCnt', 0))
-                mobile_searches = int(item.get('monthlyMobileQcCnt', 0))
-                total_searches = pc_searches + mobile_searches
-                
-                # 검색량이 0인 키워드 제외
-                if total_searches == 0:
-                    continue
-                
-                # 경쟁정도 정규화 (네이버 광고센터 기준)
-                comp_idx = item.get('compIdx', 'LOW')
-                if isinstance(comp_idx, (int, float)):
-                    # 숫자로 된 경쟁지수를 문자열로 변환
-                    if comp_idx >= 80:
-                        competition = 'HIGH'
-                    elif comp_idx >= 50:
-                        competition = 'MEDIUM'
-                    else:
-                        competition = 'LOW'
+        for item in rows:
+            # API 응답 필드 확인 및 정제
+            rel_keyword = item.get('relKeyword', '').strip()
+            
+            # 기본 키워드와 동일하거나 비어있는 키워드 제외
+            if not rel_keyword or rel_keyword.lower() == base_keyword.lower():
+                continue
+            
+            # 월간 검색량 계산 (PC + 모바일)
+            pc_searches = int(item.get('monthlyPcQcCnt', 0))
+            mobile_searches = int(item.get('monthlyMobileQcCnt', 0))
+            total_searches = pc_searches + mobile_searches
+            
+            # 검색량이 0인 키워드 제외
+            if total_searches == 0:
+                continue
+            
+            # 경쟁정도 정규화 (네이버 광고센터 기준)
+            comp_idx = item.get('compIdx', 'LOW')
+            if isinstance(comp_idx, (int, float)):
+                # 숫자로 된 경쟁지수를 문자열로 변환
+                if comp_idx >= 80:
+                    competition = 'HIGH'
+                elif comp_idx >= 50:
+                    competition = 'MEDIUM'
                 else:
-                    competition = str(comp_idx).upper()
-                
-                # 평균 입찰가 (파워링크 평균 입찰가)
-                avg_bid = int(item.get('plAvgDepth', 0))
-                if avg_bid == 0:
-                    # 입찰가 정보가 없으면 경쟁정도 기반으로 추정
-                    if competition == 'HIGH':
-                        avg_bid = pc_searches // 50 + 500  # 높은 경쟁: 높은 입찰가
-                    elif competition == 'MEDIUM':
-                        avg_bid = pc_searches // 100 + 200
-                    else:
-                        avg_bid = pc_searches // 200 + 100
-                
-                # 클릭률 계산
-                pc_ctr = float(item.get('monthlyAvePcCtr', 0))
-                mobile_ctr = float(item.get('monthlyAveMobileCtr', 0))
-                avg_ctr = (pc_ctr + mobile_ctr) / 2 if (pc_ctr > 0 or mobile_ctr > 0) else 2.5
-                
-                # 관련성 점수 계산 (네이버 광고센터 알고리즘 모방)
-                relevance_score = calculate_relevance_score_advanced(rel_keyword, base_keyword, total_searches, competition)
-                
-                keyword_info = {
-                    'keyword': rel_keyword,
-                    'monthly_searches': total_searches,
-                    'pc_searches': pc_searches,
-                    'mobile_searches': mobile_searches,
-                    'competition': competition,
-                    'avg_bid': max(avg_bid, 50),  # 최소 50원
-                    'click_rate': round(avg_ctr, 2),
-                    'relevance_score': relevance_score
-                }
-                
-                keywords_data.append(keyword_info)
+                    competition = 'LOW'
+            else:
+                competition = str(comp_idx).upper()
+            
+            # 평균 입찰가 (파워링크 평균 입찰가)
+            avg_bid = int(item.get('plAvgDepth', 0))
+            if avg_bid == 0:
+                # 입찰가 정보가 없으면 경쟁정도 기반으로 추정
+                if competition == 'HIGH':
+                    avg_bid = pc_searches // 50 + 500  # 높은 경쟁: 높은 입찰가
+                elif competition == 'MEDIUM':
+                    avg_bid = pc_searches // 100 + 200
+                else:
+                    avg_bid = pc_searches // 200 + 100
+            
+            # 클릭률 계산
+            pc_ctr = float(item.get('monthlyAvePcCtr', 0))
+            mobile_ctr = float(item.get('monthlyAveMobileCtr', 0))
+            avg_ctr = (pc_ctr + mobile_ctr) / 2 if (pc_ctr > 0 or mobile_ctr > 0) else 2.5
+            
+            columns['keyword'].append(rel_keyword)
+            columns['monthly_searches'].append(total_searches)
+            columns['pc_searches'].append(pc_searches)
+            columns['mobile_searches'].append(mobile_searches)
+            columns['competition'].append(competition)
+            columns['avg_bid'].append(max(avg_bid, 50))  # 최소 50원
+            columns['click_rate'].append(round(avg_ctr, 2))
+    
+        if not columns['keyword']:
+            return PowerlinkKeywordBatch.empty()
+        
+        # 관련성 점수 계산 (네이버 광고센터 알고리즘 모방) - 기준 키워드는 한 번만 전처리
+        scorer = RelevanceScorer(base_keyword)
+        columns['relevance_score'] = scorer.score_many(
+            columns['keyword'], columns['monthly_searches'], columns['competition']
+        )
+        batch = PowerlinkKeywordBatch.from_lists(columns)
         
         # 네이버 광고센터와 동일한 정렬 방식: 관련성 점수 + 검색량 조합
-        keywords_data.sort(key=lambda x: (x['relevance_score'] * 0.7 + (x['monthly_searches'] / 10000) * 0.3), reverse=True)
+        searches = batch.columns['monthly_searches'].astype(np.float64)
+        sort_keys = batch.columns['relevance_score'] * 0.7 + (searches / 10000) * 0.3
         
         # 상위 50개 키워드 반환 (네이버 광고센터 기준)
-        return keywords_data[:50]
+        return batch.take(top_k_indices(sort_keys, 50))
         
     except Exception as e:
         print(f"파워링크 키워드 파싱 오류: {e}")
-        return get_demo_powerlink_keywords(base_keyword)
+        return None
+
+
+def parse_powerlink_keywords(api_result, base_keyword):
+    """네이버 광고센터 키워드 도구 API 응답을 파싱하여 연관키워드 추출 (dict 목록, 실패 시 None)"""
+    batch = parse_powerlink_batch(api_result, base_keyword)
+    if batch is None:
+        return None
+    return batch.to_records()
 
 
 def calculate_relevance_score_advanced(keyword, base_keyword, search_volume, competition):
-    """네이버 광고센터 스타일의 고급 관련성 점수 계산"""
-    base_words = set(base_keyword.lower().split())
-    keyword_words = set(keyword.lower().split())
-    
-    # 1. 기본 단어 매칭 점수 (40%)
-    common_words = base_words.intersection(keyword_words)
-    if base_words:
-        word_match_score = len(common_words) / len(base_words) * 40
-    else:
-        word_match_score = 0
-    
-    # 2. 포함 관계 점수 (30%)
-    inclusion_score = 0
-    if base_keyword.lower() in keyword.lower():
-        inclusion_score = 30
-    elif any(word in keyword.lower() for word in base_words):
-        inclusion_score = 15
-    
-    # 3. 검색량 기반 점수 (20%) - 검색량이 높을수록 관련성이 높다고 가정
-    if search_volume > 0:
-        volume_score = min(search_volume / 50000 * 20, 20)
-    else:
-        volume_score = 0
-    
-    # 4. 경쟁정도 기반 점수 (10%) - 경쟁이 높을수록 관련성이 높다고 가정
-    comp_score = {'HIGH': 10, 'MEDIUM': 7, 'LOW': 4}.get(competition, 4)
-    
-    # 총 점수 계산
-    total_score = word_match_score + inclusion_score + volume_score + comp_score
-    
-    # 키워드 길이 패널티 (너무 긴 키워드는 관련성 감소)
-    if len(keyword) > len(base_keyword) * 2:
-        total_score *= 0.8
-    
-    return min(round(total_score, 1), 100)
+    """네이버 광고센터 스타일의 고급 관련성 점수 계산
+
+    단어 매칭(40%) + 포함 관계(30%) + 검색량(20%) + 경쟁정도(10%), 긴 키워드는 20% 감점.
+    여러 키워드를 계산할 때는 RelevanceScorer.score_many를 사용하세요.
+    """
+    return RelevanceScorer(base_keyword).score(keyword, search_volume, competition)
 
 
 def calculate_relevance_score(keyword, base_keyword):
@@ -562,9 +698,9 @@ def calculate_relevance_score(keyword, base_keyword):
     return min(relevance, 100)
 
 
-def get_demo_powerlink_keywords(keyword):
-    """데모용 파워링크 연관키워드 데이터 (네이버 광고센터 실제 데이터 기반)"""
-    import random
+def get_demo_powerlink_keywords(keyword, seed=None):
+    """데모용 파워링크 연관키워드 데이터 (네이버 광고센터 실제 데이터 기반, 같은 시드면 항상 같은 값)"""
+    rng = random.Random(f"{FIXTURE_CONFIG['seed'] if seed is None else seed}:{keyword}")
     
     # 실제 네이버 광고센터에서 많이 검색되는 연관 키워드 패턴
     keyword_patterns = {
@@ -641,18 +777,18 @@ def get_demo_powerlink_keywords(keyword):
     # 기본 패턴이 없으면 일반적인 수식어로 생성
     if keyword not in keyword_patterns:
         base_patterns = [
-            (f'{keyword} 추천', 90, 'MEDIUM', random.randint(500, 1200)),
-            (f'{keyword} 리뷰', 85, 'MEDIUM', random.randint(300, 800)),
-            (f'{keyword} 가격', 88, 'MEDIUM', random.randint(400, 900)),
-            (f'{keyword} 순위', 83, 'MEDIUM', random.randint(600, 1000)),
-            (f'인기 {keyword}', 80, 'MEDIUM', random.randint(700, 1300)),
-            (f'베스트 {keyword}', 82, 'HIGH', random.randint(800, 1500)),
-            (f'{keyword} 할인', 75, 'LOW', random.randint(200, 600)),
-            (f'{keyword} 특가', 78, 'LOW', random.randint(250, 700)),
-            (f'{keyword} 브랜드', 85, 'HIGH', random.randint(900, 1600)),
-            (f'{keyword} 비교', 87, 'MEDIUM', random.randint(400, 800)),
-            (f'{keyword} 사용법', 70, 'LOW', random.randint(150, 400)),
-            (f'{keyword} 구매', 92, 'HIGH', random.randint(1000, 2000))
+            (f'{keyword} 추천', 90, 'MEDIUM', rng.randint(500, 1200)),
+            (f'{keyword} 리뷰', 85, 'MEDIUM', rng.randint(300, 800)),
+            (f'{keyword} 가격', 88, 'MEDIUM', rng.randint(400, 900)),
+            (f'{keyword} 순위', 83, 'MEDIUM', rng.randint(600, 1000)),
+            (f'인기 {keyword}', 80, 'MEDIUM', rng.randint(700, 1300)),
+            (f'베스트 {keyword}', 82, 'HIGH', rng.randint(800, 1500)),
+            (f'{keyword} 할인', 75, 'LOW', rng.randint(200, 600)),
+            (f'{keyword} 특가', 78, 'LOW', rng.randint(250, 700)),
+            (f'{keyword} 브랜드', 85, 'HIGH', rng.randint(900, 1600)),
+            (f'{keyword} 비교', 87, 'MEDIUM', rng.randint(400, 800)),
+            (f'{keyword} 사용법', 70, 'LOW', rng.randint(150, 400)),
+            (f'{keyword} 구매', 92, 'HIGH', rng.randint(1000, 2000))
         ]
         keyword_patterns[keyword] = base_patterns
     
@@ -661,31 +797,31 @@ def get_demo_powerlink_keywords(keyword):
     
     for i, (kw, relevance, competition, base_bid) in enumerate(patterns):
         # 검색량 생성 (관련성과 경쟁정도에 비례)
-        base_volume = random.randint(10000, 150000)
+        base_volume = rng.randint(10000, 150000)
         if relevance >= 85:
-            multiplier = random.uniform(1.2, 2.0)
+            multiplier = rng.uniform(1.2, 2.0)
         elif relevance >= 75:
-            multiplier = random.uniform(0.8, 1.5)
+            multiplier = rng.uniform(0.8, 1.5)
         else:
-            multiplier = random.uniform(0.3, 1.0)
+            multiplier = rng.uniform(0.3, 1.0)
         
         total_searches = int(base_volume * multiplier)
         
         # PC vs 모바일 비율 (최근 트렌드: 모바일 우세)
-        mobile_ratio = random.uniform(0.55, 0.75)
+        mobile_ratio = rng.uniform(0.55, 0.75)
         pc_searches = int(total_searches * (1 - mobile_ratio))
         mobile_searches = int(total_searches * mobile_ratio)
         
         # 클릭률 (경쟁정도에 따라 차등)
         if competition == 'HIGH':
-            click_rate = random.uniform(2.5, 6.0)
+            click_rate = rng.uniform(2.5, 6.0)
         elif competition == 'MEDIUM':
-            click_rate = random.uniform(1.8, 4.5)
+            click_rate = rng.uniform(1.8, 4.5)
         else:
-            click_rate = random.uniform(1.0, 3.0)
+            click_rate = rng.uniform(1.0, 3.0)
         
         # 입찰가 변동 (±30%)
-        bid_variation = random.uniform(0.7, 1.3)
+        bid_variation = rng.uniform(0.7, 1.3)
         final_bid = int(base_bid * bid_variation)
         
         keywords_data.append({
@@ -0,0 +1,223 @@
+"""
+네이버 API 비동기 클라이언트
+
+httpx가 설치되어 있으면 httpx.AsyncClient로 이벤트 루프에서 직접 요청하고,
+없으면 공용 keep-alive 세션 요청을 스레드로 넘겨 실행합니다.
+속도 제한, 캐시, 결과 정제는 동기 함수(utils/naver_api.py)와 공유합니다.
+"""
+import asyncio
+import ssl
+import threading
+
+from config import ASYNC_CONFIG, HTTP_CONFIG, FIXTURE_CONFIG
+from utils import http_client, json_codec
+from utils.cache import cached_api_async
+from utils.naver_api import (
+    SHOPPING_URL,
+    DATALAB_URL,
+    _openapi_headers,
+    _shopping_params,
+    _clean_shopping_result,
+    _datalab_body,
+    _build_keywordstool_request,
+    _keyword_stats_params,
+    _powerlink_params,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_ssl_context = None
+_fallback_warned = False
+
+
+def _warn_thread_fallback():
+    """httpx가 없어 스레드 요청으로 대신할 때 한 번만 경고"""
+    global _fallback_warned
+    if not _fallback_warned:
+        _fallback_warned = True
+        print("경고: httpx가 설치되어 있지 않아 비동기 요청을 스레드(asyncio.to_thread)로 실행합니다 "
+              "(pip install httpx 권장)")
+
+
+def _get_ssl_context():
+    """클라이언트마다 인증서를 다시 읽지 않도록 SSL 컨텍스트 공유"""
+    global _ssl_context
+    if _ssl_context is None:
+        import certifi  # requests 의존성으로 함께 설치됨
+        _ssl_context = ssl.create_default_context(cafile=certifi.where())
+    return _ssl_context
+
+
+class AsyncNaverClient:
+    """동시 요청 수를 세마포어로 제한하는 비동기 네이버 API 클라이언트
+
+    async with AsyncNaverClient() as client:
+        results = await asyncio.gather(*(client.search_naver_shopping(k) for k in keywords))
+    """
+
+    def __init__(self, max_concurrency=None):
+        self.max_concurrency = max_concurrency or ASYNC_CONFIG['max_concurrency']
+        self._semaphore = None
+        self._client = None
+
+    async def __aenter__(self):
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # 픽스처 모드에서는 픽스처 어댑터가 끼워진 공용 세션을 스레드로 사용
+        if httpx is None and not FIXTURE_CONFIG['enabled']:
+            _warn_thread_fallback()
+        elif httpx is not None and not FIXTURE_CONFIG['enabled']:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                headers={'Accept-Encoding': 'gzip, deflate'},
+                verify=_get_ssl_context()
+            )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(self, method, url, **kwargs):
+        async with self._semaphore:
+            return await http_client.request_async(self._client, method, url, **kwargs)
+
+    async def _request_json(self, method, url, **kwargs):
+        response = await self._request(method, url, **kwargs)
+        if response.status_code >= 400:
+            raise http_client.NaverAPIError(
+                f"{response.status_code} - {response.text[:200]}",
+                status_code=response.status_code
+            )
+        return json_codec.loads(response.content)
+
+    @cached_api_async('shopping', name='search_naver_shopping')
+    async def search_naver_shopping(self, keyword, display=10, start=1, sort="sim"):
+        """네이버 쇼핑 검색 (비동기)"""
+        try:
+            result = await self._request_json(
+                "GET", SHOPPING_URL,
+                params=_shopping_params(keyword, display, start, sort),
+                headers=_openapi_headers(),
+                rate_family="search"
+            )
+            return _clean_shopping_result(result)
+        except Exception as e:
+            print(f"네이버 쇼핑 검색 오류: {e}")
+            return None
+
+    @cached_api_async('datalab', name='get_datalab_trends')
+    async def get_datalab_trends(self, keywords, start_date, end_date, time_unit="month", device="", ages=[], gender=""):
+        """네이버 DataLab 트렌드 조회 (비동기)"""
+        try:
+            return await self._request_json(
+                "POST", DATALAB_URL,
+                json_body=_datalab_body(keywords, start_date, end_date, time_unit, device, ages, gender),
+                headers=_openapi_headers({"Content-Type": "application/json"}),
+                rate_family="datalab"
+            )
+        except Exception as e:
+            print(f"DataLab API 요청 오류: {e}")
+            return None
+
+    @cached_api_async('keywordstool', name='get_keyword_stats')
+    async def get_keyword_stats(self, keyword, customer_id="3811341"):
+        """키워드 도구 API 키워드 통계 조회 (비동기)"""
+        try:
+            url, headers = _build_keywordstool_request(_keyword_stats_params(keyword), customer_id)
+            return await self._request_json(
+                "GET", url,
+                headers=headers,
+                timeout=10,
+                rate_family="keywordstool"
+            )
+        except Exception as e:
+            print(f"키워드 통계 조회 오류: {e}")
+            return None
+
+    @cached_api_async('keywordstool', name='get_keyword_stats_for_powerlink')
+    async def get_keyword_stats_for_powerlink(self, keyword, customer_id="3811341"):
+        """파워링크 연관키워드용 키워드 도구 API 호출 (비동기)"""
+        try:
+            url, headers = _build_keywordstool_request(_powerlink_params(keyword), customer_id)
+            return await self._request_json(
+                "GET", url,
+                headers=headers,
+                timeout=max(HTTP_CONFIG['timeout'], 20),
+                rate_family="keywordstool"
+            )
+        except Exception as e:
+            print(f"키워드 통계 조회 오류: {e}")
+            return None
+
+
+def run_sync(coro):
+    """코루틴을 동기 코드(Streamlit 페이지 등)에서 실행해 결과 반환
+
+    이미 이벤트 루프가 돌고 있는 스레드에서 호출되면 별도 스레드에서 실행합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    result = {}
+
+    def runner():
+        try:
+            result['value'] = asyncio.run(coro)
+        except BaseException as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=runner, name="naver-api-async")
+    thread.start()
+    thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
+def run_with_client(func, max_concurrency=None):
+    """func(client) 코루틴을 새 클라이언트로 실행하는 동기 래퍼
+
+    예) run_with_client(lambda c: asyncio.gather(*(c.search_naver_shopping(k) for k in keywords)))
+    """
+    async def main():
+        async with AsyncNaverClient(max_concurrency) as client:
+            return await func(client)
+
+    return run_sync(main())
+
+
+def search_naver_shopping_many(queries, max_concurrency=None):
+    """여러 쇼핑 검색을 한 이벤트 루프에서 동시에 실행 (queries: search_naver_shopping 인자 dict 목록)"""
+    return run_with_client(
+        lambda client: asyncio.gather(*(client.search_naver_shopping(**query) for query in queries)),
+        max_concurrency
+    )
+
+
+def _gather_by_keyword(method_name, keywords, customer_id, max_concurrency):
+    results = run_with_client(
+        lambda client: asyncio.gather(*(
+            getattr(client, method_name)(keyword, customer_id) for keyword in keywords
+        )),
+        max_concurrency
+    )
+    return dict(zip(keywords, results))
+
+
+def get_keyword_stats_many(keywords, customer_id="3811341", max_concurrency=None):
+    """여러 키워드의 키워드 도구 통계(get_keyword_stats)를 동시에 조회 ({키워드: 결과})"""
+    return _gather_by_keyword('get_keyword_stats', keywords, customer_id, max_concurrency)
+
+
+def get_powerlink_keyword_stats_many(keywords, customer_id="3811341", max_concurrency=None):
+    """여러 키워드의 파워링크용 키워드 도구 결과(get_keyword_stats_for_powerlink)를 동시에 조회 ({키워드: 결과})"""
+    return _gather_by_keyword('get_keyword_stats_for_powerlink', keywords, customer_id, max_concurrency)
@@ -0,0 +1,180 @@
+"""
+순위 이력 저장소 (SQLite, 추가 전용 시계열)
+
+search_product_rank 결과를 (키워드, 판매처, 상품 ID, 순위, 최저가, 시각)으로 쌓고,
+전체 이력을 읽지 않고 인덱스만으로 순위 추이/변동 상위를 조회합니다.
+행은 (keyword_id, mall_id, day, ts) 순으로 클러스터링되어 있어 키워드/판매처별 추이는
+연속 구간 스캔이고, (day, ...) 커버링 인덱스가 일 단위 파티션 역할을 합니다.
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+from config import RANK_HISTORY_CONFIG
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keywords (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS malls (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS rank_history (
+    keyword_id INTEGER NOT NULL,
+    mall_id INTEGER NOT NULL,
+    day INTEGER NOT NULL,
+    ts INTEGER NOT NULL,
+    rank INTEGER NOT NULL,
+    product_id INTEGER,
+    lprice INTEGER,
+    PRIMARY KEY (keyword_id, mall_id, day, ts)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_rank_history_day
+    ON rank_history (day, keyword_id, mall_id, rank);
+"""
+
+
+def _day(ts):
+    """유닉스 시각 → YYYYMMDD 정수"""
+    return int(datetime.fromtimestamp(ts).strftime('%Y%m%d'))
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RankHistoryStore:
+    """순위 이력 저장/조회"""
+
+    def __init__(self, path=None):
+        self.path = path or RANK_HISTORY_CONFIG['path']
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._local = threading.local()
+        self._ids = {'keywords': {}, 'malls': {}}
+        self._ids_lock = threading.Lock()
+
+        conn = self._connection()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _id(self, conn, table, name):
+        """키워드/판매처 이름 → 정수 ID (없으면 생성)"""
+        name = ' '.join(name.split())
+        cached = self._ids[table].get(name)
+        if cached is not None:
+            return cached
+        conn.execute(f"INSERT OR IGNORE INTO {table} (name) VALUES (?)", (name,))
+        row_id = conn.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()[0]
+        with self._ids_lock:
+            self._ids[table][name] = row_id
+        return row_id
+
+    def _lookup_id(self, table, name):
+        row = self._connection().execute(
+            f"SELECT id FROM {table} WHERE name = ?", (' '.join(name.split()),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def record(self, matches, ts=None):
+        """순위 검색 결과(dict: keyword, mallName, rank, productId, lprice) 목록 저장"""
+        ts = int(ts or time.time())
+        day = _day(ts)
+        conn = self._connection()
+        with conn:
+            rows = []
+            for match in matches:
+                if not match or match.get('rank') is None:
+                    continue
+                rows.append((
+                    self._id(conn, 'keywords', match['keyword']),
+                    self._id(conn, 'malls', match.get('mallName') or match.get('mall_name')),
+                    day,
+                    ts,
+                    int(match['rank']),
+                    _to_int(match.get('productId') or match.get('product_id')),
+                    _to_int(match.get('lprice'))
+                ))
+            conn.executemany(
+                "INSERT OR REPLACE INTO rank_history "
+                "(keyword_id, mall_id, day, ts, rank, product_id, lprice) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def trajectory(self, keyword, mall_name, days=90):
+        """판매처의 키워드 순위 추이 (일별 최고 순위와 그때의 최저가)"""
+        keyword_id = self._lookup_id('keywords', keyword)
+        mall_id = self._lookup_id('malls', mall_name)
+        if keyword_id is None or mall_id is None:
+            return []
+
+        since = int((datetime.now() - timedelta(days=days)).strftime('%Y%m%d'))
+        rows = self._connection().execute(
+            """
+            SELECT day, MIN(rank), lprice, product_id
+            FROM rank_history
+            WHERE keyword_id = ? AND mall_id = ? AND day >= ?
+            GROUP BY day
+            ORDER BY day
+            """,
+            (keyword_id, mall_id, since)
+        ).fetchall()
+        return [
+            {'day': day, 'rank': rank, 'lprice': lprice, 'product_id': product_id}
+            for day, rank, lprice, product_id in rows
+        ]
+
+    def top_movers(self, day=None, previous_day=None, limit=20):
+        """기준일과 전일 사이 순위 변동이 큰 (키워드, 판매처) 목록
+
+        change > 0 이면 순위 상승(숫자 감소)입니다.
+        """
+        day = day or int(datetime.now().strftime('%Y%m%d'))
+        if previous_day is None:
+            previous_day = int((datetime.strptime(str(day), '%Y%m%d') - timedelta(days=1)).strftime('%Y%m%d'))
+
+        rows = self._connection().execute(
+            """
+            WITH cur AS (
+                SELECT keyword_id, mall_id, MIN(rank) AS rank
+                FROM rank_history WHERE day = ?
+                GROUP BY keyword_id, mall_id
+            ), prev AS (
+                SELECT keyword_id, mall_id, MIN(rank) AS rank
+                FROM rank_history WHERE day = ?
+                GROUP BY keyword_id, mall_id
+            )
+            SELECT k.name, m.name, prev.rank, cur.rank, prev.rank - cur.rank AS change
+            FROM cur
+            JOIN prev ON prev.keyword_id = cur.keyword_id AND prev.mall_id = cur.mall_id
+            JOIN keywords k ON k.id = cur.keyword_id
+            JOIN malls m ON m.id = cur.mall_id
+            WHERE change != 0
+            ORDER BY ABS(change) DESC
+            LIMIT ?
+            """,
+            (day, previous_day, limit)
+        ).fetchall()
+        return [
+            {'keyword': keyword, 'mall_name': mall_name, 'previous_rank': previous_rank,
+             'rank': rank, 'change': change}
+            for keyword, mall_name, previous_rank, rank, change in rows
+        ]
@@ -0,0 +1,144 @@
+"""
+상품 순위 검색 엔진 (페이지 스트리밍 + 키워드 병렬 조회)
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from config import SEARCH_CONFIG
+from utils.naver_api import iter_shopping_pages
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """키워드 단위 검색용 공유 스레드 풀 (페이지 요청은 naver_api의 페이지 풀에서 실행)"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=SEARCH_CONFIG['max_keywords'],
+                    thread_name_prefix="rank-search"
+                )
+    return _executor
+
+
+class _KeywordSearch:
+    """키워드 하나에 대한 페이지별 검색 상태"""
+
+    def __init__(self, keyword, mall_name, max_pages, items_per_page):
+        self.keyword = keyword
+        self.mall_name = mall_name.strip().lower()
+        self.max_pages = max_pages
+        self.items_per_page = items_per_page
+        self.done_pages = 0
+        self.failed_pages = 0
+        self.best = None
+        self.finished = False
+
+    def planned_pages(self):
+        if self.best:
+            return self.best['page']
+        if self.finished:
+            return self.done_pages
+        return self.max_pages
+
+    def handle(self, start, items):
+        """조회한 페이지에서 판매처 상품 찾기"""
+        self.done_pages += 1
+        if items is None:
+            self.failed_pages += 1
+            return
+
+        for index, item in enumerate(items):
+            if item.get('mallName', '').strip().lower() != self.mall_name:
+                continue
+            match = dict(item)
+            match['rank'] = start + index
+            match['page'] = (start - 1) // self.items_per_page + 1
+            match['keyword'] = self.keyword
+            self.best = match
+            return
+
+    def run(self, sort, events):
+        """앞 페이지부터 차례로 확인하고, 찾으면 즉시 중단 (남은 요청 취소)"""
+        try:
+            for start, items in iter_shopping_pages(
+                self.keyword,
+                max_pages=self.max_pages,
+                display=self.items_per_page,
+                sort=sort
+            ):
+                self.handle(start, items)
+                events.put(self)
+                if self.best:
+                    break
+        finally:
+            self.finished = True
+            events.put(self)
+
+
+def search_product_ranks(keywords, mall_name, max_pages=None, items_per_page=None, sort="sim",
+                         progress_callback=None, details=False):
+    """여러 키워드에서 판매처(mallName)의 최고 순위를 병렬로 검색
+
+    키워드마다 페이지를 앞에서부터 스트리밍으로 확인하므로 1페이지에서 찾으면 요청 한 번으로 끝나고,
+    모든 페이지 요청은 공유 페이지 풀과 'search' 토큰 버킷을 함께 씁니다.
+    progress_callback(done_pages, planned_pages, results)는 호출한 스레드에서 실행되므로
+    Streamlit 진행바를 바로 갱신할 수 있습니다.
+
+    반환값: {키워드: 순위 정보 dict 또는 None}
+    details=True면 {키워드: {'match', 'pages_checked', 'failed_pages'}}
+    """
+    max_pages = max_pages or SEARCH_CONFIG['max_search_pages']
+    items_per_page = min(items_per_page or SEARCH_CONFIG['items_per_page'], 100)
+
+    searches = [
+        _KeywordSearch(keyword, mall_name, max_pages, items_per_page)
+        for keyword in keywords[:SEARCH_CONFIG['max_keywords']]
+    ]
+    events = queue.Queue()
+    executor = _get_executor()
+    futures = [executor.submit(search.run, sort, events) for search in searches]
+
+    while not all(search.finished for search in searches) or not events.empty():
+        try:
+            events.get(timeout=0.1)
+        except queue.Empty:
+            continue
+        if progress_callback:
+            done = sum(search.done_pages for search in searches)
+            planned = sum(search.planned_pages() for search in searches)
+            progress_callback(done, max(planned, done), {search.keyword: search.best for search in searches})
+
+    for future, search in zip(futures, searches):
+        try:
+            future.result()
+        except Exception as e:
+            print(f"순위 검색 오류 ({search.keyword}): {e}")
+
+    if details:
+        return {
+            search.keyword: {
+                'match': search.best,
+                'pages_checked': search.done_pages,
+                'failed_pages': search.failed_pages
+            }
+            for search in searches
+        }
+    return {search.keyword: search.best for search in searches}
+
+
+def search_product_rank(keyword, mall_name, max_pages=None, items_per_page=None, sort="sim",
+                        progress_callback=None):
+    """판매처(mallName)의 상품 순위 검색"""
+    results = search_product_ranks(
+        [keyword], mall_name,
+        max_pages=max_pages,
+        items_per_page=items_per_page,
+        sort=sort,
+        progress_callback=progress_callback
+    )
+    return results.get(keyword)
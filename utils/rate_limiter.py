@@ -0,0 +1,111 @@
+"""
+API 요청 속도 제한 (프로세스 전역 토큰 버킷)
+
+모듈 전역 상태라 Streamlit 스크립트 재실행과 여러 세션/스레드가 같은 버킷을 공유합니다.
+"""
+import asyncio
+import threading
+import time
+
+from config import RATE_LIMIT_CONFIG, RATE_LIMIT_DECREASE_FACTOR, RATE_LIMIT_RECOVERY_STEP
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = float(rate)
+        self.burst = max(int(burst), 1)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def reserve(self, tokens=1):
+        """토큰을 예약하고 사용 가능해질 때까지 기다려야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens=1):
+        """토큰을 얻을 때까지 대기"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens=1):
+        """토큰을 얻을 때까지 이벤트 루프를 막지 않고 대기"""
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """429 응답에 맞춰 속도를 줄이고 성공 응답마다 서서히 회복하는 토큰 버킷 (AIMD)"""
+
+    def __init__(self, rate, burst=1, min_rate=None):
+        super().__init__(rate, burst)
+        self.max_rate = self.rate
+        self.min_rate = min(float(min_rate or self.rate / 10), self.rate)
+        self.throttled = 0
+
+    def on_throttled(self, retry_after=None):
+        """429 수신: 속도를 낮추고, Retry-After가 있으면 그만큼 토큰을 비움"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.rate * RATE_LIMIT_DECREASE_FACTOR, self.min_rate)
+            self.throttled += 1
+            if retry_after:
+                self._tokens = min(self._tokens, -retry_after * self.rate)
+
+    def on_success(self):
+        """정상 응답: 설정 속도까지 조금씩 회복"""
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.rate + RATE_LIMIT_RECOVERY_STEP, self.max_rate)
+
+    def stats(self):
+        return {
+            'rate': round(self.rate, 2),
+            'max_rate': self.max_rate,
+            'throttled': self.throttled
+        }
+
+
+def get_rate_limiter(name):
+    """API 계열(search / datalab / keywordstool)별 공유 토큰 버킷 반환"""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(name)
+            if limiter is None:
+                settings = RATE_LIMIT_CONFIG[name]
+                limiter = AdaptiveTokenBucket(
+                    settings['rate'],
+                    settings.get('burst', 1),
+                    settings.get('min_rate')
+                )
+                _limiters[name] = limiter
+    return limiter
+
+
+def get_rate_limiter_stats():
+    """API 계열별 현재 속도 및 429 감속 횟수"""
+    with _limiters_lock:
+        return {name: limiter.stats() for name, limiter in _limiters.items()}
@@ -0,0 +1,229 @@
+"""
+열 단위(columnar) 결과 모델 (쇼핑 검색 상품 / 파워링크 연관키워드)
+
+행마다 dict를 만드는 대신 열마다 고정 dtype의 NumPy 배열로 보관합니다.
+가격/검색량은 int32, 판매처/카테고리/경쟁정도처럼 값 종류가 적은 열은 범주 코드 + 범주 목록,
+나머지 문자열은 object 배열입니다. to_dataframe()은 배열을 복사하지 않고 DataFrame을 만듭니다.
+"""
+import numpy as np
+import pandas as pd
+
+INT32_MAX = np.iinfo(np.int32).max
+
+
+def _codes_dtype(size):
+    """범주 개수에 맞는 코드 dtype (pandas Categorical과 같은 기준이라 변환 시 복사가 없음)"""
+    if size < np.iinfo(np.int8).max:
+        return np.int8
+    if size < np.iinfo(np.int16).max:
+        return np.int16
+    return np.int32
+
+
+def _object_array(values):
+    """문자열 리스트 → object 배열 (np.array는 고정 길이 유니코드 배열을 만들기 때문에 직접 채움)"""
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def _to_int(value):
+    """가격 문자열 → 정수 (빈 값/잘못된 값은 0, int32 범위로 제한)"""
+    try:
+        return min(int(value), INT32_MAX)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _clean_title(title):
+    return title.replace('<b>', '').replace('</b>', '')
+
+
+class _CategoryEncoder:
+    """문자열 → 범주 코드 (처음 나온 순서대로 번호를 붙임)"""
+
+    __slots__ = ('index', 'categories')
+
+    def __init__(self):
+        self.index = {}
+        self.categories = []
+
+    def encode(self, value):
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.categories)
+            self.index[value] = code
+            self.categories.append(value)
+        return code
+
+
+class ColumnBatch:
+    """같은 스키마의 행들을 열 배열로 보관하는 기본 클래스
+
+    하위 클래스는 SCHEMA에 (열 이름, 종류) 목록을 정의합니다.
+    종류: 'int32' / 'float64' / 'text' (object 배열) / 'category' (코드 배열 + 범주 목록)
+    """
+
+    SCHEMA = ()
+
+    __slots__ = ('columns', 'categories')
+
+    def __init__(self, columns, categories=None):
+        self.columns = columns
+        self.categories = categories or {}
+
+    @classmethod
+    def empty(cls):
+        return cls.from_lists({name: [] for name, _ in cls.SCHEMA})
+
+    @classmethod
+    def from_lists(cls, values):
+        """열 이름별 값 리스트로 배치 생성 (category 열은 문자열 리스트)"""
+        columns = {}
+        categories = {}
+        for name, kind in cls.SCHEMA:
+            column = values[name]
+            if kind == 'category':
+                codes, uniques = pd.factorize(_object_array(column))
+                columns[name] = codes.astype(_codes_dtype(len(uniques)))
+                categories[name] = list(uniques)
+            elif kind == 'text':
+                columns[name] = _object_array(column)
+            else:
+                columns[name] = np.array(column, dtype=kind)
+        return cls(columns, categories)
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+    def column(self, name):
+        """열 값 배열 (category 열은 문자열 object 배열로 풀어서 반환)"""
+        if name in self.categories:
+            return _object_array(self.categories[name])[self.columns[name]]
+        return self.columns[name]
+
+    def take(self, indices):
+        """지정한 행만 골라낸 새 배치 (범주 목록은 공유)"""
+        indices = np.asarray(indices, dtype=np.intp)
+        return type(self)(
+            {name: array[indices] for name, array in self.columns.items()},
+            dict(self.categories)
+        )
+
+    @classmethod
+    def concat(cls, batches):
+        """여러 배치를 하나로 합침 (범주 목록을 합치고 코드를 다시 매김)"""
+        batches = [batch for batch in batches if len(batch)]
+        if not batches:
+            return cls.empty()
+        if len(batches) == 1:
+            return batches[0]
+
+        columns = {}
+        categories = {}
+        for name, kind in cls.SCHEMA:
+            if kind != 'category':
+                columns[name] = np.concatenate([batch.columns[name] for batch in batches])
+                continue
+            encoder = _CategoryEncoder()
+            remapped = []
+            for batch in batches:
+                mapping = np.array(
+                    [encoder.encode(value) for value in batch.categories[name]],
+                    dtype=np.int32
+                )
+                remapped.append(mapping[batch.columns[name]])
+            columns[name] = np.concatenate(remapped).astype(_codes_dtype(len(encoder.categories)))
+            categories[name] = encoder.categories
+        return cls(columns, categories)
+
+    def to_dataframe(self):
+        """pandas DataFrame (숫자/코드 배열은 복사하지 않음, category 열은 Categorical)"""
+        data = {}
+        for name, _ in self.SCHEMA:
+            if name in self.categories:
+                data[name] = pd.Categorical.from_codes(self.columns[name], self.categories[name])
+            else:
+                data[name] = self.columns[name]
+        return pd.DataFrame(data, copy=False)
+
+    def to_records(self):
+        """기존 API와 같은 dict 목록 (값은 파이썬 기본 타입)"""
+        names = [name for name, _ in self.SCHEMA]
+        values = [self.column(name).tolist() for name in names]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    def nbytes(self):
+        """열 배열이 차지하는 바이트 수 (문자열 객체 자체는 제외)"""
+        return sum(array.nbytes for array in self.columns.values())
+
+
+class ShoppingItemBatch(ColumnBatch):
+    """쇼핑 검색 상품 목록 (keyword / rank는 조회 키워드와 전체 순위)"""
+
+    SCHEMA = (
+        ('keyword', 'category'),
+        ('rank', 'int32'),
+        ('title', 'text'),
+        ('link', 'text'),
+        ('image', 'text'),
+        ('lprice', 'int32'),
+        ('hprice', 'int32'),
+        ('mallName', 'category'),
+        ('productId', 'text'),
+        ('productType', 'category'),
+        ('brand', 'category'),
+        ('maker', 'category'),
+        ('category1', 'category'),
+        ('category2', 'category'),
+        ('category3', 'category'),
+        ('category4', 'category'),
+    )
+
+    __slots__ = ()
+
+    @classmethod
+    def from_items(cls, items, keyword='', start=1):
+        """쇼핑 검색 API items로 배치 생성 (정제 전/후 응답 모두 가능, 원본 dict는 수정하지 않음)"""
+        return cls.from_pages(keyword, [(start, items)])
+
+    @classmethod
+    def from_pages(cls, keyword, pages):
+        """(start, items) 페이지 목록(iter_shopping_pages 결과)으로 배치 생성 (실패한 페이지는 건너뜀)"""
+        items = []
+        ranks = []
+        for start, page_items in pages:
+            if page_items:
+                items.extend(page_items)
+                ranks.extend(range(start, start + len(page_items)))
+
+        values = {
+            'keyword': [keyword] * len(items),
+            'rank': ranks,
+            'title': [_clean_title(item.get('title', '')) for item in items],
+            'lprice': [_to_int(item.get('lprice')) for item in items],
+            'hprice': [_to_int(item.get('hprice')) for item in items],
+        }
+        for name, _ in cls.SCHEMA:
+            if name not in values:
+                values[name] = [str(item.get(name, '')) for item in items]
+        return cls.from_lists(values)
+
+
+class PowerlinkKeywordBatch(ColumnBatch):
+    """파워링크 연관키워드 목록 (parse_powerlink_keywords 결과와 같은 열)"""
+
+    SCHEMA = (
+        ('keyword', 'text'),
+        ('monthly_searches', 'int32'),
+        ('pc_searches', 'int32'),
+        ('mobile_searches', 'int32'),
+        ('competition', 'category'),
+        ('avg_bid', 'int32'),
+        ('click_rate', 'float64'),
+        ('relevance_score', 'float64'),
+    )
+
+    __slots__ = ()
@@ -0,0 +1,92 @@
+"""
+파워링크 연관키워드 관련성 점수 계산 (기준 키워드 전처리 + 일괄 계산)
+"""
+import numpy as np
+
+# 경쟁정도별 점수 (10%)
+COMPETITION_SCORES = {'HIGH': 10, 'MEDIUM': 7, 'LOW': 4}
+
+
+class RelevanceScorer:
+    """기준 키워드를 한 번만 전처리해 두고 여러 키워드의 관련성 점수를 한 번에 계산
+
+    점수 공식은 calculate_relevance_score_advanced와 같습니다.
+    """
+
+    def __init__(self, base_keyword):
+        self.base_keyword = base_keyword
+        self.base_lower = base_keyword.lower()
+        self.base_words = frozenset(self.base_lower.split())
+        self.max_length = len(base_keyword) * 2
+
+    def _text_scores(self, keywords):
+        """(단어 매칭 점수 + 포함 관계 점수, 길이 패널티 여부) 배열 - np.char 문자열 연산으로 열 단위 계산"""
+        original = np.array(keywords, dtype=str)
+        lower = np.char.lower(original)
+
+        # 1. 기본 단어 매칭 점수 (40%) - 공백으로 감싼 " 단어 "가 있으면 split()한 토큰에 포함된 것과 같음
+        if ''.join(keywords).isprintable():
+            tokens = lower
+        else:
+            # 탭/줄바꿈 등 공백 외 공백 문자가 있으면 split() 기준으로 정규화
+            tokens = np.array([' '.join(keyword.split()) for keyword in lower.tolist()], dtype=str)
+        padded = np.char.add(np.char.add(' ', tokens), ' ')
+        if self.base_words:
+            common = np.zeros(len(original), dtype=np.float64)
+            for word in self.base_words:
+                common += np.char.find(padded, f' {word} ') >= 0
+            word_match_score = common / len(self.base_words) * 40
+        else:
+            word_match_score = np.zeros(len(original), dtype=np.float64)
+
+        # 2. 포함 관계 점수 (30%)
+        contains_word = np.zeros(len(original), dtype=bool)
+        for word in self.base_words:
+            contains_word |= np.char.find(lower, word) >= 0
+        inclusion_score = np.where(
+            np.char.find(lower, self.base_lower) >= 0, 30,
+            np.where(contains_word, 15, 0)
+        )
+
+        return word_match_score + inclusion_score, np.char.str_len(original) > self.max_length
+
+    def score(self, keyword, search_volume, competition):
+        """키워드 하나의 관련성 점수"""
+        return self.score_many([keyword], [search_volume], [competition])[0]
+
+    def score_many(self, keywords, search_volumes, competitions):
+        """키워드 목록의 관련성 점수를 한 번에 계산 (float 리스트)"""
+        if len(keywords) == 0:
+            return []
+        keywords = list(keywords)
+        text, penalized = self._text_scores(keywords)
+
+        # 3. 검색량 기반 점수 (20%)
+        volumes = np.asarray(search_volumes, dtype=np.float64)
+        volume_score = np.where(volumes > 0, np.minimum(volumes / 50000 * 20, 20), 0)
+
+        # 4. 경쟁정도 기반 점수 (10%)
+        comp_score = np.fromiter(
+            (COMPETITION_SCORES.get(competition, 4) for competition in competitions),
+            dtype=np.float64, count=len(keywords)
+        )
+
+        total = text + volume_score + comp_score
+        # 키워드 길이 패널티 (너무 긴 키워드는 관련성 감소)
+        total = np.where(penalized, total * 0.8, total)
+
+        # 반올림은 기존 round()와 결과를 맞추기 위해 파이썬 round 사용
+        return [min(round(value, 1), 100) for value in total.tolist()]
+
+
+def top_k_indices(sort_keys, k):
+    """sort_keys 내림차순 상위 k개 인덱스 (동점은 입력 순서 유지, 전체 정렬 없이 선택)"""
+    keys = np.asarray(sort_keys, dtype=np.float64)
+    if len(keys) <= k:
+        candidates = np.arange(len(keys))
+    else:
+        # k번째로 큰 값 이상인 후보만 추린 뒤 그 안에서만 안정 정렬
+        threshold = np.partition(keys, len(keys) - k)[len(keys) - k]
+        candidates = np.flatnonzero(keys >= threshold)
+    order = np.argsort(-keys[candidates], kind='stable')
+    return candidates[order][:k].tolist()
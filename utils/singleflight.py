@@ -0,0 +1,86 @@
+"""
+동일 요청 합치기 (single-flight)
+
+같은 (엔드포인트, 정규화된 인자) 호출이 동시에 여러 번 들어오면 처음 호출만 실제로 실행하고
+나머지는 그 결과를 기다렸다가 복사본을 받습니다. 진행 중인 호출은 concurrent.futures.Future로
+공유하므로 스레드(동기)와 이벤트 루프(비동기) 호출이 서로 합쳐집니다.
+"""
+import asyncio
+import copy
+import threading
+from concurrent.futures import Future
+
+_calls = {}
+_calls_lock = threading.Lock()
+
+_stats = {}
+
+
+def _join(endpoint, key):
+    """(Future, 처음 호출 여부) - 호출 수/합쳐진 수 집계"""
+    with _calls_lock:
+        stats = _stats.setdefault(endpoint, {'calls': 0, 'coalesced': 0})
+        stats['calls'] += 1
+        future = _calls.get((endpoint, key))
+        if future is not None:
+            stats['coalesced'] += 1
+            return future, False
+        future = Future()
+        _calls[(endpoint, key)] = future
+        return future, True
+
+
+def _finish(endpoint, key, future, value=None, error=None):
+    with _calls_lock:
+        _calls.pop((endpoint, key), None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        # 기다리던 호출들이 받을 값은 처음 호출자가 결과를 수정해도 영향받지 않도록 따로 보관
+        future.set_result(copy.deepcopy(value))
+
+
+def single_flight(endpoint, key, func):
+    """진행 중인 같은 호출이 있으면 그 결과를, 없으면 func() 결과를 반환"""
+    future, leader = _join(endpoint, key)
+    if not leader:
+        return copy.deepcopy(future.result())
+    try:
+        value = func()
+    except BaseException as e:
+        # KeyboardInterrupt / Streamlit 재실행 예외에도 기다리는 호출이 멈추지 않도록 항상 정리
+        _finish(endpoint, key, future, error=e)
+        raise
+    _finish(endpoint, key, future, value)
+    return value
+
+
+async def single_flight_async(endpoint, key, coro_func):
+    """single_flight의 비동기 버전 (기다리는 동안 이벤트 루프를 막지 않음)"""
+    future, leader = _join(endpoint, key)
+    if not leader:
+        return copy.deepcopy(await asyncio.wrap_future(future))
+    try:
+        value = await coro_func()
+    except BaseException as e:
+        _finish(endpoint, key, future, error=e)
+        raise
+    _finish(endpoint, key, future, value)
+    return value
+
+
+def get_singleflight_stats():
+    """엔드포인트별 호출 수 / 합쳐진 호출 수 / 진행 중 호출 수"""
+    with _calls_lock:
+        in_flight = {}
+        for endpoint, _ in _calls:
+            in_flight[endpoint] = in_flight.get(endpoint, 0) + 1
+        return {
+            endpoint: dict(stats, in_flight=in_flight.get(endpoint, 0))
+            for endpoint, stats in _stats.items()
+        }
+
+
+def reset_singleflight_stats():
+    with _calls_lock:
+        _stats.clear()
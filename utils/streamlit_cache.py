@@ -0,0 +1,178 @@
+"""
+Streamlit 캐시 연동 (프로세스 공유 자원 / 쿼리별 결과 DataFrame / 세션 결과 저장소)
+
+위젯만 바뀐 재실행이나 탭 전환, CSV 다운로드에서는 네트워크 요청과 DataFrame 변환을 다시 하지 않도록
+페이지는 API 함수를 직접 부르지 말고 이 모듈의 load_* 함수를 사용하세요.
+동작과 유효 시간은 config.py의 STREAMLIT_CACHE_CONFIG에서 설정합니다.
+"""
+import functools
+from collections import OrderedDict
+
+import pandas as pd
+import streamlit as st
+
+from config import STREAMLIT_CACHE_CONFIG
+from utils import http_client
+from utils.datalab_series import get_series_store, get_datalab_series
+from utils.naver_api import (
+    get_related_keywords_advanced,
+    get_powerlink_keyword_batch,
+    get_keyword_competition_data_batch,
+    fetch_shopping_batch,
+)
+from utils.rank_search import search_product_ranks
+from utils.records import ShoppingItemBatch
+
+_SESSION_KEY = '_naver_api_results'
+
+
+class _NoResult(Exception):
+    """조회 실패 (st.cache_data는 예외가 난 호출을 저장하지 않음)"""
+
+
+@st.cache_resource(show_spinner=False)
+def get_api_resources():
+    """프로세스당 한 번 만드는 API 자원 (keep-alive HTTP 세션, DataLab 시계열 저장소)"""
+    return {
+        'session': http_client.get_session(),
+        'series_store': get_series_store()
+    }
+
+
+def _data_cache(name):
+    """쿼리 인자(해시 가능한 값)를 키로 결과 DataFrame을 저장하는 st.cache_data 데코레이터
+
+    실패(None) 결과는 저장하지 않고 None을 반환합니다.
+    STREAMLIT_CACHE_CONFIG['enabled']가 False면 매번 직접 호출합니다.
+    """
+    def decorator(func):
+        cached = st.cache_data(
+            ttl=STREAMLIT_CACHE_CONFIG['ttl'][name],
+            max_entries=STREAMLIT_CACHE_CONFIG['max_entries'],
+            show_spinner=False
+        )(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                if STREAMLIT_CACHE_CONFIG['enabled']:
+                    return cached(*args, **kwargs)
+                return func(*args, **kwargs)
+            except _NoResult:
+                return None
+
+        wrapper.clear = cached.clear
+        return wrapper
+    return decorator
+
+
+@_data_cache('shopping_ranking')
+def load_shopping_ranks(keywords, mall_name, max_pages, sort="sim"):
+    """키워드별 판매처 최고 순위 DataFrame (keywords는 튜플)"""
+    results = search_product_ranks(list(keywords), mall_name, max_pages=max_pages, sort=sort)
+    rows = []
+    for keyword in keywords:
+        match = results.get(keyword) or {}
+        rows.append({
+            'keyword': keyword,
+            'rank': match.get('rank'),
+            'page': match.get('page'),
+            'title': match.get('title'),
+            'lprice': match.get('lprice'),
+            'mallName': match.get('mallName'),
+            'link': match.get('link')
+        })
+    return pd.DataFrame(rows)
+
+
+@_data_cache('shopping_ranking')
+def load_shopping_items(keywords, max_pages, sort="sim"):
+    """키워드별 쇼핑 검색 상품 DataFrame (keywords는 튜플, keyword/mallName 등은 범주형 열)"""
+    batches = [fetch_shopping_batch(keyword, max_pages=max_pages, sort=sort) for keyword in keywords]
+    batch = ShoppingItemBatch.concat(batches)
+    if not len(batch):
+        raise _NoResult(keywords)
+    return batch.to_dataframe()
+
+
+@_data_cache('related_keywords')
+def load_related_keywords(keyword):
+    """상품명 기반 연관 키워드 DataFrame"""
+    keywords = get_related_keywords_advanced(keyword)
+    if not keywords:
+        raise _NoResult(keyword)
+    return pd.DataFrame({'rank': range(1, len(keywords) + 1), 'keyword': keywords})
+
+
+@_data_cache('related_keywords')
+def load_powerlink_keywords(keyword):
+    """파워링크 연관키워드 DataFrame"""
+    try:
+        batch = get_powerlink_keyword_batch(keyword)
+    except http_client.NaverAPIError as e:
+        print(f"파워링크 연관키워드 조회 오류: {e}")
+        raise _NoResult(keyword) from e
+    return batch.to_dataframe()
+
+
+@_data_cache('keyword_analysis')
+def load_keyword_analysis(keywords):
+    """키워드별 검색량/경쟁정도 DataFrame (keywords는 튜플, 조회 실패 키워드는 제외)"""
+    results = get_keyword_competition_data_batch(list(keywords))
+    rows = [data for data in results.values() if data]
+    if not rows:
+        raise _NoResult(keywords)
+    return pd.DataFrame(rows)
+
+
+@_data_cache('monthly_search')
+def load_monthly_trends(keywords, start_date, end_date, time_unit="month", device="", ages=(), gender=""):
+    """DataLab 트렌드 DataFrame (period, keyword, ratio) - 저장된 시계열을 재사용"""
+    df = get_datalab_series(
+        list(keywords), start_date, end_date, time_unit, device, list(ages), gender,
+        store=get_api_resources()['series_store']
+    )
+    if df.empty:
+        raise _NoResult(keywords)
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    """CSV 다운로드용 바이트 (엑셀 한글 호환 utf-8-sig)"""
+    return df.to_csv(index=False).encode('utf-8-sig')
+
+
+def _session_results():
+    results = st.session_state.get(_SESSION_KEY)
+    if results is None:
+        results = OrderedDict()
+        st.session_state[_SESSION_KEY] = results
+    return results
+
+
+def get_session_result(page, query=None):
+    """세션에 저장된 페이지 결과 (query를 주면 같은 쿼리의 결과만)"""
+    entry = _session_results().get(page)
+    if entry is None or (query is not None and entry[0] != query):
+        return None
+    return entry[1]
+
+
+def set_session_result(page, query, value):
+    """페이지의 마지막 조회 결과 저장 (STREAMLIT_CACHE_CONFIG['session_results']개 페이지까지)"""
+    results = _session_results()
+    results[page] = (query, value)
+    results.move_to_end(page)
+    while len(results) > STREAMLIT_CACHE_CONFIG['session_results']:
+        results.popitem(last=False)
+
+
+def session_cached(page, query, load):
+    """같은 쿼리면 세션 결과를 그대로 쓰고, 아니면 load()를 호출해 저장"""
+    value = get_session_result(page, query)
+    if value is None:
+        value = load()
+        if value is not None:
+            set_session_result(page, query, value)
+    return value